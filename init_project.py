@@ -9,24 +9,95 @@ Autor: Sistema de Generación Automática
 Fecha: 2024-12-19
 """
 
-import os
 import sys
 import shutil
 import subprocess
-import argparse
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, NoReturn, Optional, Iterator, Tuple, Union
 import json
+import re
+import itertools
 from string import Template
+from types import SimpleNamespace
 import concurrent.futures
-from functools import lru_cache
+from functools import lru_cache, partial
 
 # Importar sistemas de validación y configuración
 sys.path.append(str(Path(__file__).parent / "src"))
 from validator import validate_project_data, print_validation_results, ValidationError
-from config_loader import load_project_config, create_config_template
+from config_loader import (
+    build_project_data, load_project_config, create_config_template, get_config_template
+)
+
+# Tipos de proyecto en el orden del menú interactivo (opción N -> índice N-1)
+_PROJECT_TYPES = (
+    "Python Library", "Python CLI Tool", "Python Web App (Flask)",
+    "Python Web App (Django)", "Python Web App (FastAPI)",
+    "Python Data Science", "Python ML/AI", "C++ Project",
+    "Node.js Project", "TD_MCP Project", "Otro"
+)
+_PROJECT_TYPE_BY_CHOICE = {str(i): ptype for i, ptype in enumerate(_PROJECT_TYPES, 1)}
+
+# Patrones de placeholders sin procesar ({{VARIABLE}} y $VARIABLE)
+_RE_CURLY = re.compile(r'\{\{([^}]+)\}\}')
+_RE_DOLLAR = re.compile(r'\$([A-Z_]+)')
+
+# Plantilla de CONTEXTO.md (compilada una sola vez al importar el módulo)
+_CONTEXTO_TEMPLATE = Template("""# CONTEXTO - ${nombre}
+
+## Información del Proyecto
+
+- **Nombre**: ${nombre}
+- **Descripción**: ${descripcion}
+- **Tipo**: ${tipo}
+- **Autor**: ${autor}
+- **Fecha de Creación**: ${fecha}
+
+## Estructura Generada
+
+```
+${nombre}/
+├── README.md                    # Documentación principal
+├── BITACORA.md                 # Log de desarrollo
+├── roadmap_v1.md               # Plan de desarrollo
+├── requirements.txt            # Dependencias
+├── METODOLOGIA_DESARROLLO.md   # Metodología establecida
+├── CONTEXTO.md                 # Este archivo
+├── src/                        # Código fuente
+│   └── ${modulo}.py
+├── tests/                      # Pruebas
+│   └── README.md
+├── docs/                       # Documentación
+│   └── TUTORIAL.md
+├── examples/                   # Ejemplos
+└── logs/                       # Logs
+```
+
+## Próximos Pasos
+
+1. Revisar y ajustar archivos generados
+2. Implementar funcionalidades core
+3. Crear tests unitarios
+4. Seguir metodología en METODOLOGIA_DESARROLLO.md
+
+## Comandos Útiles
+
+```bash
+# Instalar dependencias
+pip install -r requirements.txt
+
+# Ejecutar tests
+pytest
+
+# Actualizar bitácora
+echo "### $(date +%Y-%m-%d)" >> BITACORA.md
+```
+
+---
+**Generado automáticamente**: ${fecha}
+""")
 
 
 class ProjectGenerator:
@@ -356,36 +427,14 @@ class ProjectGenerator:
     def _select_project_type(self) -> str:
         """Seleccionar tipo de proyecto."""
         print("\n🔧 Tipo de proyecto:")
-        print("1. Python Library")
-        print("2. Python CLI Tool")
-        print("3. Python Web App (Flask)")
-        print("4. Python Web App (Django)")
-        print("5. Python Web App (FastAPI)")
-        print("6. Python Data Science")
-        print("7. Python ML/AI")
-        print("8. C++ Project")
-        print("9. Node.js Project")
-        print("10. TD_MCP Project")
-        print("11. Otro")
+        for choice, project_type in _PROJECT_TYPE_BY_CHOICE.items():
+            print(f"{choice}. {project_type}")
         
         while True:
-            choice = input("Selecciona (1-11): ").strip()
-            types = {
-                "1": "Python Library",
-                "2": "Python CLI Tool", 
-                "3": "Python Web App (Flask)",
-                "4": "Python Web App (Django)",
-                "5": "Python Web App (FastAPI)",
-                "6": "Python Data Science",
-                "7": "Python ML/AI",
-                "8": "C++ Project",
-                "9": "Node.js Project",
-                "10": "TD_MCP Project",
-                "11": "Otro"
-            }
-            if choice in types:
-                self.logger.info(f"Tipo de proyecto seleccionado: {types[choice]}")
-                return types[choice]
+            choice = input(f"Selecciona (1-{len(_PROJECT_TYPES)}): ").strip()
+            if choice in _PROJECT_TYPE_BY_CHOICE:
+                self.logger.info(f"Tipo de proyecto seleccionado: {_PROJECT_TYPE_BY_CHOICE[choice]}")
+                return _PROJECT_TYPE_BY_CHOICE[choice]
             print("❌ Opción inválida. Intenta de nuevo.")
     
     def _get_dev_dependencies_for_type(self, project_type: str) -> str:
@@ -585,7 +634,7 @@ class ProjectGenerator:
             template_paths: Lista de rutas de plantillas
             project_path: Ruta del proyecto
         """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(template_paths))) as executor:
             # Crear tareas para procesamiento paralelo
             futures = [
                 executor.submit(self._process_template, template_path, project_path)
@@ -637,9 +686,12 @@ class ProjectGenerator:
                     content = content.replace(placeholder, value)
                     self.logger.debug(f"Reemplazado {placeholder} en {template_path.name}")
             
-            # Verificar placeholders no procesados
-            unprocessed_placeholders = self._find_unprocessed_placeholders(content)
-            if unprocessed_placeholders:
+            # Verificar placeholders no procesados: basta el primero para saber
+            # si hay alguno; la lista completa solo se construye para el aviso
+            placeholders = self._find_unprocessed_placeholders(content)
+            first_placeholder = next(placeholders, None)
+            if first_placeholder is not None:
+                unprocessed_placeholders = [first_placeholder, *placeholders]
                 self.logger.warning(f"Placeholders no procesados en {template_path.name}: {unprocessed_placeholders}")
                 # Intentar reemplazar con valores por defecto
                 content = self._replace_with_defaults(content, unprocessed_placeholders)
@@ -663,7 +715,7 @@ class ProjectGenerator:
             print(f"  ❌ Error procesando {template_path.name}: {e}")
             self.logger.error(f"Error procesando plantilla {template_path.name}: {e}")
     
-    def _find_unprocessed_placeholders(self, content: str) -> list:
+    def _find_unprocessed_placeholders(self, content: str) -> Iterator[str]:
         """
         Encontrar placeholders no procesados en el contenido.
         
@@ -671,17 +723,10 @@ class ProjectGenerator:
             content: Contenido a verificar
             
         Returns:
-            list: Lista de placeholders no procesados
+            Iterator[str]: Nombres de placeholders no procesados ({{VARIABLE}} y $VARIABLE)
         """
-        import re
-        
-        # Buscar formato {{VARIABLE}}
-        curly_placeholders = re.findall(r'\{\{([^}]+)\}\}', content)
-        
-        # Buscar formato $VARIABLE (que no hayan sido procesados)
-        dollar_placeholders = re.findall(r'\$([A-Z_]+)', content)
-        
-        return curly_placeholders + dollar_placeholders
+        matches = itertools.chain(_RE_CURLY.finditer(content), _RE_DOLLAR.finditer(content))
+        return (match.group(1) for match in matches)
     
     def _replace_with_defaults(self, content: str, unprocessed_placeholders: list) -> str:
         """
@@ -694,6 +739,9 @@ class ProjectGenerator:
         Returns:
             str: Contenido con placeholders reemplazados por defectos
         """
+        if not unprocessed_placeholders:
+            return content
+        
         # Valores por defecto para placeholders comunes
         default_values = {
             # Variables de tipos
@@ -804,8 +852,8 @@ class ProjectGenerator:
             'RETORNO_METODO_SECUNDARIO': 'true',
         }
         
-        # Reemplazar placeholders con valores por defecto
-        for placeholder in unprocessed_placeholders:
+        # Reemplazar placeholders con valores por defecto (una vez por nombre)
+        for placeholder in dict.fromkeys(unprocessed_placeholders):
             if placeholder in default_values:
                 # Reemplazar formato {{VARIABLE}}
                 content = content.replace(f"{{{{{placeholder}}}}}", default_values[placeholder])
@@ -817,6 +865,20 @@ class ProjectGenerator:
         
         return content
     
+    @lru_cache(maxsize=32)
+    def _get_project_dirs(self, project_path_str: str) -> Tuple[Path, Path, Path]:
+        """
+        Obtener rutas base del proyecto (con cache).
+        
+        Args:
+            project_path_str: Ruta del proyecto como string (para cache)
+            
+        Returns:
+            tuple: (raíz del proyecto, directorio src/, directorio docs/)
+        """
+        project_path = Path(project_path_str)
+        return project_path, project_path / "src", project_path / "docs"
+    
     @lru_cache(maxsize=128)
     def _get_destination_path(self, template_name: str, project_path_str: str, project_type: str, modulo_principal: str) -> Path:
         """
@@ -831,7 +893,7 @@ class ProjectGenerator:
         Returns:
             Path: Ruta de destino del archivo
         """
-        project_path = Path(project_path_str)
+        project_path, src_dir, docs_dir = self._get_project_dirs(project_path_str)
         
         # Mapeo de plantillas a archivos de destino por tipo de proyecto
         if project_type == "C++ Project":
@@ -840,16 +902,16 @@ class ProjectGenerator:
             elif template_name == "CMakeLists.txt.tpl":
                 return project_path / "CMakeLists.txt"
             elif template_name == "modulo_principal_cpp.cpp.tpl":
-                return project_path / "src" / f"{modulo_principal}.cpp"
+                return src_dir / f"{modulo_principal}.cpp"
             elif template_name == "modulo_principal_cpp.hpp.tpl":
-                return project_path / "src" / f"{modulo_principal}.hpp"
+                return src_dir / f"{modulo_principal}.hpp"
             elif template_name == "TUTORIAL.md.tpl":
-                return project_path / "docs" / "TUTORIAL.md"
+                return docs_dir / "TUTORIAL.md"
             elif template_name.endswith(".tpl"):
                 dest_name = template_name[:-4]
                 # Colocar archivos de documentación en docs/
                 if dest_name.endswith('.md') and dest_name not in ['README.md', 'CONTEXTO.md']:
-                    return project_path / "docs" / dest_name
+                    return docs_dir / dest_name
                 return project_path / dest_name
             else:
                 return project_path / template_name
@@ -860,14 +922,14 @@ class ProjectGenerator:
             elif template_name == "package.json.tpl":
                 return project_path / "package.json"
             elif template_name == "modulo_principal_nodejs.js.tpl":
-                return project_path / "src" / f"{modulo_principal}.js"
+                return src_dir / f"{modulo_principal}.js"
             elif template_name == "TUTORIAL.md.tpl":
-                return project_path / "docs" / "TUTORIAL.md"
+                return docs_dir / "TUTORIAL.md"
             elif template_name.endswith(".tpl"):
                 dest_name = template_name[:-4]
                 # Colocar archivos de documentación en docs/
                 if dest_name.endswith('.md') and dest_name not in ['README.md', 'CONTEXTO.md']:
-                    return project_path / "docs" / dest_name
+                    return docs_dir / dest_name
                 return project_path / dest_name
             else:
                 return project_path / template_name
@@ -878,32 +940,32 @@ class ProjectGenerator:
             elif template_name == "requirements_td_mcp.txt.tpl":
                 return project_path / "requirements.txt"
             elif template_name == "modulo_principal_td_mcp.py.tpl":
-                return project_path / "src" / f"{modulo_principal}.py"
+                return src_dir / f"{modulo_principal}.py"
             elif template_name == "config_td_mcp.py.tpl":
                 return project_path / "config.py"
             elif template_name == "config_td_mcp.json.tpl":
                 return project_path / "config.json"
             elif template_name == "TUTORIAL.md.tpl":
-                return project_path / "docs" / "TUTORIAL.md"
+                return docs_dir / "TUTORIAL.md"
             elif template_name.endswith(".tpl"):
                 dest_name = template_name[:-4]
                 # Colocar archivos de documentación en docs/
                 if dest_name.endswith('.md') and dest_name not in ['README.md', 'CONTEXTO.md']:
-                    return project_path / "docs" / dest_name
+                    return docs_dir / dest_name
                 return project_path / dest_name
             else:
                 return project_path / template_name
         
         else:  # Proyectos Python
             if template_name == "modulo_principal.py.tpl":
-                return project_path / "src" / f"{modulo_principal}.py"
+                return src_dir / f"{modulo_principal}.py"
             elif template_name == "TUTORIAL.md.tpl":
-                return project_path / "docs" / "TUTORIAL.md"
+                return docs_dir / "TUTORIAL.md"
             elif template_name.endswith(".tpl"):
                 dest_name = template_name[:-4]
                 # Colocar archivos de documentación en docs/
                 if dest_name.endswith('.md') and dest_name not in ['README.md', 'CONTEXTO.md']:
-                    return project_path / "docs" / dest_name
+                    return docs_dir / dest_name
                 return project_path / dest_name
             else:
                 return project_path / template_name
@@ -918,27 +980,28 @@ class ProjectGenerator:
         print("🔧 Inicializando repositorio Git...")
         
         try:
-            # Cambiar al directorio del proyecto
-            original_cwd = os.getcwd()
-            os.chdir(project_path)
+            # Git se ejecuta con cwd=project_path en lugar de os.chdir: el
+            # directorio del proceso no cambia aunque un comando falle, lo que
+            # importa al generar varios proyectos seguidos (``pre-cursor batch``)
+            run_git = partial(
+                subprocess.run, check=True, cwd=project_path,
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
             
             # Inicializar Git
-            subprocess.run(["git", "init"], check=True, capture_output=True)
+            run_git(["git", "init"])
             print("  ✅ git init")
             
             # Añadir archivos
-            subprocess.run(["git", "add", "."], check=True, capture_output=True)
+            run_git(["git", "add", "."])
             print("  ✅ git add .")
             
             # Commit inicial
             project_name = self.project_data.get('NOMBRE_PROYECTO', 'proyecto')
             commit_message = f"WIP: Proyecto {project_name} inicializado"
-            subprocess.run(["git", "commit", "-m", commit_message], check=True, capture_output=True)
+            run_git(["git", "commit", "-m", commit_message])
             print("  ✅ Commit inicial")
             
-            # Restaurar directorio original
-            os.chdir(original_cwd)
-            
         except subprocess.CalledProcessError as e:
             print(f"  ⚠️ Error con Git: {e}")
         except Exception as e:
@@ -956,63 +1019,17 @@ class ProjectGenerator:
         # Obtener nombre del módulo principal
         module_name = self.project_data.get('MODULO_PRINCIPAL', 'main')
         
-        context_content = f"""# CONTEXTO - {self.project_data['NOMBRE_PROYECTO']}
-
-## Información del Proyecto
-
-- **Nombre**: {self.project_data['NOMBRE_PROYECTO']}
-- **Descripción**: {self.project_data['DESCRIPCION_PROYECTO']}
-- **Tipo**: {self.project_data['TIPO_PROYECTO']}
-- **Autor**: {self.project_data['AUTOR']}
-- **Fecha de Creación**: {self.project_data['FECHA_CREACION']}
-
-## Estructura Generada
-
-```
-{self.project_data['NOMBRE_PROYECTO']}/
-├── README.md                    # Documentación principal
-├── BITACORA.md                 # Log de desarrollo
-├── roadmap_v1.md               # Plan de desarrollo
-├── requirements.txt            # Dependencias
-├── METODOLOGIA_DESARROLLO.md   # Metodología establecida
-├── CONTEXTO.md                 # Este archivo
-├── src/                        # Código fuente
-│   └── {module_name}.py
-├── tests/                      # Pruebas
-│   └── README.md
-├── docs/                       # Documentación
-│   └── TUTORIAL.md
-├── examples/                   # Ejemplos
-└── logs/                       # Logs
-```
-
-## Próximos Pasos
-
-1. Revisar y ajustar archivos generados
-2. Implementar funcionalidades core
-3. Crear tests unitarios
-4. Seguir metodología en METODOLOGIA_DESARROLLO.md
-
-## Comandos Útiles
-
-```bash
-# Instalar dependencias
-pip install -r requirements.txt
-
-# Ejecutar tests
-pytest
-
-# Actualizar bitácora
-echo "### $(date +%Y-%m-%d)" >> BITACORA.md
-```
-
----
-**Generado automáticamente**: {self.project_data['FECHA_CREACION']}
-"""
+        context_content = _CONTEXTO_TEMPLATE.safe_substitute(
+            nombre=self.project_data['NOMBRE_PROYECTO'],
+            descripcion=self.project_data['DESCRIPCION_PROYECTO'],
+            tipo=self.project_data['TIPO_PROYECTO'],
+            autor=self.project_data['AUTOR'],
+            fecha=self.project_data['FECHA_CREACION'],
+            modulo=module_name,
+        )
         
         context_path = project_path / "CONTEXTO.md"
-        with open(context_path, 'w', encoding='utf-8') as f:
-            f.write(context_content)
+        context_path.write_text(context_content, encoding='utf-8')
         
         print("  ✅ CONTEXTO.md")
     
@@ -1056,24 +1073,8 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
             
             print("✅ Validación exitosa - Todos los parámetros son válidos")
             
-            # Crear directorio del proyecto
-            self.logger.info("Creando directorio del proyecto")
-            project_path.mkdir(parents=True, exist_ok=True)
-            
-            # Crear estructura
-            self.create_project_structure(project_path)
-            
-            # Copiar archivos estáticos
-            self.copy_static_files(project_path)
-            
-            # Procesar plantillas
-            self.process_templates(project_path)
-            
-            # Crear archivo de contexto
-            self.create_context_file(project_path)
-            
-            # Inicializar Git
-            self.initialize_git(project_path)
+            # Crear proyecto (estructura, archivos, plantillas, contexto y Git)
+            self._run_pipeline(project_path)
             
             # Integrar supervisión de Cursor (opcional)
             self._integrate_cursor_supervision(project_path, project_name)
@@ -1116,6 +1117,38 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
             print("💡 Sugerencia: Revisa los logs en 'project_generator.log' para más detalles")
             sys.exit(1)
     
+    def _run_pipeline(self, project_path: Path) -> None:
+        """
+        Ejecutar los pasos comunes de generación sobre un proyecto ya validado.
+        
+        La copia de archivos estáticos y el procesamiento de plantillas son
+        independientes y limitados por I/O, por lo que se ejecutan en paralelo.
+        
+        Args:
+            project_path: Ruta del proyecto
+        """
+        # Crear directorio del proyecto
+        self.logger.info("Creando directorio del proyecto")
+        project_path.mkdir(parents=True, exist_ok=True)
+        
+        # Crear estructura
+        self.create_project_structure(project_path)
+        
+        # Copiar archivos estáticos y procesar plantillas en paralelo
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.copy_static_files, project_path),
+                executor.submit(self.process_templates, project_path),
+            ]
+            for future in futures:
+                future.result()
+        
+        # Crear archivo de contexto
+        self.create_context_file(project_path)
+        
+        # Inicializar Git
+        self.initialize_git(project_path)
+    
     def _integrate_cursor_supervision(self, project_path: Path, project_name: str) -> None:
         """
         Integrar supervisión de Cursor si está disponible.
@@ -1154,19 +1187,56 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
             print(f"⚠️  Error en integración de Cursor: {e}")
             print("   (El proyecto se generó correctamente sin supervisión)")
     
-    def generate_project_from_config(self, config_path: Path, project_path: Optional[Path] = None) -> None:
+    def generate_project_from_config(
+        self, config_path: Union[Path, Dict[str, Any]], project_path: Optional[Path] = None
+    ) -> None:
         """
         Generar proyecto desde archivo de configuración.
         
         Args:
-            config_path: Ruta al archivo de configuración
+            config_path: Ruta al archivo de configuración, o la configuración
+                ya cargada (se delega en ``generate_project_from_dict``)
             project_path: Ruta donde crear el proyecto (opcional)
         """
-        try:
+        if isinstance(config_path, dict):
+            self.generate_project_from_dict(config_path, project_path)
+            return
+        
+        def load() -> Dict[str, str]:
             self.logger.info(f"Cargando configuración desde: {config_path}")
-            
+            return load_project_config(config_path)
+        
+        self._generate_from_loaded_config(load, str(config_path), project_path)
+    
+    def generate_project_from_dict(self, config_data: Dict[str, Any], project_path: Optional[Path] = None) -> None:
+        """
+        Generar proyecto desde una configuración en memoria.
+        
+        Evita escribir la configuración en un archivo temporal solo para que
+        ``generate_project_from_config`` la vuelva a leer.
+        
+        Args:
+            config_data: Configuración (mismas claves que el archivo JSON/YAML)
+            project_path: Ruta donde crear el proyecto (opcional)
+        """
+        self._generate_from_loaded_config(
+            lambda: build_project_data(config_data), "(en memoria)", project_path
+        )
+    
+    def _generate_from_loaded_config(
+        self, load: Callable[[], Dict[str, str]], source: str, project_path: Optional[Path]
+    ) -> None:
+        """
+        Cargar la configuración, validarla y generar el proyecto.
+        
+        Args:
+            load: Función que devuelve los datos del proyecto ya convertidos
+            source: Origen de la configuración (para mensajes)
+            project_path: Ruta donde crear el proyecto (opcional)
+        """
+        try:
             # Cargar configuración
-            self.project_data = load_project_config(config_path)
+            self.project_data = load()
             project_name = self.project_data["NOMBRE_PROYECTO"]
             
             if project_path is None:
@@ -1177,7 +1247,7 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
             
             print(f"🚀 Generando proyecto desde configuración: {project_name}")
             print(f"📂 Ubicación: {project_path}")
-            print(f"📋 Configuración: {config_path}")
+            print(f"📋 Configuración: {source}")
             print()
             
             # Validación completa antes de proceder
@@ -1198,24 +1268,8 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
             
             print("✅ Validación exitosa - Todos los parámetros son válidos")
             
-            # Crear directorio del proyecto
-            self.logger.info("Creando directorio del proyecto")
-            project_path.mkdir(parents=True, exist_ok=True)
-            
-            # Crear estructura
-            self.create_project_structure(project_path)
-            
-            # Copiar archivos estáticos
-            self.copy_static_files(project_path)
-            
-            # Procesar plantillas
-            self.process_templates(project_path)
-            
-            # Crear archivo de contexto
-            self.create_context_file(project_path)
-            
-            # Inicializar Git
-            self.initialize_git(project_path)
+            # Crear proyecto (estructura, archivos, plantillas, contexto y Git)
+            self._run_pipeline(project_path)
             
             self.logger.info("Proyecto generado exitosamente desde configuración")
             
@@ -1236,7 +1290,7 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
             sys.exit(1)
         except FileNotFoundError as e:
             self.logger.error(f"Archivo de configuración no encontrado: {e}")
-            print(f"\n❌ Error: Archivo de configuración no encontrado: {config_path}")
+            print(f"\n❌ Error: Archivo de configuración no encontrado: {source}")
             sys.exit(1)
         except ValueError as e:
             self.logger.error(f"Error en configuración: {e}")
@@ -1248,6 +1302,18 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
             print("💡 Sugerencia: Revisa los logs en 'project_generator.log' para más detalles")
             sys.exit(1)
 
+    def _create_config_template(self, project_type: str) -> Dict[str, Any]:
+        """
+        Obtener la plantilla de configuración para un tipo de proyecto.
+        
+        Args:
+            project_type: Tipo de proyecto para la plantilla
+            
+        Returns:
+            Dict con la configuración de ejemplo (la que escribe ``--template``)
+        """
+        return get_config_template(project_type)
+
 
     def _get_project_type_description(self, project_type: str) -> str:
         """Obtener descripción del tipo de proyecto para la guía de Cursor."""
@@ -1369,12 +1435,22 @@ echo "### $(date +%Y-%m-%d)" >> BITACORA.md
         return use_cases.get(project_type, "Explorar posibilidades creativas")
 
 
-def main():
-    """Función principal del script."""
-    parser = argparse.ArgumentParser(
-        description="Generador de Proyectos Optimizado para Agentes de IA",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_USAGE = """\
+uso: init_project.py [-h] [-v] [-c CONFIG] [-t TIPO] [-o SALIDA] [project_name] [project_path]
+
+Generador de Proyectos Optimizado para Agentes de IA
+
+argumentos posicionales:
+  project_name                  Nombre del proyecto a crear
+  project_path                  Ruta donde crear el proyecto
+
+opciones:
+  -h, --help                    Mostrar esta ayuda y salir
+  -v, --verbose                 Activar modo verbose con logging detallado
+  -c, --config CONFIG           Archivo de configuración JSON/YAML
+  -t, --create-template TIPO    Crear plantilla de configuración (especificar tipo de proyecto)
+  -o, --template-output SALIDA  Ruta de salida para plantilla de configuración (JSON por defecto)
+
 Ejemplos de uso:
   python init_project.py                                    # Modo interactivo
   python init_project.py MiProyecto                         # Crear proyecto específico
@@ -1383,46 +1459,116 @@ Ejemplos de uso:
   python init_project.py --config config.json               # Usar archivo de configuración
   python init_project.py --create-template "Python Library"  # Crear plantilla de configuración
   python init_project.py -t "FastAPI" -o mi_config.yaml    # Crear plantilla YAML específica
-        """
-    )
+"""
+
+# Opciones que reciben valor: alias -> nombre del atributo
+_VALUE_OPTIONS = {
+    "-c": "config", "--config": "config",
+    "-t": "create_template", "--create-template": "create_template",
+    "-o": "template_output", "--template-output": "template_output",
+}
+
+# Opciones sin valor: alias -> acción
+_FLAG_OPTIONS = {
+    "-h": "help", "--help": "help",
+    "-v": "verbose", "--verbose": "verbose",
+}
+
+# Opciones largas, para resolver prefijos no ambiguos (--conf -> --config)
+_LONG_OPTIONS = tuple(
+    option for option in (*_FLAG_OPTIONS, *_VALUE_OPTIONS) if option.startswith("--")
+)
+
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parsear los argumentos de línea de comandos sin argparse.
     
-    parser.add_argument(
-        "project_name",
-        nargs="?",
-        help="Nombre del proyecto a crear"
-    )
+    Admite lo mismo que argparse para estas opciones: ``--opcion valor``,
+    ``--opcion=valor``, prefijos no ambiguos de opciones largas, valores
+    pegados (``-cCONFIG``), opciones cortas combinadas (``-vc CONFIG``) y
+    ``--`` para terminar las opciones.
     
-    parser.add_argument(
-        "project_path",
-        nargs="?",
-        help="Ruta donde crear el proyecto"
+    Args:
+        argv: Lista de argumentos (sin el nombre del script)
+        
+    Returns:
+        Namespace con los atributos project_name, project_path, verbose,
+        config, create_template y template_output
+    """
+    args = SimpleNamespace(
+        project_name=None, project_path=None, verbose=False,
+        config=None, create_template=None, template_output=None
     )
+    positionals: List[str] = []
     
-    parser.add_argument(
-        "--verbose", "-v",
-        action="store_true",
-        help="Activar modo verbose con logging detallado"
-    )
+    def _error(message: str) -> NoReturn:
+        print(_USAGE.split("\n\n", 1)[0], file=sys.stderr)
+        print(f"init_project.py: error: {message}", file=sys.stderr)
+        sys.exit(2)
     
-    parser.add_argument(
-        "--config", "-c",
-        type=str,
-        help="Archivo de configuración JSON/YAML"
-    )
+    def _flag(option: str) -> None:
+        if _FLAG_OPTIONS[option] == "help":
+            print(_USAGE, end="")
+            sys.exit(0)
+        args.verbose = True
     
-    parser.add_argument(
-        "--create-template", "-t",
-        type=str,
-        help="Crear plantilla de configuración (especificar tipo de proyecto)"
-    )
+    def _value(option: str, value: Optional[str]) -> None:
+        if value is None:
+            value = next(it, None)
+            if value is None:
+                _error(f"el argumento {option} requiere un valor")
+        setattr(args, _VALUE_OPTIONS[option], value)
     
-    parser.add_argument(
-        "--template-output", "-o",
-        type=str,
-        help="Ruta de salida para plantilla de configuración"
-    )
+    it = iter(argv)
+    for arg in it:
+        if arg == "--":
+            positionals.extend(it)
+            break
+        
+        if arg.startswith("--"):
+            option, sep, explicit = arg.partition("=")
+            if option not in _LONG_OPTIONS:
+                matches = [o for o in _LONG_OPTIONS if o.startswith(option)]
+                if not matches:
+                    _error(f"argumento no reconocido: {arg}")
+                if len(matches) > 1:
+                    _error(f"opción ambigua: {option} podría ser {', '.join(matches)}")
+                option = matches[0]
+            if option in _VALUE_OPTIONS:
+                _value(option, explicit if sep else None)
+            elif sep:
+                _error(f"el argumento {option} no admite valor: {arg}")
+            else:
+                _flag(option)
+        
+        elif arg.startswith("-") and arg != "-":
+            # Opciones cortas combinadas; una opción con valor consume el resto
+            for i in range(1, len(arg)):
+                option = "-" + arg[i]
+                if option in _VALUE_OPTIONS:
+                    rest = arg[i + 1:]
+                    if rest.startswith("=") and i == 1:
+                        rest = rest[1:]
+                    _value(option, rest or None)
+                    break
+                if option not in _FLAG_OPTIONS:
+                    _error(f"argumento no reconocido: {arg}")
+                _flag(option)
+        
+        else:
+            positionals.append(arg)
     
-    args = parser.parse_args()
+    if len(positionals) > 2:
+        _error(f"argumentos no reconocidos: {' '.join(positionals[2:])}")
+    
+    args.project_name, args.project_path = (positionals + [None, None])[:2]
+    return args
+
+
+def main():
+    """Función principal del script."""
+    args = _parse_args(sys.argv[1:])
     
     try:
         generator = ProjectGenerator(verbose=args.verbose)
@@ -5,49 +5,308 @@ Este módulo maneja la carga y validación de archivos de configuración
 JSON/YAML para automatizar completamente la creación de proyectos.
 """
 
+import hashlib
+import itertools
 import json
-import yaml
+import mmap
+import pickle
 import os
+import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from types import MappingProxyType, ModuleType
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple, Union
 import logging
+from functools import lru_cache
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson es opcional: pip install "pre-cursor[fast]"
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Caché en disco de configuraciones ya parseadas y validadas
+_CONFIG_CACHE_DIR = Path.home() / ".cache" / "pre_cursor" / "config"
+
+# En PyPy las extensiones C pasan por cpyext (lento) y el JIT ya compila el
+# parser en Python puro: allí se prefieren SafeLoader/SafeDumper
+_PYPY = sys.implementation.name == "pypy"
+
+# Tipos de proyecto válidos: tupla para mensajes (orden estable) y
+# frozenset para comprobaciones de pertenencia en O(1)
+_VALID_PROJECT_TYPES_ORDERED = (
+    "Python Library", "Python CLI Tool", "Python Web App (Flask)",
+    "Python Web App (Django)", "Python Web App (FastAPI)",
+    "Python Data Science", "Python ML/AI", "C++ Project",
+    "Node.js Project", "TD_MCP Project", "Otro"
+)
+_VALID_PROJECT_TYPES = frozenset(_VALID_PROJECT_TYPES_ORDERED)
+
+_SUPPORTED_FORMATS_ORDERED = ('.json', '.yaml', '.yml')
+_SUPPORTED_FORMATS = frozenset(_SUPPORTED_FORMATS_ORDERED)
+
+# Plantilla inmutable de la configuración por defecto. Las partes mutables
+# (listas y diccionarios anidados) se copian en ConfigLoader._get_default_config
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "project_name": "",
+    "description": "",
+    "detailed_description": "",
+    "project_type": "Python Library",
+    "author": "Desarrollador",
+    "email": "",
+    "github_user": "",
+    "repository_url": "",
+    "python_version_min": "3.8",
+    "license": "MIT",
+    "objective": "",
+    "main_functionality": "",
+    "dependencies": MappingProxyType({
+        "main": (),
+        "development": (),
+        "testing": (),
+        "optional": ()
+    }),
+    "features": (),
+    "custom_templates": MappingProxyType({}),
+    "git_init": True,
+    "create_context": True,
+    "verbose": False
+})
+
+# A partir de este tamaño los archivos de configuración se leen con mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+# Versión del esquema que escribe save_config_template. Las configuraciones
+# marcadas como completas con esta versión se saltan el merge con los defaults
+_SCHEMA_VERSION = 1
+
+# Versión de la caché de configuraciones: el esquema y la fecha de este
+# módulo, para que una actualización que cambie los defaults o la validación
+# no reutilice configuraciones fusionadas por el código anterior
+_CONFIG_CACHE_VERSION = f"{_SCHEMA_VERSION}:{os.stat(__file__).st_mtime_ns}"
+
+# Separadores de palabras para PascalCase
+_SEP_TABLE = str.maketrans('-_', '  ')
+
+
+@lru_cache(maxsize=1)
+def _today() -> str:
+    """Fecha actual (YYYY-MM-DD), calculada una sola vez por proceso."""
+    from datetime import datetime
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _yaml_module() -> Any:
+    """
+    Importar PyYAML bajo demanda.
+    
+    Los usuarios de configuraciones JSON nunca pagan el coste de importar
+    yaml; tras el primer uso el módulo queda en ``sys.modules``.
+    """
+    import yaml
+    return yaml
+
+
+def _yaml_loader() -> Any:
+    """Loader seguro de YAML, usando los bindings de libyaml (C) si existen (salvo en PyPy)."""
+    yaml = _yaml_module()
+    if _PYPY:
+        return yaml.SafeLoader
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_dumper() -> Any:
+    """Dumper seguro de YAML, usando los bindings de libyaml (C) si existen (salvo en PyPy)."""
+    yaml = _yaml_module()
+    if _PYPY:
+        return yaml.SafeDumper
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+
+def _read_json(path: Path) -> Any:
+    """Leer un archivo JSON usando orjson si está disponible."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                # Archivos grandes: parsear directamente desde el mapa en memoria
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _json_cache_path(yaml_path: Path) -> Path:
+    """Ruta de la caché JSON asociada a un archivo YAML (``config.yaml.json``)."""
+    return yaml_path.with_name(yaml_path.name + ".json")
+
+
+def _load_yaml(yaml_path: Path) -> Any:
+    """Parsear un archivo YAML (mapeado en memoria si es grande)."""
+    with open(yaml_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _yaml_module().load(mm, Loader=_yaml_loader())
+        return _yaml_module().load(f.read().decode('utf-8'), Loader=_yaml_loader())
+
+
+def ensure_json_cache(yaml_path: Union[str, Path]) -> Any:
+    """
+    Cargar un archivo YAML a través de una caché JSON hermana.
+    
+    La caché ``<archivo>.yaml.json`` guarda el ``mtime_ns`` y el tamaño del
+    YAML del que salió y solo se usa si ambos coinciden exactamente, así que
+    un YAML reemplazado por otro más antiguo (``cp -p``, ``git stash``,
+    ``rsync -t``) invalida la caché. Si no coincide se parsea el YAML y se
+    regenera. Los errores al escribir la caché se ignoran.
+    
+    Escribe un archivo junto al YAML del usuario, por eso ``ConfigLoader``
+    solo la usa si se crea con ``json_cache=True``.
+    
+    Args:
+        yaml_path: Ruta al archivo YAML
+        
+    Returns:
+        Datos parseados del archivo
+    """
+    yaml_path = Path(yaml_path)
+    cache_path = _json_cache_path(yaml_path)
+    stat = yaml_path.stat()
+    source = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    
+    try:
+        cached = _read_json(cache_path)
+        if isinstance(cached, dict) and cached.get("source") == source:
+            return cached.get("data")
+    except (OSError, ValueError):
+        pass  # Caché inexistente o corrupta: regenerar desde YAML
+    
+    data = _load_yaml(yaml_path)
+    
+    try:
+        payload = {"source": source, "data": data}
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(payload))
+        else:
+            cache_path.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+    except (OSError, TypeError) as e:
+        logger.debug(f"No se pudo escribir caché JSON {cache_path}: {e}")
+    
+    return data
+
+
+def _deep_merge(default: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combinar ``override`` sobre ``default`` de forma iterativa.
+    
+    Los diccionarios anidados de ``default`` se copian antes de modificarse,
+    así que basta con una copia superficial del nivel superior para no
+    alterar la configuración por defecto compartida.
+    
+    Args:
+        default: Diccionario base (se modifica y se devuelve)
+        override: Valores que tienen prioridad
+        
+    Returns:
+        El diccionario ``default`` combinado
+    """
+    stack: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [(default, override)]
+    
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current = target[key] = dict(current)
+                stack.append((current, value))
+            else:
+                target[key] = value
+    
+    return default
+
+
+def _format_deps_python(deps: List[str]) -> str:
+    """
+    Formatear dependencias como comentarios para proyectos Python/C++.
+    
+    Args:
+        deps: Dependencias (``nombre`` o ``nombre>=versión``)
+        
+    Returns:
+        Texto listo para sustituir en la plantilla
+    """
+    if not deps:
+        return "# Dependencias principales\n# Añadir según necesidades"
+    return "\n".join(["# Dependencias principales", *deps])
+
+
+def _format_deps_node(deps: List[str]) -> str:
+    """
+    Formatear dependencias como entradas JSON de package.json.
+    
+    Args:
+        deps: Dependencias (``nombre`` o ``nombre>=versión``)
+        
+    Returns:
+        Texto listo para sustituir en la plantilla
+    """
+    if not deps:
+        return '"express": "^4.18.0"'
+    return ",\n".join(
+        f'    "{name.strip()}": "^{version.strip()}"' if sep else f'    "{name.strip()}": "^1.0.0"'
+        for name, sep, version in (dep.partition(">=") for dep in deps)
+    )
+
+
+# Formateador de dependencias por tipo de proyecto (Python por defecto)
+_DEP_FORMATTERS: Dict[str, Callable[[List[str]], str]] = {
+    "Node.js Project": _format_deps_node,
+}
+
+
+def _format_dependencies(deps: List[str], project_type: str = "Python Library") -> str:
+    """
+    Formatear una lista de dependencias para las plantillas.
+    
+    Args:
+        deps: Dependencias (``nombre`` o ``nombre>=versión``)
+        project_type: Tipo de proyecto (Node.js se formatea como JSON)
+        
+    Returns:
+        Texto listo para sustituir en la plantilla
+    """
+    return _DEP_FORMATTERS.get(project_type, _format_deps_python)(deps)
+
 
 class ConfigLoader:
-    """Cargador de configuraciones desde archivos JSON/YAML."""
+    """
+    Cargador de configuraciones desde archivos JSON/YAML.
+    
+    JSON es el formato preferido: se parsea mucho más rápido que YAML. Con
+    ``json_cache=True`` los archivos YAML se cachean como JSON junto al
+    original (ver ``ensure_json_cache``); por defecto no se escribe nada
+    fuera de la caché de ``load_project_config``.
+    """
+    
+    def __init__(self, json_cache: bool = False) -> None:
+        self.supported_formats: List[str] = list(_SUPPORTED_FORMATS_ORDERED)
+        self.json_cache = json_cache
     
-    def __init__(self):
-        self.supported_formats = ['.json', '.yaml', '.yml']
-        self.default_config = self._get_default_config()
+    @property
+    def default_config(self) -> Dict[str, Any]:
+        """Copia mutable de la configuración por defecto."""
+        return self._get_default_config()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Obtener configuración por defecto."""
+        # Copia guiada por la estructura conocida: más barato que deepcopy
         return {
-            "project_name": "",
-            "description": "",
-            "detailed_description": "",
-            "project_type": "Python Library",
-            "author": "Desarrollador",
-            "email": "",
-            "github_user": "",
-            "repository_url": "",
-            "python_version_min": "3.8",
-            "license": "MIT",
-            "objective": "",
-            "main_functionality": "",
-            "dependencies": {
-                "main": [],
-                "development": [],
-                "testing": [],
-                "optional": []
-            },
+            **_DEFAULT_CONFIG,
+            "dependencies": {k: list(v) for k, v in _DEFAULT_CONFIG["dependencies"].items()},
             "features": [],
             "custom_templates": {},
-            "git_init": True,
-            "create_context": True,
-            "verbose": False
         }
     
     def load_config(self, config_path: Union[str, Path]) -> Dict[str, Any]:
@@ -69,27 +328,31 @@ class ConfigLoader:
         if not config_path.exists():
             raise FileNotFoundError(f"Archivo de configuración no encontrado: {config_path}")
         
-        if config_path.suffix not in self.supported_formats:
+        if config_path.suffix not in _SUPPORTED_FORMATS:
             raise ValueError(
                 f"Formato no soportado: {config_path.suffix}. "
                 f"Formatos soportados: {', '.join(self.supported_formats)}"
             )
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                if config_path.suffix == '.json':
-                    config_data = json.load(f)
-                else:  # .yaml o .yml
-                    config_data = yaml.safe_load(f)
+            if config_path.suffix == '.json':
+                config_data = _read_json(config_path)
+            elif self.json_cache:  # .yaml o .yml
+                config_data = ensure_json_cache(config_path)
+            else:
+                config_data = _load_yaml(config_path)
             
             logger.info(f"Configuración cargada desde: {config_path}")
             return self._merge_with_defaults(config_data)
             
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError hereda de json.JSONDecodeError
             raise ValueError(f"Error parseando JSON: {e}")
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error parseando YAML: {e}")
         except Exception as e:
+            # yaml solo puede estar en sys.modules si se llegó a importar
+            yaml = sys.modules.get("yaml")
+            if yaml is not None and isinstance(e, yaml.YAMLError):
+                raise ValueError(f"Error parseando YAML: {e}")
             raise ValueError(f"Error cargando configuración: {e}")
     
     def _merge_with_defaults(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -102,27 +365,27 @@ class ConfigLoader:
         Returns:
             Dict con configuración combinada
         """
-        merged_config = self.default_config.copy()
-        
-        # Merge recursivo para diccionarios anidados
-        def deep_merge(default: Dict, override: Dict) -> Dict:
-            for key, value in override.items():
-                if key in default and isinstance(default[key], dict) and isinstance(value, dict):
-                    default[key] = deep_merge(default[key], value)
-                else:
-                    default[key] = value
-            return default
+        # Ruta rápida: configuraciones completas generadas por save_config_template.
+        # Se omite solo el merge; la plantilla puede haberse editado a mano, así
+        # que la validación es siempre la completa.
+        if (
+            config_data.get("_schema_complete") is True
+            and config_data.get("_schema_version") == _SCHEMA_VERSION
+            and _DEFAULT_CONFIG.keys() <= config_data.keys()
+        ):
+            self._validate_config(config_data)
+            return config_data
         
-        merged_config = deep_merge(merged_config, config_data)
+        merged_config = _deep_merge(self._get_default_config(), config_data)
         
         # Validar campos requeridos
         self._validate_config(merged_config)
         
         return merged_config
     
-    def _validate_config(self, config: Dict[str, Any]) -> None:
+    def _validate_required(self, config: Dict[str, Any]) -> None:
         """
-        Validar configuración cargada.
+        Validación mínima: campos requeridos y tipo de proyecto.
         
         Args:
             config: Configuración a validar
@@ -130,25 +393,27 @@ class ConfigLoader:
         Raises:
             ValueError: Si la configuración es inválida
         """
-        required_fields = ["project_name", "description"]
-        
-        for field in required_fields:
+        for field in ("project_name", "description"):
             if not config.get(field):
                 raise ValueError(f"Campo requerido faltante: {field}")
         
-        # Validar tipo de proyecto
-        valid_types = [
-            "Python Library", "Python CLI Tool", "Python Web App (Flask)",
-            "Python Web App (Django)", "Python Web App (FastAPI)",
-            "Python Data Science", "Python ML/AI", "C++ Project",
-            "Node.js Project", "TD_MCP Project", "Otro"
-        ]
-        
-        if config.get("project_type") not in valid_types:
+        if config.get("project_type") not in _VALID_PROJECT_TYPES:
             raise ValueError(
                 f"Tipo de proyecto inválido: {config.get('project_type')}. "
-                f"Tipos válidos: {', '.join(valid_types)}"
+                f"Tipos válidos: {', '.join(_VALID_PROJECT_TYPES_ORDERED)}"
             )
+    
+    def _validate_config(self, config: Dict[str, Any]) -> None:
+        """
+        Validar configuración cargada.
+        
+        Args:
+            config: Configuración a validar
+            
+        Raises:
+            ValueError: Si la configuración es inválida
+        """
+        self._validate_required(config)
         
         # Validar versión de Python
         python_version = config.get("python_version_min", "3.8")
@@ -157,18 +422,61 @@ class ConfigLoader:
         
         logger.info("Configuración validada exitosamente")
     
-    def save_config_template(self, output_path: Union[str, Path], project_type: str = "Python Library") -> None:
+    def peek_header(
+        self, config_path: Union[str, Path], max_lines: int = 20, fallback: bool = True
+    ) -> Dict[str, Any]:
         """
-        Guardar plantilla de configuración.
+        Leer solo la cabecera de un archivo de configuración.
+        
+        En YAML se parsean como máximo las primeras ``max_lines`` líneas,
+        cortando en la primera clave de nivel superior que abre un bloque
+        anidado (p. ej. ``dependencies:``). JSON no admite parseo parcial,
+        así que se lee completo (sin merge ni validación). Si la lectura
+        rápida falla se recurre a ``load_config``, salvo con ``fallback=False``,
+        en cuyo caso se devuelve un dict vacío.
         
         Args:
-            output_path: Ruta donde guardar la plantilla
-            project_type: Tipo de proyecto para la plantilla
+            config_path: Ruta al archivo de configuración
+            max_lines: Número máximo de líneas a leer en YAML
+            fallback: Si se recurre a ``load_config`` cuando la lectura rápida falla
+            
+        Returns:
+            Dict con las claves de cabecera (project_name, project_type, ...)
         """
-        output_path = Path(output_path)
+        config_path = Path(config_path)
         
-        # Crear configuración de ejemplo
-        template_config = self.default_config.copy()
+        try:
+            if config_path.suffix == '.json':
+                header = _read_json(config_path)
+            elif config_path.suffix in _SUPPORTED_FORMATS:
+                lines = []
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    for line in itertools.islice(f, max_lines):
+                        if line[:1] not in ' \t-#\n' and line.rstrip().endswith(':'):
+                            break  # Inicio de bloque anidado: fin de la cabecera
+                        lines.append(line)
+                header = _yaml_module().load(''.join(lines), Loader=_yaml_loader())
+            else:
+                header = None
+            
+            if isinstance(header, dict) and header:
+                return header
+        except Exception as e:
+            logger.debug(f"No se pudo leer la cabecera de {config_path}: {e}")
+        
+        return self.load_config(config_path) if fallback else {}
+    
+    def get_config_template(self, project_type: str = "Python Library") -> Dict[str, Any]:
+        """
+        Construir la configuración de ejemplo para un tipo de proyecto.
+        
+        Args:
+            project_type: Tipo de proyecto para la plantilla
+            
+        Returns:
+            Dict con la configuración completa de la plantilla
+        """
+        template_config = self._get_default_config()
         template_config.update({
             "project_name": "mi-proyecto-ejemplo",
             "description": "Un proyecto de ejemplo generado automáticamente",
@@ -189,16 +497,46 @@ class ConfigLoader:
                 "Funcionalidad principal",
                 "Sistema de logging",
                 "Manejo de errores"
-            ]
+            ],
+            # Marca de configuración completa: permite saltar el merge al cargar
+            "_schema_complete": True,
+            "_schema_version": _SCHEMA_VERSION
         })
+        return template_config
+    
+    def save_config_template(self, output_path: Union[str, Path], project_type: str = "Python Library") -> None:
+        """
+        Guardar plantilla de configuración.
+        
+        Args:
+            output_path: Ruta donde guardar la plantilla (JSON por defecto)
+            project_type: Tipo de proyecto para la plantilla
+        """
+        output_path = Path(output_path)
+        
+        # JSON por defecto para rutas ambiguas (directorio o sin extensión)
+        if output_path.is_dir():
+            output_path = output_path / "config_template.json"
+        elif not output_path.suffix:
+            output_path = output_path.with_suffix('.json')
+        
+        template_config = self.get_config_template(project_type)
         
         # Determinar formato basado en extensión
         if output_path.suffix == '.json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(template_config, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(template_config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(template_config, f, indent=2, ensure_ascii=False)
         else:  # .yaml o .yml
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(template_config, f, default_flow_style=False, allow_unicode=True)
+                _yaml_module().dump(
+                    template_config, f, Dumper=_yaml_dumper(),
+                    default_flow_style=False, allow_unicode=True,
+                    sort_keys=False  # project_name/project_type primero: ver peek_header
+                )
         
         logger.info(f"Plantilla de configuración guardada en: {output_path}")
     
@@ -212,9 +550,7 @@ class ConfigLoader:
         Returns:
             Dict en formato de datos del proyecto
         """
-        from datetime import datetime
-        
-        fecha_actual = datetime.now().strftime("%Y-%m-%d")
+        fecha_actual = _today()
         project_name = config["project_name"]
         
         # Generar URL del repositorio si no está especificada
@@ -230,26 +566,9 @@ class ConfigLoader:
         opt_deps = dependencies.get("optional", [])
         
         project_type = config.get("project_type", "Python Library")
-        
-        def format_dependencies(deps: list, project_type: str = "Python Library") -> str:
-            if not deps:
-                if project_type == "Node.js Project":
-                    return '"express": "^4.18.0"'
-                return "# Dependencias principales\n# Añadir según necesidades"
-            
-            if project_type == "Node.js Project":
-                # Formatear como JSON válido para Node.js
-                formatted_deps = []
-                for dep in deps:
-                    if ">=" in dep:
-                        name, version = dep.split(">=")
-                        formatted_deps.append(f'    "{name.strip()}": "^{version.strip()}"')
-                    else:
-                        formatted_deps.append(f'    "{dep.strip()}": "^1.0.0"')
-                return ",\n".join(formatted_deps)
-            else:
-                # Formatear como comentarios para Python
-                return "# Dependencias principales\n" + "\n".join(deps)
+        pascal = self._to_pascal_case(project_name)
+        module_name = self._get_module_name(project_name, project_type)
+        fmt = _DEP_FORMATTERS.get(project_type, _format_deps_python)
         
         return {
             # Información básica
@@ -273,8 +592,8 @@ class ConfigLoader:
             "FECHA_ACTUALIZACION": fecha_actual,
             
             # Información técnica específica
-            "MODULO_PRINCIPAL": self._get_module_name(project_name, config.get("project_type", "Python Library")),
-            "CLASE_PRINCIPAL": self._to_pascal_case(project_name),
+            "MODULO_PRINCIPAL": module_name,
+            "CLASE_PRINCIPAL": pascal,
             "ESTADO_INICIAL": "Fase inicial - Configuración",
             
             # Placeholders adicionales
@@ -284,14 +603,14 @@ class ConfigLoader:
             "SIGUIENTE_PASO": "Implementar primera funcionalidad",
             
             # Ejemplos y configuración
-            "EJEMPLO_USO": f"# Crear instancia\ninstancia = {self._to_pascal_case(project_name)}()\n# Usar funcionalidad\nresultado = instancia.procesar()",
+            "EJEMPLO_USO": f"# Crear instancia\ninstancia = {pascal}()\n# Usar funcionalidad\nresultado = instancia.procesar()",
             "CONFIGURACION_EJEMPLO": f"# Configuración para {project_name}\nDEBUG = True\nLOG_LEVEL = 'INFO'",
             
             # Dependencias
-            "DEPENDENCIAS_PRINCIPALES": format_dependencies(main_deps, project_type),
-            "DEPENDENCIAS_DESARROLLO": format_dependencies(dev_deps, project_type),
-            "DEPENDENCIAS_TESTING": format_dependencies(test_deps, project_type),
-            "DEPENDENCIAS_OPCIONALES": format_dependencies(opt_deps, project_type),
+            "DEPENDENCIAS_PRINCIPALES": fmt(main_deps),
+            "DEPENDENCIAS_DESARROLLO": fmt(dev_deps),
+            "DEPENDENCIAS_TESTING": fmt(test_deps),
+            "DEPENDENCIAS_OPCIONALES": fmt(opt_deps),
             
             # Campos adicionales para Node.js
             "PALABRAS_CLAVE": config.get("keywords", "nodejs, javascript, api"),
@@ -309,7 +628,7 @@ class ConfigLoader:
     
     def _to_pascal_case(self, text: str) -> str:
         """Convertir texto a PascalCase."""
-        return ''.join(word.capitalize() for word in text.replace('-', ' ').replace('_', ' ').split())
+        return ''.join(word.capitalize() for word in text.translate(_SEP_TABLE).split())
 
 
 def load_project_config(config_path: Union[str, Path]) -> Dict[str, str]:
@@ -323,10 +642,93 @@ def load_project_config(config_path: Union[str, Path]) -> Dict[str, str]:
         Dict en formato de datos del proyecto
     """
     loader = ConfigLoader()
-    config = loader.load_config(config_path)
+    config_path = Path(config_path)
+    
+    try:
+        stat = config_path.stat()
+    except OSError:
+        stat = None  # load_config reportará el error
+    
+    if stat is None:
+        config = loader.load_config(config_path)
+    else:
+        key = hashlib.blake2b(
+            f"{_CONFIG_CACHE_VERSION}:{config_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+        ).hexdigest()
+        cache_file = _CONFIG_CACHE_DIR / f"{key}.pkl"
+        
+        cached: Any = None
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            # Caché ausente, truncada o de otra versión del código: se regenera
+            logger.debug(f"Caché de configuración no utilizable {cache_file}: {e}")
+        
+        if isinstance(cached, dict):
+            config = cached
+        else:
+            config = loader.load_config(config_path)
+            try:
+                _CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_file, 'wb') as f:
+                    pickle.dump(config, f, protocol=5)
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.debug(f"No se pudo escribir caché de configuración: {e}")
+    
+    # La conversión se hace siempre: incluye la fecha actual
     return loader.convert_to_project_data(config)
 
 
+def build_project_data(config_data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Función de conveniencia para convertir una configuración en memoria.
+    
+    Equivale a ``load_project_config`` sin pasar por un archivo: combina con
+    los valores por defecto, valida y convierte a datos del proyecto.
+    
+    Args:
+        config_data: Configuración (mismas claves que el archivo JSON/YAML)
+        
+    Returns:
+        Dict en formato de datos del proyecto
+        
+    Raises:
+        ValueError: Si la configuración es inválida
+    """
+    loader = ConfigLoader()
+    return loader.convert_to_project_data(loader._merge_with_defaults(config_data))
+
+
+def peek_config_header(config_path: Union[str, Path], fallback: bool = True) -> Dict[str, Any]:
+    """
+    Función de conveniencia para leer solo la cabecera de una configuración.
+    
+    Args:
+        config_path: Ruta al archivo de configuración
+        fallback: Si se recurre a la carga completa cuando la lectura rápida falla
+        
+    Returns:
+        Dict con las claves de cabecera (vacío si no se pudo leer y ``fallback`` es False)
+    """
+    return ConfigLoader().peek_header(config_path, fallback=fallback)
+
+
+def get_config_template(project_type: str = "Python Library") -> Dict[str, Any]:
+    """
+    Función de conveniencia para obtener la plantilla de configuración.
+    
+    Args:
+        project_type: Tipo de proyecto para la plantilla
+        
+    Returns:
+        Dict con la configuración completa de la plantilla
+    """
+    return ConfigLoader().get_config_template(project_type)
+
+
 def create_config_template(output_path: Union[str, Path], project_type: str = "Python Library") -> None:
     """
     Función de conveniencia para crear plantilla de configuración.
@@ -11,61 +11,423 @@ Fecha: 2024-12-19
 """
 
 import os
+import atexit
+import concurrent.futures
+import errno
+import json
+import queue
 import shutil
 import re
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import ModuleType
+from typing import Callable, Iterator, List, Dict, Any, Optional, Set
 from datetime import datetime
+from functools import lru_cache
 import logging
 
 from .models import ProjectIssue, CursorInstruction
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson es opcional: pip install "pre-cursor[fast]"
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+# Nombres de archivos de test: en la raíz (test*.py, *_test.py) y en tests/ (test_*.py, *_test.py)
+_RE_ROOT_TEST_FILE = re.compile(r'test.*\.py|.*_test\.py', re.S)
+_RE_TESTS_DIR_FILE = re.compile(r'test_.*\.py|.*_test\.py', re.S)
+
+# Módulos de test cuyos imports se agregan automáticamente (en este orden)
+_TEST_MODULES = ("unittest", "pytest")
+# Un solo barrido: cada coincidencia es un import o un uso de unittest/pytest
+_RE_TEST_MODULE = re.compile(
+    r'^[ \t]*import[ \t]+(?P<imported>unittest|pytest)\b|\b(?P<used>unittest|pytest)\.',
+    re.M
+)
+
+# Prefiltro sobre los primeros bytes del archivo (donde viven los imports)
+_HEAD_SIZE = 4096
+_RE_IMPORT_HEAD = re.compile(rb'^[ \t]*import[ \t]+(unittest|pytest)\b', re.M)
+
+# Docstring de módulo al inicio del archivo, hasta el final de su última línea
+_RE_MODULE_DOCSTRING = re.compile(
+    r'[ \t]*[rRuU]?(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\')[^\n]*(?:\n|$)'
+)
+
+# Cola de escritura del log de ejecuciones
+_LOG_QUEUE_SIZE = 1024
+_LOG_FLUSH_INTERVAL = 0.1  # segundos
+_LOG_MAX_BATCH = 64
+_LOG_IDLE_TIMEOUT = 5.0  # segundos sin entradas antes de que el hilo termine
+_LOG_SENTINEL = object()
+
+
+def _encode_log_line(data: Dict[str, Any]) -> bytes:
+    """Serializar una entrada de log como línea JSON (UTF-8, terminada en \\n)"""
+    if orjson is not None:
+        # orjson serializa datetime de forma nativa (ISO 8601)
+        line: bytes = orjson.dumps(
+            data, default=_log_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+        return line
+    return (json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=_log_default) + '\n').encode('utf-8')
+
+
+def _log_default(value: Any) -> Any:
+    """
+    Serializador de respaldo para los tipos propios del log.
+    
+    Las instrucciones se pasan tal cual al serializador, que solo las
+    convierte cuando las alcanza; así no se construye antes una lista
+    intermedia de diccionarios para todo el lote.
+    """
+    if isinstance(value, CursorInstruction):
+        return {
+            "action": value.action,
+            "target": value.target,
+            "priority": value.priority,
+            "timestamp": value.timestamp
+        }
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Objeto no serializable: {type(value).__name__}")
+
+
+def _scan_files(directory: Path, predicate: Callable[[str], Any]) -> List[os.DirEntry]:
+    """
+    Listar los archivos regulares de un directorio cuyo nombre cumple un predicado.
+    
+    Usa un único ``os.scandir`` y el tipo cacheado de cada ``DirEntry``, en
+    lugar de varios ``glob`` con un ``stat()`` por entrada.
+    """
+    with os.scandir(directory) as it:
+        return [
+            entry for entry in it
+            if predicate(entry.name) and entry.is_file(follow_symlinks=False)
+        ]
+
+
+def _move(src: str, dst: str) -> None:
+    """
+    Mover un archivo con un único rename(2).
+    
+    Dentro del proyecto origen y destino comparten sistema de archivos; solo
+    si no es así (EXDEV) se recurre a ``shutil.move`` (copia + borrado).
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+# Acciones independientes entre sí que pueden ejecutarse en paralelo dentro de un lote
+_PARALLEL_ACTIONS = frozenset({"move_file"})
+
+
+def _max_workers(tasks: int) -> int:
+    """Número de hilos para tareas de E/S: hasta 4 por CPU, con tope de 32"""
+    return min(32, (os.cpu_count() or 1) * 4, tasks)
+
+
+def _batch_runs(instructions: List[CursorInstruction]) -> Iterator[List[CursorInstruction]]:
+    """
+    Agrupar un lote en tramos que respetan el orden original.
+    
+    Las instrucciones consecutivas de ``_PARALLEL_ACTIONS`` sobre archivos con
+    nombres distintos forman un mismo tramo (no pueden pisarse entre sí); el
+    resto se entrega de una en una.
+    """
+    run: List[CursorInstruction] = []
+    names: Set[str] = set()
+    for instruction in instructions:
+        if instruction.action not in _PARALLEL_ACTIONS:
+            if run:
+                yield run
+                run, names = [], set()
+            yield [instruction]
+            continue
+        
+        name = os.path.basename(instruction.target)
+        if name in names:
+            yield run
+            run, names = [], set()
+        run.append(instruction)
+        names.add(name)
+    
+    if run:
+        yield run
+
+
+# Directorio de destino por extensión (los .py y el resto van a src/)
+_SUFFIX_LOCATIONS = {'.md': 'docs', '.yaml': 'config', '.yml': 'config'}
+
+
+@lru_cache(maxsize=1024)
+def _location_key(file_name: str) -> str:
+    """
+    Directorio (relativo al proyecto) donde debe vivir un archivo.
+    
+    Args:
+        file_name: Nombre del archivo en minúsculas
+        
+    Returns:
+        'tests', 'src', 'docs' o 'config'
+    """
+    # Reglas de organización: primero los tests, luego por extensión
+    if file_name.startswith('test') or file_name.endswith('_test.py'):
+        return "tests"
+    dot = file_name.rfind('.')
+    if dot < 0:
+        return "src"
+    return _SUFFIX_LOCATIONS.get(file_name[dot:], "src")
+
+
+def _append_lines(path: str, lines: List[bytes]) -> None:
+    """Añadir líneas ya serializadas a un log con un único write() en modo append"""
+    payload = b"".join(lines)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        # El directorio de logs se borró después de crearse
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+class _LogWriter:
+    """
+    Escritor en segundo plano compartido por todos los ``AutoExecutor``.
+    
+    Un único hilo por proceso consume la cola y agrupa las entradas por
+    archivo. El hilo se arranca con la primera entrada y termina solo tras
+    ``_LOG_IDLE_TIMEOUT`` segundos sin trabajo, así que crear ejecutores
+    no deja hilos vivos.
+    """
+    
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+    
+    def submit(self, path: str, line: bytes) -> None:
+        """Encolar una línea para ``path``; si la cola está llena se escribe ya"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="AutoExecutorLog", daemon=True
+                )
+                self._thread.start()
+                if not self._atexit_registered:
+                    # Vaciar la cola al salir aunque nadie llame a close()
+                    atexit.register(self.close)
+                    self._atexit_registered = True
+            try:
+                self._queue.put_nowait((path, line))
+                return
+            except queue.Full:
+                pass
+        
+        # Cola saturada: escribir de forma síncrona antes que perder el registro
+        self._write({path: [line]})
+    
+    def flush(self) -> None:
+        """Esperar a que todas las entradas encoladas estén escritas"""
+        self._queue.join()
+    
+    def close(self) -> None:
+        """Vaciar la cola y detener el hilo (se vuelve a arrancar si llegan más entradas)"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(_LOG_SENTINEL)
+        if thread is not None:
+            thread.join()
+    
+    def _worker(self) -> None:
+        """Consumir la cola y escribir en lotes: un write() por archivo cada _LOG_MAX_BATCH entradas o intervalo de flush"""
+        while True:
+            try:
+                item = self._queue.get(timeout=_LOG_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    # submit() encola bajo el mismo lock: si sigue vacía, nadie espera a este hilo
+                    if self._queue.empty() and self._thread is threading.current_thread():
+                        self._thread = None
+                        return
+                continue
+            
+            taken = 1
+            batch: Dict[str, List[bytes]] = {}
+            count = 0
+            stop = False
+            deadline = time.monotonic() + _LOG_FLUSH_INTERVAL
+            
+            while True:
+                if item is _LOG_SENTINEL:
+                    stop = True
+                    break
+                path, line = item
+                batch.setdefault(path, []).append(line)
+                count += 1
+                if count >= _LOG_MAX_BATCH:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                    taken += 1
+                except queue.Empty:
+                    break
+            
+            if batch:
+                self._write(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+            if stop:
+                return
+    
+    @staticmethod
+    def _write(batch: Dict[str, List[bytes]]) -> None:
+        """Escribir las líneas agrupadas por archivo"""
+        for path, lines in batch.items():
+            try:
+                _append_lines(path, lines)
+                logger.info("Log de ejecuciones guardado en: %s", path)
+            except Exception as e:
+                logger.error("Error guardando log de ejecuciones: %s", e)
+
+
+_LOG_WRITER = _LogWriter()
+
+
 class AutoExecutor:
     """Ejecutor automático de cambios detectados por el supervisor"""
     
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
         self.logs_dir = self.project_path / ".cursor" / "logs"
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
         
-        # Archivo de log de ejecuciones automáticas
-        self.auto_execution_log = self.logs_dir / "auto_executions.json"
+        # Directorios de destino, construidos una sola vez
+        self.tests_dir = self.project_path / "tests"
+        self.src_dir = self.project_path / "src"
+        self.docs_dir = self.project_path / "docs"
+        self.config_dir = self.project_path / "config"
+        self._location_dirs = {
+            "tests": self.tests_dir,
+            "src": self.src_dir,
+            "docs": self.docs_dir,
+            "config": self.config_dir,
+        }
+        
+        # Directorios ya creados/verificados: evita repetir mkdir en cada lote
+        self._ensured_dirs: Set[str] = set()
+        self._ensure_dir(self.logs_dir)
+        
+        # Archivo de log de ejecuciones automáticas (JSON Lines, solo append)
+        self.auto_execution_log = self.logs_dir / "auto_executions.jsonl"
+        self._migrate_legacy_log()
+        
+        # Tabla de despacho: acción -> manejador
+        self._handlers: Dict[str, Callable[[CursorInstruction], Dict[str, Any]]] = {
+            "move_test_files": self._execute_move_test_files,
+            "move_file": self._execute_move_file,
+            "reorganize_structure": self._execute_reorganize_structure,
+            "fix_duplicates": self._execute_fix_duplicates,
+            "create_tests_dir": self._execute_create_tests_dir,
+            "rename_test_files": self._execute_rename_test_files,
+            "unify_test_functions": self._execute_unify_test_functions,
+            "add_test_imports": self._execute_add_test_imports,
+        }
+        
+        logger.info("AutoExecutor inicializado para %s", project_path)
+    
+    def _migrate_legacy_log(self) -> None:
+        """
+        Convertir (una sola vez) el log antiguo ``auto_executions.json`` a JSON Lines.
+        
+        El formato anterior guardaba ``{"executions": [...]}`` y se reescribía
+        entero en cada lote. Sus entradas se colocan delante de las ya existentes
+        en el ``.jsonl`` y el archivo antiguo se elimina tras la migración.
+        """
+        legacy = self.logs_dir / "auto_executions.json"
+        if not legacy.is_file():
+            return
         
-        logger.info(f"AutoExecutor inicializado para {project_path}")
+        try:
+            with open(legacy, 'rb') as f:
+                data = json.load(f)
+            executions = data.get("executions", []) if isinstance(data, dict) else []
+            
+            tmp_path = f"{self.auto_execution_log}.tmp"
+            with open(tmp_path, 'wb') as out:
+                out.writelines(_encode_log_line(entry) for entry in executions)
+                if self.auto_execution_log.exists():
+                    with open(self.auto_execution_log, 'rb') as current:
+                        shutil.copyfileobj(current, out)
+            os.replace(tmp_path, self.auto_execution_log)
+            legacy.unlink()
+            
+            logger.info("Log de ejecuciones migrado a JSON Lines: %d entradas", len(executions))
+            
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("No se pudo migrar %s: %s", legacy, e)
+    
+    def _ensure_dir(self, path: Path, recheck: bool = False) -> None:
+        """
+        Crear un directorio (y sus padres) solo la primera vez que se necesita.
+        
+        Args:
+            path: Directorio a crear
+            recheck: Crearlo aunque ya esté cacheado (p. ej. si se borró después)
+        """
+        key = str(path)
+        if key in self._ensured_dirs and not recheck:
+            return
+        self._ensured_dirs.discard(key)
+        path.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(key)
+    
+    def _move_into(self, src: str, directory: Path, name: str) -> None:
+        """Mover un archivo a ``directory/name``, recreando el directorio si desapareció tras cachearse"""
+        dst = os.path.join(directory, name)
+        try:
+            _move(src, dst)
+        except FileNotFoundError:
+            if os.path.isdir(directory) or not os.path.exists(src):
+                raise
+            self._ensure_dir(directory, recheck=True)
+            _move(src, dst)
     
     def execute_instruction(self, instruction: CursorInstruction) -> Dict[str, Any]:
         """Ejecutar una instrucción automáticamente"""
-        logger.info(f"Ejecutando instrucción automática: {instruction.action}")
+        logger.info("Ejecutando instrucción automática: %s", instruction.action)
         
         try:
-            if instruction.action == "move_test_files":
-                return self._execute_move_test_files(instruction)
-            elif instruction.action == "move_file":
-                return self._execute_move_file(instruction)
-            elif instruction.action == "reorganize_structure":
-                return self._execute_reorganize_structure(instruction)
-            elif instruction.action == "fix_duplicates":
-                return self._execute_fix_duplicates(instruction)
-            elif instruction.action == "create_tests_dir":
-                return self._execute_create_tests_dir(instruction)
-            elif instruction.action == "rename_test_files":
-                return self._execute_rename_test_files(instruction)
-            elif instruction.action == "unify_test_functions":
-                return self._execute_unify_test_functions(instruction)
-            elif instruction.action == "add_test_imports":
-                return self._execute_add_test_imports(instruction)
-            else:
-                logger.warning(f"Acción no soportada: {instruction.action}")
+            handler = self._handlers.get(instruction.action)
+            if handler is None:
+                logger.warning("Acción no soportada: %s", instruction.action)
                 return {
                     "success": False,
                     "error": f"Acción no soportada: {instruction.action}",
                     "changes_made": []
                 }
+            return handler(instruction)
                 
         except Exception as e:
-            logger.error(f"Error ejecutando instrucción {instruction.action}: {e}")
+            logger.error("Error ejecutando instrucción %s: %s", instruction.action, e)
             return {
                 "success": False,
                 "error": str(e),
@@ -77,10 +439,11 @@ class AutoExecutor:
         changes_made = []
         
         try:
-            # Buscar archivos de test en la raíz
-            test_files = []
-            for pattern in ['*_test.py', 'test*.py']:
-                test_files.extend(self.project_path.glob(pattern))
+            # Buscar archivos de test en la raíz (un solo recorrido del directorio)
+            test_files = _scan_files(
+                self.project_path,
+                _RE_ROOT_TEST_FILE.fullmatch
+            )
             
             if not test_files:
                 return {
@@ -90,27 +453,33 @@ class AutoExecutor:
                 }
             
             # Crear directorio tests/ si no existe
-            tests_dir = self.project_path / "tests"
-            tests_dir.mkdir(exist_ok=True)
-            
-            # Mover archivos
+            tests_dir = self.tests_dir
+            self._ensure_dir(tests_dir)
+            
+            # Mover archivos (nombres existentes en tests/ listados una sola vez)
+            try:
+                existing = set(os.listdir(tests_dir))
+            except FileNotFoundError:
+                # Borrado después de cachearse: volver a crearlo
+                self._ensure_dir(tests_dir, recheck=True)
+                existing = set()
             for test_file in test_files:
-                if test_file.is_file():
-                    destination = tests_dir / test_file.name
-                    
-                    # Verificar si ya existe en tests/
-                    if destination.exists():
-                        # Crear nombre único
-                        counter = 1
-                        while destination.exists():
-                            name_parts = test_file.stem, counter, test_file.suffix
-                            destination = tests_dir / f"{name_parts[0]}_{name_parts[1]}{name_parts[2]}"
-                            counter += 1
-                    
-                    # Mover archivo
-                    shutil.move(str(test_file), str(destination))
-                    changes_made.append(f"Moved {test_file.name} to tests/")
-                    logger.info(f"Archivo movido: {test_file.name} -> tests/")
+                dest_name = test_file.name
+                
+                # Verificar si ya existe en tests/
+                if dest_name in existing:
+                    # Crear nombre único
+                    stem, suffix = os.path.splitext(test_file.name)
+                    counter = 1
+                    while dest_name in existing:
+                        dest_name = f"{stem}_{counter}{suffix}"
+                        counter += 1
+                existing.add(dest_name)
+                
+                # Mover archivo
+                self._move_into(test_file.path, tests_dir, dest_name)
+                changes_made.append(f"Moved {test_file.name} to tests/")
+                logger.info("Archivo movido: %s -> tests/", test_file.name)
             
             return {
                 "success": True,
@@ -119,7 +488,7 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error moviendo archivos de test: {e}")
+            logger.error("Error moviendo archivos de test: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -132,7 +501,8 @@ class AutoExecutor:
         
         try:
             source_path = Path(instruction.target)
-            if not source_path.exists():
+            source_str = os.fspath(source_path)
+            if not os.path.exists(source_str):
                 return {
                     "success": False,
                     "error": f"Archivo no encontrado: {source_path}",
@@ -150,11 +520,10 @@ class AutoExecutor:
                 }
             
             # Crear directorio de destino si no existe
-            correct_location.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(correct_location)
             
             # Mover archivo
-            destination = correct_location / source_path.name
-            shutil.move(str(source_path), str(destination))
+            self._move_into(source_str, correct_location, source_path.name)
             changes_made.append(f"Moved {source_path.name} to {correct_location}")
             
             return {
@@ -164,7 +533,7 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error moviendo archivo: {e}")
+            logger.error("Error moviendo archivo: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -178,7 +547,7 @@ class AutoExecutor:
         try:
             # Esta es una acción compleja que requiere análisis específico
             # Por ahora, solo logueamos la instrucción
-            logger.info(f"Reorganización de estructura solicitada para: {instruction.target}")
+            logger.info("Reorganización de estructura solicitada para: %s", instruction.target)
             
             return {
                 "success": True,
@@ -187,7 +556,7 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error reorganizando estructura: {e}")
+            logger.error("Error reorganizando estructura: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -201,7 +570,7 @@ class AutoExecutor:
         try:
             # Esta es una acción compleja que requiere análisis de código
             # Por ahora, solo logueamos la instrucción
-            logger.info(f"Eliminación de duplicados solicitada para: {instruction.target}")
+            logger.info("Eliminación de duplicados solicitada para: %s", instruction.target)
             
             return {
                 "success": True,
@@ -210,7 +579,7 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error eliminando duplicados: {e}")
+            logger.error("Error eliminando duplicados: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -222,10 +591,11 @@ class AutoExecutor:
         changes_made = []
         
         try:
-            tests_dir = self.project_path / "tests"
+            tests_dir = self.tests_dir
             
             if not tests_dir.exists():
-                tests_dir.mkdir(exist_ok=True)
+                # Puede estar cacheado como creado y haberse borrado después
+                self._ensure_dir(tests_dir, recheck=True)
                 changes_made.append("Creado directorio tests/")
                 logger.info("Directorio tests/ creado")
             
@@ -243,7 +613,7 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error creando directorio tests: {e}")
+            logger.error("Error creando directorio tests: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -255,7 +625,7 @@ class AutoExecutor:
         changes_made = []
         
         try:
-            tests_dir = self.project_path / "tests"
+            tests_dir = self.tests_dir
             if not tests_dir.exists():
                 return {
                     "success": False,
@@ -264,27 +634,29 @@ class AutoExecutor:
                 }
             
             # Buscar archivos con nomenclatura inconsistente
-            inconsistent_files = []
-            for file_path in tests_dir.glob("*.py"):
-                if not (file_path.name.startswith('test_') or file_path.name.endswith('_test.py')):
-                    inconsistent_files.append(file_path)
-            
-            for file_path in inconsistent_files:
+            inconsistent_files = _scan_files(
+                tests_dir,
+                lambda name: name.endswith('.py') and not _RE_TESTS_DIR_FILE.fullmatch(name)
+            )
+            
+            tests_dir_str = os.fspath(tests_dir)
+            existing = set(os.listdir(tests_dir_str))
+            for entry in inconsistent_files:
                 # Renombrar a test_*.py
-                new_name = f"test_{file_path.name}"
-                new_path = file_path.parent / new_name
+                new_name = f"test_{entry.name}"
                 
                 # Verificar que no exista ya
+                stem, suffix = os.path.splitext(entry.name)
                 counter = 1
-                while new_path.exists():
-                    name_parts = file_path.stem, counter, file_path.suffix
-                    new_name = f"test_{name_parts[0]}_{name_parts[1]}{name_parts[2]}"
-                    new_path = file_path.parent / new_name
+                while new_name in existing:
+                    new_name = f"test_{stem}_{counter}{suffix}"
                     counter += 1
+                existing.discard(entry.name)
+                existing.add(new_name)
                 
-                file_path.rename(new_path)
-                changes_made.append(f"Renombrado {file_path.name} -> {new_name}")
-                logger.info(f"Archivo renombrado: {file_path.name} -> {new_name}")
+                os.rename(entry.path, os.path.join(tests_dir_str, new_name))
+                changes_made.append(f"Renombrado {entry.name} -> {new_name}")
+                logger.info("Archivo renombrado: %s -> %s", entry.name, new_name)
             
             return {
                 "success": True,
@@ -293,7 +665,7 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error renombrando archivos de test: {e}")
+            logger.error("Error renombrando archivos de test: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -307,7 +679,7 @@ class AutoExecutor:
         try:
             # Esta es una acción compleja que requiere análisis de código
             # Por ahora, solo logueamos la instrucción
-            logger.info(f"Unificación de funciones de test solicitada para: {instruction.target}")
+            logger.info("Unificación de funciones de test solicitada para: %s", instruction.target)
             
             return {
                 "success": True,
@@ -316,7 +688,7 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error unificando funciones de test: {e}")
+            logger.error("Error unificando funciones de test: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -328,7 +700,7 @@ class AutoExecutor:
         changes_made = []
         
         try:
-            tests_dir = self.project_path / "tests"
+            tests_dir = self.tests_dir
             if not tests_dir.exists():
                 return {
                     "success": False,
@@ -336,52 +708,15 @@ class AutoExecutor:
                     "changes_made": []
                 }
             
-            test_files = list(tests_dir.glob("test_*.py")) + list(tests_dir.glob("*_test.py"))
+            test_files = _scan_files(
+                tests_dir,
+                _RE_TESTS_DIR_FILE.fullmatch
+            )
             
-            for test_file in test_files:
-                try:
-                    with open(test_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Verificar si necesita imports
-                    needs_unittest = 'import unittest' not in content and 'unittest.' in content
-                    needs_pytest = 'import pytest' not in content and 'pytest.' in content
-                    
-                    if needs_unittest or needs_pytest:
-                        # Agregar imports al inicio del archivo
-                        imports = []
-                        if needs_unittest:
-                            imports.append("import unittest")
-                        if needs_pytest:
-                            imports.append("import pytest")
-                        
-                        # Insertar imports después de docstring si existe
-                        lines = content.split('\n')
-                        insert_index = 0
-                        
-                        # Buscar docstring
-                        if lines and lines[0].strip().startswith('"""'):
-                            for i, line in enumerate(lines[1:], 1):
-                                if line.strip().endswith('"""'):
-                                    insert_index = i + 1
-                                    break
-                        
-                        # Insertar imports
-                        for import_line in imports:
-                            lines.insert(insert_index, import_line)
-                            insert_index += 1
-                        
-                        new_content = '\n'.join(lines)
-                        
-                        with open(test_file, 'w', encoding='utf-8') as f:
-                            f.write(new_content)
-                        
-                        changes_made.append(f"Agregados imports a {test_file.name}")
-                        logger.info(f"Imports agregados a {test_file.name}")
-                
-                except Exception as e:
-                    logger.warning(f"Error procesando {test_file.name}: {e}")
-                    continue
+            # Cada archivo es independiente: solapar la latencia de E/S entre hilos
+            if test_files:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=_max_workers(len(test_files))) as pool:
+                    changes_made = [change for change in pool.map(self._maybe_add_imports, test_files) if change]
             
             return {
                 "success": True,
@@ -390,41 +725,93 @@ class AutoExecutor:
             }
             
         except Exception as e:
-            logger.error(f"Error agregando imports de test: {e}")
+            logger.error("Error agregando imports de test: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "changes_made": changes_made
             }
     
+    def _maybe_add_imports(self, test_file: os.DirEntry) -> Optional[str]:
+        """Agregar los imports que falten a un archivo de test; devuelve el cambio realizado"""
+        try:
+            with open(test_file.path, 'rb') as f:
+                data = f.read(_HEAD_SIZE)
+                if len(data) == _HEAD_SIZE:
+                    # Si la cabecera ya importa todos los módulos no puede faltar ninguno
+                    if len(set(_RE_IMPORT_HEAD.findall(data))) == len(_TEST_MODULES):
+                        return None
+                    data += f.read()
+            content = data.decode('utf-8')
+            
+            # Verificar qué módulos se usan sin importarse (un único barrido)
+            used: Set[str] = set()
+            imported: Set[str] = set()
+            for match in _RE_TEST_MODULE.finditer(content):
+                if match.lastgroup == "imported":
+                    imported.add(match.group("imported"))
+                else:
+                    used.add(match.group("used"))
+            missing = [name for name in _TEST_MODULES if name in used and name not in imported]
+            if not missing:
+                return None
+            
+            # Insertar imports después del docstring inicial si existe
+            header = _RE_MODULE_DOCSTRING.match(content)
+            insert_index = header.end() if header else 0
+            
+            prefix = content[:insert_index]
+            if prefix and not prefix.endswith('\n'):
+                prefix += '\n'
+            new_content = prefix + ''.join(f"import {name}\n" for name in missing) + content[insert_index:]
+            
+            # Escritura atómica: archivo temporal hermano + os.replace
+            tmp_file = test_file.path + '.tmp'
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(new_content.encode('utf-8'))
+                shutil.copymode(test_file.path, tmp_file)
+                os.replace(tmp_file, test_file.path)
+            except BaseException:
+                if os.path.exists(tmp_file):
+                    os.unlink(tmp_file)
+                raise
+            
+            logger.info("Imports agregados a %s", test_file.name)
+            return f"Agregados imports a {test_file.name}"
+        
+        except Exception as e:
+            logger.warning("Error procesando %s: %s", test_file.name, e)
+            return None
+    
     def _get_correct_location(self, file_path: Path) -> Path:
         """Determinar la ubicación correcta de un archivo"""
-        file_name = file_path.name.lower()
-        
-        # Reglas de organización
-        if file_name.startswith('test') or file_name.endswith('_test.py'):
-            return self.project_path / "tests"
-        elif file_name.endswith('.py') and file_name != 'main.py':
-            return self.project_path / "src"
-        elif file_name.endswith('.md'):
-            return self.project_path / "docs"
-        elif file_name.endswith('.yaml') or file_name.endswith('.yml'):
-            return self.project_path / "config"
-        else:
-            return self.project_path / "src"
+        return self._location_dirs[_location_key(file_path.name.lower())]
     
     def execute_instructions_batch(self, instructions: List[CursorInstruction]) -> Dict[str, Any]:
         """Ejecutar un lote de instrucciones"""
-        logger.info(f"Ejecutando lote de {len(instructions)} instrucciones")
+        logger.info("Ejecutando lote de %d instrucciones", len(instructions))
         
         results = []
         total_changes = []
+        total = len(instructions)
+        log_progress = logger.info if logger.isEnabledFor(logging.INFO) else None
         
-        for i, instruction in enumerate(instructions, 1):
-            logger.info(f"Ejecutando instrucción {i}/{len(instructions)}: {instruction.action}")
-            result = self.execute_instruction(instruction)
-            results.append(result)
-            
+        done = 0
+        for run in _batch_runs(instructions):
+            if log_progress is not None:
+                for i, instruction in enumerate(run, done + 1):
+                    log_progress("Ejecutando instrucción %d/%d: %s", i, total, instruction.action)
+            done += len(run)
+            
+            if len(run) == 1:
+                results.append(self.execute_instruction(run[0]))
+            else:
+                # Movimientos independientes: solapar la E/S; map() conserva el orden
+                with concurrent.futures.ThreadPoolExecutor(max_workers=_max_workers(len(run))) as pool:
+                    results.extend(pool.map(self.execute_instruction, run))
+        
+        for result in results:
             if result["success"]:
                 total_changes.extend(result.get("changes_made", []))
         
@@ -445,45 +832,57 @@ class AutoExecutor:
     def _save_execution_log(self, instructions: List[CursorInstruction], results: List[Dict[str, Any]]):
         """Guardar log de ejecuciones automáticas"""
         try:
+            successful = sum(1 for r in results if r["success"])
             log_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
                 "project_path": str(self.project_path),
                 "total_instructions": len(instructions),
-                "instructions": [
-                    {
-                        "action": inst.action,
-                        "target": inst.target,
-                        "priority": inst.priority,
-                        "timestamp": inst.timestamp.isoformat()
-                    }
-                    for inst in instructions
-                ],
+                # Las instrucciones las convierte _log_default al serializar
+                "instructions": instructions,
                 "results": results,
                 "summary": {
-                    "successful": sum(1 for r in results if r["success"]),
-                    "failed": sum(1 for r in results if not r["success"]),
+                    "successful": successful,
+                    "failed": len(results) - successful,
                     "total_changes": sum(len(r.get("changes_made", [])) for r in results)
                 }
             }
             
-            # Leer log existente
-            if self.auto_execution_log.exists():
-                with open(self.auto_execution_log, 'r', encoding='utf-8') as f:
-                    existing_log = json.load(f)
-            else:
-                existing_log = {"executions": []}
-            
-            # Agregar nueva ejecución
-            existing_log["executions"].append(log_data)
-            
-            # Guardar log actualizado
-            with open(self.auto_execution_log, 'w', encoding='utf-8') as f:
-                json.dump(existing_log, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Log de ejecuciones guardado en: {self.auto_execution_log}")
+            # Serializar ya (los resultados pueden mutar después); escribir en segundo plano
+            _LOG_WRITER.submit(os.fspath(self.auto_execution_log), _encode_log_line(log_data))
             
         except Exception as e:
-            logger.error(f"Error guardando log de ejecuciones: {e}")
+            logger.error("Error guardando log de ejecuciones: %s", e)
+    
+    def flush(self) -> None:
+        """Esperar a que todas las entradas encoladas estén escritas en el log"""
+        _LOG_WRITER.flush()
+    
+    def close(self) -> None:
+        """Vaciar los logs pendientes y sincronizar el archivo a disco"""
+        _LOG_WRITER.flush()
+        
+        # fsync solo al cerrar, no en cada lote
+        try:
+            fd = os.open(self.auto_execution_log, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug("No se pudo sincronizar %s: %s", self.auto_execution_log, e)
 
-# Importar json al final para evitar problemas de importación circular
-import json
+    def read_executions(self) -> Iterator[Dict[str, Any]]:
+        """Leer el log de ejecuciones línea a línea, sin cargarlo completo"""
+        self.flush()  # Asegurar que las escrituras pendientes están en el archivo
+        
+        if not self.auto_execution_log.exists():
+            return
+        
+        with open(self.auto_execution_log, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Línea inválida en %s", self.auto_execution_log)
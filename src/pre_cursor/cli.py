@@ -8,32 +8,260 @@ Proporciona subcomandos, autocompletado y mejor experiencia de usuario.
 """
 
 import click
+import importlib.util
 import json
-import yaml
 import os
+import re
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
-from rich import print as rprint
-
-# Importar el generador principal
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-from init_project import ProjectGenerator
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson es opcional: pip install "pre-cursor[fast]"
+    orjson = None
+
+if TYPE_CHECKING:
+    from init_project import ProjectGenerator
+    from rich.console import Console
+    from rich.panel import Panel
+
+# init_project.py vive en la raíz del repositorio, dos niveles por encima del paquete
+_INIT_PROJECT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'init_project.py'
+)
+
+# Contenido del comando info (el panel se construye bajo demanda en _info_panel)
+_INFO_MARKUP = (
+    "[bold blue]🚀 Pre-Cursor v1.0.2[/bold blue]\n\n"
+    "Generador de proyectos optimizado para agentes de IA\n"
+    "Crea estructuras completas con metodología establecida\n\n"
+    "[bold green]Características:[/bold green]\n"
+    "• Soporte para múltiples lenguajes y frameworks\n"
+    "• Plantillas profesionales y documentación completa\n"
+    "• Integración con Git y herramientas de desarrollo\n"
+    "• Optimizado para trabajo con agentes de IA\n"
+    "• Supervisión automática con Cursor Supervisor\n\n"
+    "[bold yellow]Autor:[/bold yellow] Assiz Alcaraz Baxter\n"
+    "[bold yellow]Licencia:[/bold yellow] MIT"
+)
+_EXAMPLES_TEXT = (
+    "\n📚 Ejemplos de uso:\n"
+    "• pre-cursor create mi-proyecto\n"
+    "• pre-cursor create mi-api --type 'Python Web App (FastAPI)'\n"
+    "• pre-cursor template --type 'Python Library'\n"
+    "• pre-cursor generate mi_config.json\n"
+    "• pre-cursor supervisor start /path/to/project\n"
+    "• pre-cursor supervisor start -p  # Usar directorio actual\n"
+    "• pre-cursor supervisor status /path/to/project\n"
+    "• pre-cursor supervisor config -p --interval 600"
+)
+
+# Nombre de proyecto válido: minúsculas, dígitos y guiones bajos
+_PROJECT_NAME_RE = re.compile(r'\A[a-z0-9_]+\Z')
+
+# Espacio inicial de un archivo de configuración (antes del primer byte útil)
+_LEADING_WS_RE = re.compile(rb'[ \t\r\n]*')
+
+# En PyPy los bindings C de PyYAML pasan por cpyext; el JIT rinde más con el
+# loader en Python puro, sobre todo en procesos largos como ``batch``
+_PYPY = sys.implementation.name == 'pypy'
+
+# Tipos de proyecto con su descripción y tecnologías (tabla de list-types),
+# como tuplas inmutables: se recorren en orden y nunca se buscan por clave
+_PROJECT_TYPES_INFO: Tuple[Tuple[str, str, str], ...] = (
+    ("Python Library", "Librerías Python estándar", "Python, pytest, black"),
+    ("Python CLI Tool", "Herramientas de línea de comandos", "Python, Click, argparse"),
+    ("Python Web App (Flask)", "Aplicaciones web con Flask", "Python, Flask, SQLAlchemy"),
+    ("Python Web App (Django)", "Aplicaciones web con Django", "Python, Django, PostgreSQL"),
+    ("Python Web App (FastAPI)", "Aplicaciones web con FastAPI", "Python, FastAPI, Pydantic"),
+    ("Python Data Science", "Proyectos de ciencia de datos", "Python, pandas, numpy, matplotlib"),
+    ("Python ML/AI", "Proyectos de machine learning", "Python, scikit-learn, tensorflow"),
+    ("C++ Project", "Proyectos en C++", "C++, CMake, Google Test"),
+    ("Node.js Project", "Proyectos en Node.js", "Node.js, npm, Jest"),
+    ("TD_MCP Project", "Proyectos MCP para TouchDesigner", "Python, MCP, TouchEngine SDK"),
+    ("Otro", "Configuración personalizada", "Personalizable"),
+)
+
+# Tipos de proyecto aceptados por create, template y el modo interactivo.
+# Se derivan de la tabla anterior para que ambas listas no puedan divergir;
+# internados, las comparaciones con otras cadenas internadas son por identidad.
+PROJECT_TYPES: Tuple[str, ...] = tuple(sys.intern(ptype) for ptype, _, _ in _PROJECT_TYPES_INFO)
+
+# Un único tipo de parámetro Click para --type, compartido por create y template.
+# Click devuelve siempre el objeto de PROJECT_TYPES que coincide, así que el
+# valor recibido por los comandos ya es la cadena internada (y bien escrita
+# aunque el usuario use otras mayúsculas).
+_PROJECT_TYPE_CHOICE = click.Choice(PROJECT_TYPES, case_sensitive=False)
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    """
+    Consola Rich compartida, creada la primera vez que se imprime algo.
+    
+    Importar ``rich.console`` es la mayor parte del arranque del CLI;
+    ``--help`` y los errores de Click no lo necesitan.
+    
+    Con la salida redirigida (sin terminal ni ``FORCE_COLOR``) Rich descarta
+    los estilos, así que se desactiva también el resaltado automático, que
+    pasaría sus expresiones regulares por cada línea impresa.
+    """
+    from rich.console import Console
+    stdout = sys.stdout
+    is_terminal = stdout is not None and stdout.isatty()
+    return Console(highlight=is_terminal or 'FORCE_COLOR' in os.environ)
+
+
+@lru_cache(maxsize=None)
+def _get_generator() -> "ProjectGenerator":
+    """
+    Generador principal, importado la primera vez que un subcomando lo necesita.
+    
+    ``init_project`` arrastra el cargador de configuración y las plantillas;
+    subcomandos como ``list-types`` o ``supervisor`` no pagan ese coste.
+    """
+    return _load_init_project().ProjectGenerator()
+
+
+def _load_init_project() -> ModuleType:
+    """
+    Importar ``init_project`` (raíz del repositorio) sin tocar ``sys.path``.
+    
+    Se carga directamente desde su archivo en lugar de insertar la raíz del
+    repositorio al principio de ``sys.path``, que alargaría la búsqueda de
+    todos los imports posteriores del proceso. Si el archivo no está (p. ej.
+    instalado como módulo aparte) se usa el import normal.
+    """
+    module = sys.modules.get('init_project')
+    if module is not None:
+        return module
+    if not os.path.isfile(_INIT_PROJECT_PATH):
+        import init_project
+        return init_project
+    
+    spec = importlib.util.spec_from_file_location('init_project', _INIT_PROJECT_PATH)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No se puede cargar {_INIT_PROJECT_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['init_project'] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules['init_project']
+        raise
+    return module
+
+
+@lru_cache(maxsize=32)
+def _template_for(project_type: str) -> Dict[str, Any]:
+    """
+    Plantilla de configuración de un tipo de proyecto, calculada una vez.
+    
+    El resultado es determinista para cada tipo y se comparte entre
+    llamadas: quien lo use solo debe serializarlo, nunca modificarlo.
+    """
+    return _get_generator()._create_config_template(project_type)
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """Loader seguro de YAML: el de libyaml (C) si existe, si no (o en PyPy) SafeLoader."""
+    import yaml
+    if _PYPY:
+        return yaml.SafeLoader
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _yaml_dumper() -> Any:
+    """Dumper seguro de YAML: el de libyaml (C) si existe, si no (o en PyPy) SafeDumper."""
+    import yaml
+    if _PYPY:
+        return yaml.SafeDumper
+    return getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def _looks_like_json(data: bytes) -> bool:
+    """Indicar si un buffer empieza (tras espacios) como un objeto o array JSON."""
+    # El patrón admite la cadena vacía, así que siempre hay coincidencia;
+    # la comprobación explícita es para el tipo Optional[Match] de mypy
+    match = _LEADING_WS_RE.match(data)
+    start = match.end() if match is not None else 0
+    return data[start:start + 1] in (b'{', b'[')
+
+
+def _read_config_file(path: str) -> Any:
+    """
+    Leer un archivo de configuración YAML o JSON según su contenido.
+    
+    El archivo se lee de una vez con ``read_bytes`` y el parser recibe un
+    único buffer de bytes, sin ``TextIOWrapper`` ni decodificación por
+    trozos: libyaml, orjson y ``json.loads`` aceptan bytes UTF-8.
+    
+    El formato se decide por el primer byte no blanco (``{`` o ``[`` es
+    JSON), así que funcionan también archivos sin extensión o con otra. Si
+    no es JSON válido (p. ej. un mapping YAML en estilo flujo) se lee como
+    YAML, que acepta ambos. Los ``.py`` de ``template --format py`` se
+    importan con ``_load_config_module``.
+    """
+    if path.endswith('.py'):
+        return _load_config_module(path)
+    return _parse_config_bytes(Path(path).read_bytes())
+
+
+def _parse_config_bytes(data: bytes) -> Any:
+    """
+    Parsear el contenido ya leído de un archivo de configuración.
+    
+    Args:
+        data: Bytes del archivo (JSON o YAML, UTF-8)
+        
+    Returns:
+        Configuración parseada
+    """
+    if _looks_like_json(data):
+        try:
+            if orjson is not None:
+                return orjson.loads(data)
+            return json.loads(data)
+        except ValueError:
+            pass
+    import yaml
+    return yaml.load(data, Loader=_yaml_loader())
 
-# Importar módulos de integración bidireccional
-from .cursor_supervisor import CursorSupervisor
-from .cursor_instruction_generator import CursorInstructionGenerator
-from .cursor_cli_interface import CursorCLIInterface
-from .feedback_processor import FeedbackProcessor
 
-console = Console()
+def _load_config_module(path: str) -> Dict[str, Any]:
+    """
+    Cargar una configuración generada con ``template --format py``.
+    
+    El módulo se ejecuta con el import estándar: a partir de la segunda
+    carga Python reutiliza el bytecode de ``__pycache__`` y el dict
+    ``CONFIG`` se construye sin pasar por ningún parser.
+    
+    Args:
+        path: Ruta del módulo de configuración
+        
+    Returns:
+        Dict ``CONFIG`` definido en el módulo
+        
+    Raises:
+        ValueError: Si el módulo no define ``CONFIG`` como dict
+    """
+    spec = importlib.util.spec_from_file_location('_pre_cursor_config', path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No se puede cargar {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    config = getattr(module, 'CONFIG', None)
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} no define un dict CONFIG")
+    return config
 
 @click.group()
 @click.version_option(version="1.0.2", prog_name="pre-cursor")
@@ -73,12 +301,12 @@ def monitor(project_path, path, daemon, interval, auto_fix, test_supervisor, llm
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n🔄 Iniciando supervisión unificada de: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n🔄 Iniciando supervisión unificada de: [bold blue]{project_path}[/bold blue]")
         
         # Configurar opciones
         options = {
@@ -90,12 +318,12 @@ def monitor(project_path, path, daemon, interval, auto_fix, test_supervisor, llm
         }
         
         # Mostrar configuración
-        console.print(f"\n⚙️ Configuración:")
-        console.print(f"  🤖 Modo daemon: {'Sí' if daemon else 'No'}")
-        console.print(f"  ⏱️ Intervalo: {interval} segundos")
-        console.print(f"  🔧 Correcciones automáticas: {'Sí' if auto_fix else 'No'}")
-        console.print(f"  🧪 Test Supervisor: {'Sí' if test_supervisor else 'No'}")
-        console.print(f"  🤖 Validación LLM: {'Sí' if llm_validation else 'No'}")
+        _console().print(f"\n⚙️ Configuración:")
+        _console().print(f"  🤖 Modo daemon: {'Sí' if daemon else 'No'}")
+        _console().print(f"  ⏱️ Intervalo: {interval} segundos")
+        _console().print(f"  🔧 Correcciones automáticas: {'Sí' if auto_fix else 'No'}")
+        _console().print(f"  🧪 Test Supervisor: {'Sí' if test_supervisor else 'No'}")
+        _console().print(f"  🤖 Validación LLM: {'Sí' if llm_validation else 'No'}")
         
         # Inicializar supervisor unificado
         from .unified_supervisor import UnifiedSupervisor
@@ -106,30 +334,27 @@ def monitor(project_path, path, daemon, interval, auto_fix, test_supervisor, llm
         )
         
         if daemon:
-            console.print(f"\n🚀 Iniciando daemon en segundo plano...")
+            _console().print(f"\n🚀 Iniciando daemon en segundo plano...")
             supervisor.start_daemon()
         else:
-            console.print(f"\n🔄 Iniciando supervisión interactiva...")
+            _console().print(f"\n🔄 Iniciando supervisión interactiva...")
             supervisor.start_interactive()
             
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
     
     if verbose:
-        console.print("🔧 Modo verbose activado", style="blue")
+        _console().print("🔧 Modo verbose activado", style="blue")
 
 @cli.command()
 @click.argument('project_name')
 @click.option('--description', '-d', help='Descripción del proyecto')
-@click.option('--path', '-p', type=click.Path(), help='Ruta donde crear el proyecto (deprecated, usar --output-dir)')
-@click.option('--output-dir', '-o', type=str, help='Directorio de salida para el proyecto')
+@click.option('--path', '-p', type=click.Path(file_okay=False, resolve_path=True, path_type=Path),
+              help='Ruta donde crear el proyecto (deprecated, usar --output-dir)')
+@click.option('--output-dir', '-o', type=click.Path(file_okay=False, resolve_path=True, path_type=Path),
+              help='Directorio de salida para el proyecto')
 @click.option('--type', '-t', 'project_type', 
-              type=click.Choice([
-                  'Python Library', 'Python CLI Tool', 'Python Web App (Flask)',
-                  'Python Web App (Django)', 'Python Web App (FastAPI)',
-                  'Python Data Science', 'Python ML/AI', 'C++ Project',
-                  'Node.js Project', 'TD_MCP Project', 'Otro'
-              ]),
+              type=_PROJECT_TYPE_CHOICE,
               help='Tipo de proyecto')
 @click.option('--interactive', '-i', is_flag=True, help='Modo interactivo')
 @click.option('--open-cursor', is_flag=True, help='Abrir proyecto en Cursor al finalizar')
@@ -146,19 +371,20 @@ def create(ctx, project_name, description, path, output_dir, project_type, inter
     pre-cursor create mi-app --interactive --force
     pre-cursor create mi-tool -d "Herramienta CLI" -t "Python CLI Tool" -o ~/Projects
     """
-    import os
-    console.print(f"\n🚀 Creando proyecto: [bold blue]{project_name}[/bold blue]")
+    from rich.prompt import Confirm
+    _console().print(f"\n🚀 Creando proyecto: [bold blue]{project_name}[/bold blue]")
     
     # Validar nombre del proyecto
     if not _validate_project_name(project_name):
-        console.print("❌ Error: El nombre del proyecto debe contener solo letras minúsculas, números y guiones bajos", style="red")
+        _console().print("❌ Error: El nombre del proyecto debe contener solo letras minúsculas, números y guiones bajos", style="red")
         sys.exit(1)
     
-    # Determinar ruta de salida (priorizar --output-dir sobre --path)
+    # Determinar ruta de salida (priorizar --output-dir sobre --path). Click
+    # ya entrega rutas absolutas como Path, que se usan hasta el generador
     if output_dir:
-        output_path = os.path.join(output_dir, project_name)
+        output_path = output_dir / project_name
     elif path:
-        output_path = os.path.join(path, project_name) if not path.endswith(project_name) else path
+        output_path = path if path.name == project_name else path / project_name
     else:
         output_path = None
     
@@ -169,6 +395,10 @@ def create(ctx, project_name, description, path, output_dir, project_type, inter
         # Modo directo mejorado
         project_path = _direct_create(project_name, description, output_path, project_type, force)
     
+    # Operación cancelada o fallida: no hay proyecto que abrir
+    if project_path is None:
+        return
+    
     # Abrir en Cursor si se solicita
     if open_cursor:
         _open_in_cursor(project_path)
@@ -207,21 +437,21 @@ def create_of(project_name, of_path, output_dir, addons, interactive, list_addon
         if list_addons:
             addons_list = of_generator.list_addons()
             if addons_list:
-                console.print(f"\n📋 Addons disponibles ({len(addons_list)}):")
+                _console().print(f"\n📋 Addons disponibles ({len(addons_list)}):")
                 for addon in addons_list:
-                    console.print(f"   • [cyan]{addon}[/cyan]")
+                    _console().print(f"   • [cyan]{addon}[/cyan]")
             else:
-                console.print("⚠️  No se encontraron addons", style="yellow")
+                _console().print("⚠️  No se encontraron addons", style="yellow")
             return
         
         # Verificar si está disponible
         if not of_generator.check_available():
-            console.print("❌ ProjectGenerator no está disponible", style="red")
-            console.print(f"   Buscado en: {of_generator.pg_path}", style="yellow")
-            console.print("\n💡 Opciones:", style="blue")
-            console.print("   1. Especifica la ruta con: --of-path")
-            console.print("   2. Exporta OPENFRAMEWORKS_PATH en tu shell")
-            console.print(f"   3. Edita la ruta por defecto en: {of_generator.DEFAULT_OF_PATH}")
+            _console().print("❌ ProjectGenerator no está disponible", style="red")
+            _console().print(f"   Buscado en: {of_generator.pg_path}", style="yellow")
+            _console().print("\n💡 Opciones:", style="blue")
+            _console().print("   1. Especifica la ruta con: --of-path")
+            _console().print("   2. Exporta OPENFRAMEWORKS_PATH en tu shell")
+            _console().print(f"   3. Edita la ruta por defecto en: {of_generator.DEFAULT_OF_PATH}")
             return
         
         # Modo interactivo
@@ -238,58 +468,69 @@ def create_of(project_name, of_path, output_dir, addons, interactive, list_addon
         )
         
         if not success:
-            console.print("❌ Error al crear proyecto openFrameworks", style="red")
+            _console().print("❌ Error al crear proyecto openFrameworks", style="red")
             sys.exit(1)
         
     except ImportError as e:
-        console.print(f"❌ Error importando generador: {e}", style="red")
-        console.print("💡 Verifica que los módulos estén instalados correctamente", style="yellow")
+        _console().print(f"❌ Error importando generador: {e}", style="red")
+        _console().print("💡 Verifica que los módulos estén instalados correctamente", style="yellow")
         sys.exit(1)
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
         sys.exit(1)
 
 @cli.command()
 @click.option('--type', '-t', 'project_type',
-              type=click.Choice([
-                  'Python Library', 'Python CLI Tool', 'Python Web App (Flask)',
-                  'Python Web App (Django)', 'Python Web App (FastAPI)',
-                  'Python Data Science', 'Python ML/AI', 'C++ Project',
-                  'Node.js Project', 'TD_MCP Project', 'Otro'
-              ]),
+              type=_PROJECT_TYPE_CHOICE,
               help='Tipo de proyecto')
 @click.option('--output', '-o', type=click.Path(), default='config.json',
               help='Archivo de salida')
 @click.option('--format', 'output_format', 
-              type=click.Choice(['json', 'yaml']), default='json',
+              type=click.Choice(['json', 'yaml', 'py']), default='json',
               help='Formato de salida')
 def template(project_type, output, output_format):
     """
     📝 Crear plantilla de configuración
     
     Genera un archivo de configuración template para personalizar.
+    Con --format py se escribe un módulo Python con un dict CONFIG, que
+    generate carga sin parsear (solo bytecode a partir de la segunda vez).
     
     Ejemplos:
     pre-cursor template --type "Python Library"
     pre-cursor template --type "FastAPI" --format yaml --output mi_config.yaml
+    pre-cursor template --type "Python Library" --format py --output mi_config.py
     """
-    console.print(f"\n📝 Generando plantilla para: [bold blue]{project_type}[/bold blue]")
+    _console().print(f"\n📝 Generando plantilla para: [bold blue]{project_type}[/bold blue]")
     
-    generator = ProjectGenerator()
-    template_data = generator._create_config_template(project_type)
+    template_data = _template_for(project_type)
     
+    # Los serializadores escriben directamente en el archivo, sin un str intermedio
     if output_format == 'yaml':
-        content = yaml.dump(template_data, default_flow_style=False, sort_keys=False)
+        import yaml
+        with open(output, 'w', encoding='utf-8') as f:
+            yaml.dump(
+                template_data, f, Dumper=_yaml_dumper(),
+                default_flow_style=False, allow_unicode=True, sort_keys=False
+            )
+    elif output_format == 'py':
+        import pprint
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(f"# Generado por pre-cursor template ({project_type})\n")
+            f.write(f"CONFIG = {pprint.pformat(template_data, sort_dicts=False)}\n")
+    elif orjson is not None:
+        # orjson produce UTF-8 directamente: se escriben los bytes sin decodificar
+        Path(output).write_bytes(
+            orjson.dumps(template_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
     else:
-        content = json.dumps(template_data, indent=2, ensure_ascii=False)
-    
-    with open(output, 'w', encoding='utf-8') as f:
-        f.write(content)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(template_data, f, indent=2, ensure_ascii=False)
     
-    console.print(f"✅ Plantilla creada: [bold green]{output}[/bold green]")
+    _console().print(f"✅ Plantilla creada: [bold green]{output}[/bold green]")
 
 @cli.command()
-@click.argument('config_file', type=click.Path(exists=True))
+@click.argument('config_file', type=click.Path(exists=True, dir_okay=False))
 @click.option('--dry-run', is_flag=True, help='Simular sin crear archivos')
 def generate(config_file, dry_run):
     """
@@ -298,30 +539,82 @@ def generate(config_file, dry_run):
     Ejemplos:
     pre-cursor generate mi_config.json
     pre-cursor generate config.yaml --dry-run
+    pre-cursor generate mi_config.py
     """
-    console.print(f"\n⚡ Generando desde: [bold blue]{config_file}[/bold blue]")
+    _console().print(f"\n⚡ Generando desde: [bold blue]{config_file}[/bold blue]")
     
     if dry_run:
-        console.print("🔍 Modo dry-run: simulando generación...", style="yellow")
+        _console().print("🔍 Modo dry-run: simulando generación...", style="yellow")
     
-    generator = ProjectGenerator()
+    generator = _get_generator()
     
     try:
-        if config_file.endswith('.yaml') or config_file.endswith('.yml'):
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
-        else:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-        
         if dry_run:
-            _show_config_preview(config_data)
+            _show_config_preview(_preview_config_file(config_file))
         else:
-            generator.generate_project_from_config(config_data)
-            console.print("✅ Proyecto generado exitosamente!", style="green")
+            config_data = _read_config_file(config_file)
+            generator.generate_project_from_dict(config_data)
+            _console().print("✅ Proyecto generado exitosamente!", style="green")
             
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
+        sys.exit(1)
+
+@cli.command()
+@click.argument('config_glob')
+def batch(config_glob):
+    """
+    📦 Generar varios proyectos desde configuraciones en un solo proceso
+    
+    Acepta un directorio (se usan sus .json, .yaml y .yml) o un patrón glob.
+    Los módulos .py de ``template --format py`` se ejecutan al cargarlos, así
+    que solo se incluyen si el patrón glob los nombra explícitamente. Todas
+    las configuraciones comparten el mismo generador, así que el arranque se
+    paga una vez; bajo PyPy el JIT además se amortiza en el lote.
+    
+    Ejemplos:
+    pre-cursor batch configs/
+    pre-cursor batch 'configs/*.json'
+    pre-cursor batch 'configs/*.py'
+    pypy3 -m pre_cursor.cli batch 'configs/*.yaml'
+    """
+    import glob
+    
+    if os.path.isdir(config_glob):
+        config_files = sorted(
+            entry.path for entry in os.scandir(config_glob)
+            if entry.is_file() and entry.name.endswith(('.json', '.yaml', '.yml'))
+        )
+    else:
+        config_files = sorted(glob.glob(config_glob))
+    
+    if not config_files:
+        _console().print(f"❌ No hay configuraciones que coincidan con: {config_glob}", style="red")
+        sys.exit(1)
+    
+    _console().print(f"\n📦 Generando {len(config_files)} proyectos desde: [bold blue]{config_glob}[/bold blue]")
+    
+    # Métodos ligados fuera del bucle: una sola búsqueda de atributos por lote
+    generate_from_dict = _get_generator().generate_project_from_dict
+    read_config = _read_config_file
+    failed = []
+    
+    for config_file in config_files:
+        _console().print(f"\n⚡ {config_file}")
+        try:
+            generate_from_dict(read_config(config_file))
+        except SystemExit:
+            # El generador ya informó del error de validación y termina con
+            # SystemExit; un archivo inválido no detiene el resto del lote
+            failed.append(config_file)
+        except Exception as e:
+            failed.append(config_file)
+            _console().print(f"❌ Error en {config_file}: {e}", style="red")
+    
+    generated = len(config_files) - len(failed)
+    _console().print(f"\n✅ Proyectos generados: {generated}/{len(config_files)}", style="green")
+    if failed:
+        _console().print(f"❌ Con errores: {', '.join(failed)}", style="red")
         sys.exit(1)
 
 @cli.command()
@@ -329,31 +622,37 @@ def list_types():
     """
     📋 Listar tipos de proyecto disponibles
     """
+    console = _console()
     console.print("\n📋 Tipos de proyecto disponibles:")
     
+    # La tabla es estática: se renderiza una vez por ancho de terminal
+    console.file.write(_rendered_types_table(console.size.width))
+
+@lru_cache(maxsize=4)
+def _rendered_types_table(width: int) -> str:
+    """
+    Tabla de tipos de proyecto ya renderizada para un ancho de terminal.
+    
+    Args:
+        width: Ancho de la consola (clave de la caché: cambia al redimensionar)
+        
+    Returns:
+        Salida de la consola (con los códigos de estilo que correspondan)
+    """
+    from rich.table import Table
+    
     table = Table(show_header=True, header_style="bold blue")
     table.add_column("Tipo", style="cyan")
     table.add_column("Descripción", style="white")
     table.add_column("Tecnologías", style="green")
     
-    types_info = {
-        "Python Library": ("Librerías Python estándar", "Python, pytest, black"),
-        "Python CLI Tool": ("Herramientas de línea de comandos", "Python, Click, argparse"),
-        "Python Web App (Flask)": ("Aplicaciones web con Flask", "Python, Flask, SQLAlchemy"),
-        "Python Web App (Django)": ("Aplicaciones web con Django", "Python, Django, PostgreSQL"),
-        "Python Web App (FastAPI)": ("Aplicaciones web con FastAPI", "Python, FastAPI, Pydantic"),
-        "Python Data Science": ("Proyectos de ciencia de datos", "Python, pandas, numpy, matplotlib"),
-        "Python ML/AI": ("Proyectos de machine learning", "Python, scikit-learn, tensorflow"),
-        "C++ Project": ("Proyectos en C++", "C++, CMake, Google Test"),
-        "Node.js Project": ("Proyectos en Node.js", "Node.js, npm, Jest"),
-        "TD_MCP Project": ("Proyectos MCP para TouchDesigner", "Python, MCP, TouchEngine SDK"),
-        "Otro": ("Configuración personalizada", "Personalizable")
-    }
-    
-    for project_type, (description, technologies) in types_info.items():
-        table.add_row(project_type, description, technologies)
+    for row in _PROJECT_TYPES_INFO:
+        table.add_row(*row)
     
-    console.print(table)
+    console = _console()
+    with console.capture() as capture:
+        console.print(table, width=width)
+    return capture.get()
 
 @cli.group()
 def supervisor():
@@ -378,9 +677,9 @@ def status(project_path, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         from .unified_supervisor import UnifiedSupervisor
@@ -390,22 +689,22 @@ def status(project_path, path):
         status_info = supervisor.get_status()
         
         # Mostrar estado
-        console.print(f"\n📊 Estado del Supervisor Unificado:")
-        console.print(f"  📁 Proyecto: [bold blue]{status_info['project_path']}[/bold blue]")
-        console.print(f"  🤖 Cursor Agent CLI: {'✅ Disponible' if status_info['cursor_agent_available'] else '❌ No disponible'}")
-        console.print(f"  🔧 Correcciones automáticas: {'✅ Habilitado' if status_info['auto_fix_enabled'] else '❌ Deshabilitado'}")
-        console.print(f"  🧪 Test Supervisor: {'✅ Habilitado' if status_info['test_supervisor_enabled'] else '❌ Deshabilitado'}")
-        console.print(f"  🤖 Validación LLM: {'✅ Habilitado' if status_info['llm_validation_enabled'] else '❌ Deshabilitado'}")
-        
-        console.print(f"\n🔧 Componentes:")
+        _console().print(f"\n📊 Estado del Supervisor Unificado:")
+        _console().print(f"  📁 Proyecto: [bold blue]{status_info['project_path']}[/bold blue]")
+        _console().print(f"  🤖 Cursor Agent CLI: {'✅ Disponible' if status_info['cursor_agent_available'] else '❌ No disponible'}")
+        _console().print(f"  🔧 Correcciones automáticas: {'✅ Habilitado' if status_info['auto_fix_enabled'] else '❌ Deshabilitado'}")
+        _console().print(f"  🧪 Test Supervisor: {'✅ Habilitado' if status_info['test_supervisor_enabled'] else '❌ Deshabilitado'}")
+        _console().print(f"  🤖 Validación LLM: {'✅ Habilitado' if status_info['llm_validation_enabled'] else '❌ Deshabilitado'}")
+        
+        _console().print(f"\n🔧 Componentes:")
         for component, initialized in status_info['components_initialized'].items():
             status_icon = "✅" if initialized else "❌"
-            console.print(f"  {status_icon} {component}")
+            _console().print(f"  {status_icon} {component}")
         
-        console.print(f"\n💡 Para iniciar supervisión: [bold green]pre-cursor monitor -p[/bold green]")
+        _console().print(f"\n💡 Para iniciar supervisión: [bold green]pre-cursor monitor -p[/bold green]")
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -429,29 +728,29 @@ def start(project_path, interval, daemon, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n🤖 Iniciando supervisión de: [bold blue]{project_path}[/bold blue]")
-        console.print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
+        _console().print(f"\n🤖 Iniciando supervisión de: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
         
         supervisor = CursorSupervisor(project_path, check_interval=interval)
         
         if daemon:
-            console.print("🔄 Ejecutando como daemon...", style="yellow")
+            _console().print("🔄 Ejecutando como daemon...", style="yellow")
             supervisor.start_supervision()
         else:
-            console.print("🔄 Ejecutando verificación única...", style="yellow")
+            _console().print("🔄 Ejecutando verificación única...", style="yellow")
             report = supervisor.check_project_health()
             _display_supervision_report(report)
             
     except ImportError:
-        console.print("❌ Error: Módulo cursor_supervisor no encontrado", style="red")
-        console.print("💡 Instala las dependencias: pip install watchdog psutil", style="yellow")
+        _console().print("❌ Error: Módulo cursor_supervisor no encontrado", style="red")
+        _console().print("💡 Instala las dependencias: pip install watchdog psutil", style="yellow")
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -470,12 +769,12 @@ def status(project_path, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n📊 Estado del supervisor para: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n📊 Estado del supervisor para: [bold blue]{project_path}[/bold blue]")
         
         supervisor = CursorSupervisor(project_path)
         report = supervisor.check_project_health()
@@ -486,9 +785,9 @@ def status(project_path, path):
         _check_active_supervision(project_path)
         
     except ImportError:
-        console.print("❌ Error: Módulo cursor_supervisor no encontrado", style="red")
+        _console().print("❌ Error: Módulo cursor_supervisor no encontrado", style="red")
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -513,9 +812,9 @@ def config(project_path, interval, auto_fix, log_level, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         config_path = Path(project_path) / 'config' / 'cursor_supervisor.yaml'
@@ -525,35 +824,34 @@ def config(project_path, interval, auto_fix, log_level, path):
         
         # Cargar configuración existente o crear nueva
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _read_config_file(str(config_path)) or {}
         else:
             config_data = {}
         
         # Actualizar configuración
         if interval:
             config_data.setdefault('supervisor', {})['check_interval'] = interval
-            console.print(f"✅ Intervalo actualizado a {interval} segundos", style="green")
+            _console().print(f"✅ Intervalo actualizado a {interval} segundos", style="green")
         
         if auto_fix:
             config_data.setdefault('supervisor', {})['auto_fix'] = auto_fix == 'true'
-            console.print(f"✅ Corrección automática: {auto_fix}", style="green")
+            _console().print(f"✅ Corrección automática: {auto_fix}", style="green")
         
         if log_level:
             config_data.setdefault('supervisor', {})['log_level'] = log_level
-            console.print(f"✅ Nivel de logging: {log_level}", style="green")
+            _console().print(f"✅ Nivel de logging: {log_level}", style="green")
         
         # Guardar configuración
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_data, f, Dumper=_yaml_dumper(), default_flow_style=False, sort_keys=False)
         
-        console.print(f"✅ Configuración guardada en: [bold green]{config_path}[/bold green]")
+        _console().print(f"✅ Configuración guardada en: [bold green]{config_path}[/bold green]")
         
         # Mostrar configuración actual
         _display_supervisor_config(config_data)
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -568,17 +866,16 @@ def stop(project_path, path):
     """
     try:
         import psutil
-        import os
         
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n🛑 Deteniendo supervisión de: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n🛑 Deteniendo supervisión de: [bold blue]{project_path}[/bold blue]")
         
         # Buscar procesos de supervisor activos
         supervisor_processes = []
@@ -592,12 +889,12 @@ def stop(project_path, path):
         
         if supervisor_processes:
             for proc in supervisor_processes:
-                console.print(f"🔄 Deteniendo proceso PID {proc.pid}...", style="yellow")
+                _console().print(f"🔄 Deteniendo proceso PID {proc.pid}...", style="yellow")
                 proc.terminate()
                 proc.wait(timeout=5)
-            console.print("✅ Supervisión detenida", style="green")
+            _console().print("✅ Supervisión detenida", style="green")
         else:
-            console.print("ℹ️ No se encontraron procesos de supervisión activos", style="blue")
+            _console().print("ℹ️ No se encontraron procesos de supervisión activos", style="blue")
         
         # Verificar si hay archivos de lock
         lock_files = [
@@ -608,10 +905,10 @@ def stop(project_path, path):
         for lock_file in lock_files:
             if lock_file.exists():
                 lock_file.unlink()
-                console.print(f"🗑️ Archivo de lock eliminado: {lock_file}", style="yellow")
+                _console().print(f"🗑️ Archivo de lock eliminado: {lock_file}", style="yellow")
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -632,21 +929,21 @@ def fix(project_path, fix, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n🔧 Corrigiendo problemas en: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n🔧 Corrigiendo problemas en: [bold blue]{project_path}[/bold blue]")
         
         supervisor = CursorSupervisor(project_path)
         report = supervisor.check_project_health()
         
         if not report.issues_found:
-            console.print("✅ No se encontraron problemas que corregir", style="green")
+            _console().print("✅ No se encontraron problemas que corregir", style="green")
             return
         
-        console.print(f"📊 Problemas encontrados: [bold yellow]{len(report.issues_found)}[/bold yellow]")
+        _console().print(f"📊 Problemas encontrados: [bold yellow]{len(report.issues_found)}[/bold yellow]")
         
         # Mostrar problemas
         for issue in report.issues_found:
@@ -657,19 +954,19 @@ def fix(project_path, fix, path):
                 'critical': 'bold red'
             }.get(issue.severity, 'white')
             
-            console.print(f"  • [{severity_color}]{issue.severity.upper()}[/{severity_color}]: {issue.description}")
+            _console().print(f"  • [{severity_color}]{issue.severity.upper()}[/{severity_color}]: {issue.description}")
             if issue.suggestion:
-                console.print(f"    💡 Sugerencia: {issue.suggestion}")
+                _console().print(f"    💡 Sugerencia: {issue.suggestion}")
         
         if fix:
-            console.print("\n🔧 Aplicando correcciones automáticas...", style="yellow")
+            _console().print("\n🔧 Aplicando correcciones automáticas...", style="yellow")
             # Aquí se implementarían las correcciones automáticas
-            console.print("⚠️ Corrección automática no implementada aún", style="yellow")
+            _console().print("⚠️ Corrección automática no implementada aún", style="yellow")
         else:
-            console.print("\n💡 Usa --fix para aplicar correcciones automáticas", style="blue")
+            _console().print("\n💡 Usa --fix para aplicar correcciones automáticas", style="blue")
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -688,9 +985,9 @@ def logs(project_path, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         log_files = [
@@ -699,29 +996,29 @@ def logs(project_path, path):
             Path(project_path) / '.supervisor.log'
         ]
         
-        console.print(f"\n📋 Logs del supervisor para: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n📋 Logs del supervisor para: [bold blue]{project_path}[/bold blue]")
         
         log_found = False
         for log_file in log_files:
             if log_file.exists():
                 log_found = True
-                console.print(f"\n📄 Archivo: [bold green]{log_file}[/bold green]")
-                console.print("─" * 60)
+                _console().print(f"\n📄 Archivo: [bold green]{log_file}[/bold green]")
+                _console().print("─" * 60)
                 
                 # Mostrar últimas 20 líneas
                 with open(log_file, 'r', encoding='utf-8') as f:
                     lines = f.readlines()
                     for line in lines[-20:]:
-                        console.print(line.rstrip())
+                        _console().print(line.rstrip())
                 
-                console.print("─" * 60)
+                _console().print("─" * 60)
         
         if not log_found:
-            console.print("ℹ️ No se encontraron archivos de log", style="blue")
-            console.print("💡 Los logs se crean cuando se ejecuta la supervisión", style="yellow")
+            _console().print("ℹ️ No se encontraron archivos de log", style="blue")
+            _console().print("💡 Los logs se crean cuando se ejecuta la supervisión", style="yellow")
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -742,20 +1039,22 @@ def start_bidirectional(project_path, interval, daemon, methodology, path):
     pre-cursor supervisor start-bidirectional -p --methodology custom.yaml
     """
     try:
+        from .cursor_supervisor import CursorSupervisor
+        
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n🔄 Iniciando supervisión bidireccional de: [bold blue]{project_path}[/bold blue]")
-        console.print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
-        console.print("🤖 Integración Cursor CLI: [bold green]Habilitada[/bold green]")
+        _console().print(f"\n🔄 Iniciando supervisión bidireccional de: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
+        _console().print("🤖 Integración Cursor CLI: [bold green]Habilitada[/bold green]")
         
         if methodology:
-            console.print(f"📋 Metodología personalizada: [bold blue]{methodology}[/bold blue]")
+            _console().print(f"📋 Metodología personalizada: [bold blue]{methodology}[/bold blue]")
         
         supervisor = CursorSupervisor(
             project_path, 
@@ -765,9 +1064,9 @@ def start_bidirectional(project_path, interval, daemon, methodology, path):
         )
         
         if daemon:
-            console.print("🔄 Ejecutando como daemon en segundo plano...", style="yellow")
-            console.print("💡 El proceso continuará ejecutándose en background", style="blue")
-            console.print("🛑 Para detener: pkill -f 'pre-cursor supervisor'", style="yellow")
+            _console().print("🔄 Ejecutando como daemon en segundo plano...", style="yellow")
+            _console().print("💡 El proceso continuará ejecutándose en background", style="blue")
+            _console().print("🛑 Para detener: pkill -f 'pre-cursor supervisor'", style="yellow")
             
             # Ejecutar en segundo plano real
             import subprocess
@@ -792,26 +1091,26 @@ def start_bidirectional(project_path, interval, daemon, methodology, path):
                 cwd=project_path
             )
             
-            console.print(f"✅ Daemon iniciado con PID: [bold green]{process.pid}[/bold green]")
-            console.print(f"📁 Directorio: [bold blue]{project_path}[/bold blue]")
-            console.print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
-            console.print("📝 Logs disponibles en: logs/supervisor.log")
+            _console().print(f"✅ Daemon iniciado con PID: [bold green]{process.pid}[/bold green]")
+            _console().print(f"📁 Directorio: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
+            _console().print("📝 Logs disponibles en: logs/supervisor.log")
             
         else:
-            console.print("🔄 Ejecutando verificación única con correcciones...", style="yellow")
+            _console().print("🔄 Ejecutando verificación única con correcciones...", style="yellow")
             report = supervisor.check_project_health()
             _display_supervision_report(report)
             
             if report.issues_found:
-                console.print("\n🤖 Aplicando correcciones automáticas...", style="yellow")
+                _console().print("\n🤖 Aplicando correcciones automáticas...", style="yellow")
                 supervisor._apply_automatic_corrections(report)
-                console.print("✅ Correcciones aplicadas", style="green")
+                _console().print("✅ Correcciones aplicadas", style="green")
             
     except ImportError as e:
-        console.print(f"❌ Error: Módulo no encontrado: {e}", style="red")
-        console.print("💡 Instala las dependencias: pip install watchdog psutil", style="yellow")
+        _console().print(f"❌ Error: Módulo no encontrado: {e}", style="red")
+        _console().print("💡 Instala las dependencias: pip install watchdog psutil", style="yellow")
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -833,22 +1132,22 @@ def trigger_monitor(project_path, interval, daemon, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         from .trigger_system import TriggerSystem
         
-        console.print(f"\n🔄 Iniciando monitoreo de triggers en: [bold blue]{project_path}[/bold blue]")
-        console.print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
+        _console().print(f"\n🔄 Iniciando monitoreo de triggers en: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
         
         trigger_system = TriggerSystem(project_path)
         
         if daemon:
-            console.print("🔄 Ejecutando como daemon en segundo plano...", style="yellow")
-            console.print("💡 El proceso continuará ejecutándose en background", style="blue")
-            console.print("🛑 Para detener: pkill -f 'pre-cursor supervisor trigger-monitor'", style="yellow")
+            _console().print("🔄 Ejecutando como daemon en segundo plano...", style="yellow")
+            _console().print("💡 El proceso continuará ejecutándose en background", style="blue")
+            _console().print("🛑 Para detener: pkill -f 'pre-cursor supervisor trigger-monitor'", style="yellow")
             
             # Ejecutar en segundo plano real
             import subprocess
@@ -871,23 +1170,23 @@ def trigger_monitor(project_path, interval, daemon, path):
                 cwd=project_path
             )
             
-            console.print(f"✅ Daemon iniciado con PID: [bold green]{process.pid}[/bold green]")
-            console.print(f"📁 Directorio: [bold blue]{project_path}[/bold blue]")
-            console.print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
-            console.print("📝 Logs disponibles en: logs/supervisor.log")
-            console.print("🔧 Para crear trigger: echo 'supervise' > .cursor/triggers/activate.trigger")
+            _console().print(f"✅ Daemon iniciado con PID: [bold green]{process.pid}[/bold green]")
+            _console().print(f"📁 Directorio: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
+            _console().print("📝 Logs disponibles en: logs/supervisor.log")
+            _console().print("🔧 Para crear trigger: echo 'supervise' > .cursor/triggers/activate.trigger")
             
         else:
-            console.print("🔄 Ejecutando monitoreo continuo...", style="yellow")
-            console.print("💡 Presiona Ctrl+C para detener", style="blue")
-            console.print("🤖 Supervisión automática habilitada", style="green")
+            _console().print("🔄 Ejecutando monitoreo continuo...", style="yellow")
+            _console().print("💡 Presiona Ctrl+C para detener", style="blue")
+            _console().print("🤖 Supervisión automática habilitada", style="green")
             trigger_system.run_continuous_monitoring(interval, auto_supervise=True)
             
     except ImportError as e:
-        console.print(f"❌ Error: Módulo no encontrado: {e}", style="red")
-        console.print("💡 Instala las dependencias: pip install watchdog psutil", style="yellow")
+        _console().print(f"❌ Error: Módulo no encontrado: {e}", style="red")
+        _console().print("💡 Instala las dependencias: pip install watchdog psutil", style="yellow")
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -908,9 +1207,9 @@ def create_trigger(project_path, path, action, content):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         from .trigger_system import TriggerSystem
@@ -918,12 +1217,12 @@ def create_trigger(project_path, path, action, content):
         trigger_system = TriggerSystem(project_path)
         trigger_system.create_trigger(action, content)
         
-        console.print(f"✅ Trigger creado: [bold green]{action}[/bold green]")
-        console.print(f"📁 Ubicación: [bold blue]{trigger_system.trigger_file}[/bold blue]")
-        console.print("💡 El sistema de monitoreo detectará este trigger automáticamente")
+        _console().print(f"✅ Trigger creado: [bold green]{action}[/bold green]")
+        _console().print(f"📁 Ubicación: [bold blue]{trigger_system.trigger_file}[/bold blue]")
+        _console().print("💡 El sistema de monitoreo detectará este trigger automáticamente")
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -941,9 +1240,9 @@ def trigger_status(project_path, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         from .trigger_system import TriggerSystem
@@ -951,21 +1250,21 @@ def trigger_status(project_path, path):
         trigger_system = TriggerSystem(project_path)
         status = trigger_system.get_status()
         
-        console.print(f"\n📊 Estado del Sistema de Triggers")
-        console.print(f"═══════════════════════════════════════════════════════════")
-        console.print(f"🎯 Rol: [bold blue]{status['role']}[/bold blue]")
-        console.print(f"📈 Estado: [bold green]{status['status']}[/bold green]")
-        console.print(f"🔄 Ciclos completados: [bold yellow]{status['cycle_count']}[/bold yellow]")
-        console.print(f"⏰ Última verificación: [bold blue]{status['last_check'] or 'Nunca'}[/bold blue]")
-        console.print(f"📋 Correcciones pendientes: [bold red]{status['pending_corrections']}[/bold red]")
-        console.print(f"✅ Correcciones aplicadas: [bold green]{status['applied_corrections']}[/bold green]")
+        _console().print(f"\n📊 Estado del Sistema de Triggers")
+        _console().print(f"═══════════════════════════════════════════════════════════")
+        _console().print(f"🎯 Rol: [bold blue]{status['role']}[/bold blue]")
+        _console().print(f"📈 Estado: [bold green]{status['status']}[/bold green]")
+        _console().print(f"🔄 Ciclos completados: [bold yellow]{status['cycle_count']}[/bold yellow]")
+        _console().print(f"⏰ Última verificación: [bold blue]{status['last_check'] or 'Nunca'}[/bold blue]")
+        _console().print(f"📋 Correcciones pendientes: [bold red]{status['pending_corrections']}[/bold red]")
+        _console().print(f"✅ Correcciones aplicadas: [bold green]{status['applied_corrections']}[/bold green]")
         trigger_color = 'green' if status['trigger_active'] else 'red'
         trigger_text = 'Sí' if status['trigger_active'] else 'No'
-        console.print(f"🔧 Trigger activo: [bold {trigger_color}]{trigger_text}[/bold {trigger_color}]")
-        console.print(f"═══════════════════════════════════════════════════════════")
+        _console().print(f"🔧 Trigger activo: [bold {trigger_color}]{trigger_text}[/bold {trigger_color}]")
+        _console().print(f"═══════════════════════════════════════════════════════════")
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -987,22 +1286,22 @@ def test_supervisor(project_path, interval, daemon, path):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         from .test_supervisor import TestSupervisor
         
-        console.print(f"\n🧪 Iniciando supervisión especializada de tests en: [bold blue]{project_path}[/bold blue]")
-        console.print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
+        _console().print(f"\n🧪 Iniciando supervisión especializada de tests en: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
         
         test_supervisor = TestSupervisor(project_path)
         
         if daemon:
-            console.print("🔄 Ejecutando como daemon en segundo plano...", style="yellow")
-            console.print("💡 El proceso continuará ejecutándose en background", style="blue")
-            console.print("🛑 Para detener: pkill -f 'pre-cursor supervisor test-supervisor'", style="yellow")
+            _console().print("🔄 Ejecutando como daemon en segundo plano...", style="yellow")
+            _console().print("💡 El proceso continuará ejecutándose en background", style="blue")
+            _console().print("🛑 Para detener: pkill -f 'pre-cursor supervisor test-supervisor'", style="yellow")
             
             # Ejecutar en segundo plano real
             import subprocess
@@ -1025,14 +1324,14 @@ def test_supervisor(project_path, interval, daemon, path):
                 cwd=project_path
             )
             
-            console.print(f"✅ Daemon de tests iniciado con PID: [bold green]{process.pid}[/bold green]")
-            console.print(f"📁 Directorio: [bold blue]{project_path}[/bold blue]")
-            console.print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
-            console.print("📝 Logs disponibles en: .cursor/logs/test_supervisor.json")
+            _console().print(f"✅ Daemon de tests iniciado con PID: [bold green]{process.pid}[/bold green]")
+            _console().print(f"📁 Directorio: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"⏱️ Intervalo: [bold green]{interval}[/bold green] segundos")
+            _console().print("📝 Logs disponibles en: .cursor/logs/test_supervisor.json")
             
         else:
-            console.print("🔄 Ejecutando supervisión de tests...", style="yellow")
-            console.print("💡 Presiona Ctrl+C para detener", style="blue")
+            _console().print("🔄 Ejecutando supervisión de tests...", style="yellow")
+            _console().print("💡 Presiona Ctrl+C para detener", style="blue")
             
             # Ejecutar supervisión continua
             try:
@@ -1040,42 +1339,42 @@ def test_supervisor(project_path, interval, daemon, path):
                     result = test_supervisor.run_test_supervision()
                     
                     if result["total_issues"] > 0:
-                        console.print(f"\n🧪 Test Supervisor - {result['total_issues']} problemas encontrados")
+                        _console().print(f"\n🧪 Test Supervisor - {result['total_issues']} problemas encontrados")
                         for issue in result["issues"]:
                             severity_color = "red" if issue.severity == "high" else "yellow" if issue.severity == "medium" else "blue"
-                            console.print(f"  • [{severity_color}]{issue.severity.upper()}[/{severity_color}]: {issue.description}")
-                            console.print(f"    💡 {issue.suggestion}")
+                            _console().print(f"  • [{severity_color}]{issue.severity.upper()}[/{severity_color}]: {issue.description}")
+                            _console().print(f"    💡 {issue.suggestion}")
                         
                         # Mostrar correcciones aplicadas
                         if "corrections_applied" in result and result["corrections_applied"]["total_corrections"] > 0:
                             corrections = result["corrections_applied"]
-                            console.print(f"\n🔧 Correcciones aplicadas: {corrections['successful']}/{corrections['total_corrections']}")
+                            _console().print(f"\n🔧 Correcciones aplicadas: {corrections['successful']}/{corrections['total_corrections']}")
                             for change in corrections.get("changes_made", []):
-                                console.print(f"  ✅ {change}")
+                                _console().print(f"  ✅ {change}")
                         
                         # Mostrar resultados de validación con LLM
                         if "validation_results" in result:
                             validation = result["validation_results"]
-                            console.print(f"\n🤖 Validación con LLM:")
-                            console.print(f"  📊 Tests analizados: {validation.get('total_analyzed', 0)}")
-                            console.print(f"  ✅ Tests válidos: {len(validation.get('valid_tests', []))}")
-                            console.print(f"  ❌ Tests inválidos: {len(validation.get('invalid_tests', []))}")
-                            console.print(f"  🗑️ Tests vacíos: {len(validation.get('empty_tests', []))}")
+                            _console().print(f"\n🤖 Validación con LLM:")
+                            _console().print(f"  📊 Tests analizados: {validation.get('total_analyzed', 0)}")
+                            _console().print(f"  ✅ Tests válidos: {len(validation.get('valid_tests', []))}")
+                            _console().print(f"  ❌ Tests inválidos: {len(validation.get('invalid_tests', []))}")
+                            _console().print(f"  🗑️ Tests vacíos: {len(validation.get('empty_tests', []))}")
                             
                             if validation.get("cleanup_results"):
                                 cleanup = validation["cleanup_results"]
-                                console.print(f"  🧹 Archivos eliminados: {len(cleanup.get('files_removed', []))}")
-                                console.print(f"  📁 Archivo unificado creado: {'Sí' if cleanup.get('unified_file_created') else 'No'}")
+                                _console().print(f"  🧹 Archivos eliminados: {len(cleanup.get('files_removed', []))}")
+                                _console().print(f"  📁 Archivo unificado creado: {'Sí' if cleanup.get('unified_file_created') else 'No'}")
                     else:
-                        console.print("✅ Tests en buen estado - no se encontraron problemas")
+                        _console().print("✅ Tests en buen estado - no se encontraron problemas")
                     
                     time.sleep(interval)
                     
             except KeyboardInterrupt:
-                console.print("\n🛑 Supervisión de tests detenida por el usuario")
+                _console().print("\n🛑 Supervisión de tests detenida por el usuario")
             
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -1096,72 +1395,72 @@ def validate_tests(project_path, path, cleanup):
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
         from .test_validator import TestValidator
         
-        console.print(f"\n🤖 Validando tests con LLM en: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n🤖 Validando tests con LLM en: [bold blue]{project_path}[/bold blue]")
         
         validator = TestValidator(project_path)
         results = validator.validate_tests_with_llm()
         
         # Mostrar resultados
-        console.print(f"\n📊 Resultados de validación:")
-        console.print(f"  📁 Tests analizados: [bold green]{results['total_analyzed']}[/bold green]")
-        console.print(f"  ✅ Tests válidos: [bold green]{len(results['valid_tests'])}[/bold green]")
-        console.print(f"  ❌ Tests inválidos: [bold red]{len(results['invalid_tests'])}[/bold red]")
-        console.print(f"  🗑️ Tests vacíos: [bold yellow]{len(results['empty_tests'])}[/bold yellow]")
+        _console().print(f"\n📊 Resultados de validación:")
+        _console().print(f"  📁 Tests analizados: [bold green]{results['total_analyzed']}[/bold green]")
+        _console().print(f"  ✅ Tests válidos: [bold green]{len(results['valid_tests'])}[/bold green]")
+        _console().print(f"  ❌ Tests inválidos: [bold red]{len(results['invalid_tests'])}[/bold red]")
+        _console().print(f"  🗑️ Tests vacíos: [bold yellow]{len(results['empty_tests'])}[/bold yellow]")
         
         # Mostrar detalles de tests inválidos
         if results['invalid_tests']:
-            console.print(f"\n❌ Tests inválidos encontrados:")
+            _console().print(f"\n❌ Tests inválidos encontrados:")
             for test in results['invalid_tests']:
-                console.print(f"  • [red]{Path(test['file']).name}[/red]: {test['reason']}")
+                _console().print(f"  • [red]{Path(test['file']).name}[/red]: {test['reason']}")
                 if test.get('suggestions'):
                     for suggestion in test['suggestions']:
-                        console.print(f"    💡 {suggestion}")
+                        _console().print(f"    💡 {suggestion}")
         
         # Mostrar detalles de tests vacíos
         if results['empty_tests']:
-            console.print(f"\n🗑️ Tests vacíos encontrados:")
+            _console().print(f"\n🗑️ Tests vacíos encontrados:")
             for test in results['empty_tests']:
-                console.print(f"  • [yellow]{Path(test['file']).name}[/yellow]: {test['reason']}")
+                _console().print(f"  • [yellow]{Path(test['file']).name}[/yellow]: {test['reason']}")
         
         # Mostrar tests válidos
         if results['valid_tests']:
-            console.print(f"\n✅ Tests válidos encontrados:")
+            _console().print(f"\n✅ Tests válidos encontrados:")
             for test in results['valid_tests']:
-                console.print(f"  • [green]{Path(test['file']).name}[/green] (Calidad: {test['quality_score']}/10)")
-                console.print(f"    Funciones: {', '.join(test['functions'])}")
+                _console().print(f"  • [green]{Path(test['file']).name}[/green] (Calidad: {test['quality_score']}/10)")
+                _console().print(f"    Funciones: {', '.join(test['functions'])}")
         
         # Limpiar si se solicita
         if cleanup:
-            console.print(f"\n🧹 Limpiando tests inválidos y vacíos...")
+            _console().print(f"\n🧹 Limpiando tests inválidos y vacíos...")
             cleanup_results = validator.cleanup_invalid_tests(results)
             
-            console.print(f"  🗑️ Archivos eliminados: [bold red]{len(cleanup_results['files_removed'])}[/bold red]")
+            _console().print(f"  🗑️ Archivos eliminados: [bold red]{len(cleanup_results['files_removed'])}[/bold red]")
             for file_path in cleanup_results['files_removed']:
-                console.print(f"    • {Path(file_path).name}")
+                _console().print(f"    • {Path(file_path).name}")
             
-            console.print(f"  📁 Archivos mantenidos: [bold green]{len(cleanup_results['files_kept'])}[/bold green]")
+            _console().print(f"  📁 Archivos mantenidos: [bold green]{len(cleanup_results['files_kept'])}[/bold green]")
             for file_path in cleanup_results['files_kept']:
-                console.print(f"    • {Path(file_path).name}")
+                _console().print(f"    • {Path(file_path).name}")
             
             if cleanup_results.get('unified_file_created'):
-                console.print(f"  ✅ Archivo unificado creado: [bold green]test_unified.py[/bold green]")
+                _console().print(f"  ✅ Archivo unificado creado: [bold green]test_unified.py[/bold green]")
             
             if cleanup_results.get('errors'):
-                console.print(f"  ❌ Errores durante la limpieza:")
+                _console().print(f"  ❌ Errores durante la limpieza:")
                 for error in cleanup_results['errors']:
-                    console.print(f"    • {error}")
+                    _console().print(f"    • {error}")
         
-        console.print(f"\n📝 Logs guardados en: .cursor/logs/test_validator.json")
+        _console().print(f"\n📝 Logs guardados en: .cursor/logs/test_validator.json")
         
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -1175,15 +1474,17 @@ def instructions(project_path, path):
     pre-cursor supervisor instructions -p  # Usar directorio actual
     """
     try:
+        from .cursor_supervisor import CursorSupervisor
+        
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n📋 Generando instrucciones para: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n📋 Generando instrucciones para: [bold blue]{project_path}[/bold blue]")
         
         # Crear supervisor con integración bidireccional
         supervisor = CursorSupervisor(project_path, enable_bidirectional=True)
@@ -1197,21 +1498,21 @@ def instructions(project_path, path):
             instructions = supervisor.instruction_generator.generate_instructions(report)
             
             if instructions:
-                console.print(f"\n📝 Generadas {len(instructions)} instrucciones para Cursor CLI")
+                _console().print(f"\n📝 Generadas {len(instructions)} instrucciones para Cursor CLI")
                 
                 # Guardar instrucciones
                 instructions_file = supervisor.instruction_generator.save_instructions(instructions)
-                console.print(f"💾 Instrucciones guardadas en: [bold green]{instructions_file}[/bold green]")
+                _console().print(f"💾 Instrucciones guardadas en: [bold green]{instructions_file}[/bold green]")
                 
                 # Mostrar resumen de instrucciones
                 _display_instructions_summary(instructions)
             else:
-                console.print("ℹ️ No se generaron instrucciones para los problemas detectados", style="blue")
+                _console().print("ℹ️ No se generaron instrucciones para los problemas detectados", style="blue")
         else:
-            console.print("✅ No se encontraron problemas - no se generaron instrucciones", style="green")
+            _console().print("✅ No se encontraron problemas - no se generaron instrucciones", style="green")
             
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -1225,15 +1526,17 @@ def apply(project_path, path):
     pre-cursor supervisor apply -p  # Usar directorio actual
     """
     try:
+        from .cursor_supervisor import CursorSupervisor
+        
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n⚡ Aplicando correcciones automáticas en: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n⚡ Aplicando correcciones automáticas en: [bold blue]{project_path}[/bold blue]")
         
         # Crear supervisor con integración bidireccional
         supervisor = CursorSupervisor(project_path, enable_bidirectional=True)
@@ -1242,13 +1545,14 @@ def apply(project_path, path):
         report = supervisor.check_project_health()
         
         if report.issues_found:
-            console.print(f"🔍 Detectados {len(report.issues_found)} problemas")
+            _console().print(f"🔍 Detectados {len(report.issues_found)} problemas")
             
             # Aplicar correcciones automáticas
+            from rich.progress import Progress, SpinnerColumn, TextColumn
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                console=console,
+                console=_console(),
             ) as progress:
                 task = progress.add_task("Aplicando correcciones...", total=None)
                 
@@ -1258,17 +1562,17 @@ def apply(project_path, path):
             
             # Mostrar resumen
             summary = supervisor.cursor_interface.get_execution_summary()
-            console.print(f"\n📊 Resumen de ejecución:")
-            console.print(f"  • Total de ejecuciones: {summary['total_executions']}")
-            console.print(f"  • Exitosas: {summary['successful_executions']}")
-            console.print(f"  • Fallidas: {summary['failed_executions']}")
-            console.print(f"  • Tasa de éxito: {summary['success_rate']:.1f}%")
+            _console().print(f"\n📊 Resumen de ejecución:")
+            _console().print(f"  • Total de ejecuciones: {summary['total_executions']}")
+            _console().print(f"  • Exitosas: {summary['successful_executions']}")
+            _console().print(f"  • Fallidas: {summary['failed_executions']}")
+            _console().print(f"  • Tasa de éxito: {summary['success_rate']:.1f}%")
             
         else:
-            console.print("✅ No se encontraron problemas - no se aplicaron correcciones", style="green")
+            _console().print("✅ No se encontraron problemas - no se aplicaron correcciones", style="green")
             
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @supervisor.command()
 @click.argument('project_path', type=click.Path(exists=True), required=False)
@@ -1281,16 +1585,20 @@ def metrics(project_path, path):
     pre-cursor supervisor metrics /path/to/project
     pre-cursor supervisor metrics -p  # Usar directorio actual
     """
+    from rich.table import Table
+    
     try:
+        from .feedback_processor import FeedbackProcessor
+        
         # Determinar path del proyecto
         if path:
             project_path = os.getcwd()
-            console.print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
+            _console().print(f"📍 Usando directorio actual: [bold blue]{project_path}[/bold blue]")
         elif not project_path:
-            console.print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
+            _console().print("❌ Error: Debes especificar el path del proyecto o usar -p para directorio actual", style="red")
             return
         
-        console.print(f"\n📊 Métricas de integración bidireccional para: [bold blue]{project_path}[/bold blue]")
+        _console().print(f"\n📊 Métricas de integración bidireccional para: [bold blue]{project_path}[/bold blue]")
         
         # Crear feedback processor
         feedback_processor = FeedbackProcessor(project_path)
@@ -1313,11 +1621,11 @@ def metrics(project_path, path):
             table.add_row("Tiempo total", f"{metrics.get('total_execution_time', 0):.2f}s")
             table.add_row("Tiempo promedio", f"{metrics.get('average_execution_time', 0):.2f}s")
             
-            console.print(table)
+            _console().print(table)
             
             # Mostrar métricas por acción
             if metrics.get('actions'):
-                console.print("\n📈 Métricas por Acción:")
+                _console().print("\n📈 Métricas por Acción:")
                 action_table = Table()
                 action_table.add_column("Acción", style="cyan")
                 action_table.add_column("Total", style="blue")
@@ -1335,13 +1643,13 @@ def metrics(project_path, path):
                         f"{success_rate:.1f}%"
                     )
                 
-                console.print(action_table)
+                _console().print(action_table)
             
         else:
-            console.print("ℹ️ No se encontraron métricas - ejecuta correcciones automáticas primero", style="blue")
+            _console().print("ℹ️ No se encontraron métricas - ejecuta correcciones automáticas primero", style="blue")
             
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        _console().print(f"❌ Error: {e}", style="red")
 
 @cli.command()
 @click.option('--examples', is_flag=True, help='Mostrar ejemplos de uso')
@@ -1349,204 +1657,255 @@ def info(examples):
     """
     ℹ️ Información sobre Pre-Cursor
     """
-    console.print(Panel.fit(
-        "[bold blue]🚀 Pre-Cursor v1.0.2[/bold blue]\n\n"
-        "Generador de proyectos optimizado para agentes de IA\n"
-        "Crea estructuras completas con metodología establecida\n\n"
-        "[bold green]Características:[/bold green]\n"
-        "• Soporte para múltiples lenguajes y frameworks\n"
-        "• Plantillas profesionales y documentación completa\n"
-        "• Integración con Git y herramientas de desarrollo\n"
-        "• Optimizado para trabajo con agentes de IA\n"
-        "• Supervisión automática con Cursor Supervisor\n\n"
-        "[bold yellow]Autor:[/bold yellow] Assiz Alcaraz Baxter\n"
-        "[bold yellow]Licencia:[/bold yellow] MIT",
-        title="Información del Proyecto"
-    ))
+    _console().print(_info_panel())
     
     if examples:
-        console.print("\n📚 Ejemplos de uso:")
-        console.print("• pre-cursor create mi-proyecto")
-        console.print("• pre-cursor create mi-api --type 'Python Web App (FastAPI)'")
-        console.print("• pre-cursor template --type 'Python Library'")
-        console.print("• pre-cursor generate mi_config.json")
-        console.print("• pre-cursor supervisor start /path/to/project")
-        console.print("• pre-cursor supervisor start -p  # Usar directorio actual")
-        console.print("• pre-cursor supervisor status /path/to/project")
-        console.print("• pre-cursor supervisor config -p --interval 600")
+        _console().print(_EXAMPLES_TEXT)
+
+@lru_cache(maxsize=None)
+def _info_panel() -> "Panel":
+    """
+    Panel de ``info``, construido una sola vez.
+    
+    El markup se convierte a ``Text`` al crearlo, así Rich no vuelve a
+    parsear las etiquetas en cada render.
+    """
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    return Panel.fit(Text.from_markup(_INFO_MARKUP), title="Información del Proyecto")
 
 def _validate_project_name(name):
     """Validar nombre del proyecto."""
-    import re
-    return bool(re.match(r'^[a-z0-9_]+$', name))
+    return _PROJECT_NAME_RE.match(name) is not None
 
-def _get_default_project_path(project_name):
-    """Obtener ruta por defecto para el proyecto."""
-    import os
-    home = os.path.expanduser("~")
-    current_dir = os.getcwd()
+@lru_cache(maxsize=1)
+def _get_default_project_path(project_name: str) -> Path:
+    """
+    Obtener ruta por defecto para el proyecto.
+    
+    Se cachea: dentro de una misma invocación el directorio actual y los
+    permisos no cambian, así que no hace falta repetir las comprobaciones.
+    """
+    current_dir = Path.cwd()
     
     # Priorizar el directorio actual como primera opción
     if os.access(current_dir, os.W_OK):
-        return os.path.join(current_dir, project_name)
+        return current_dir / project_name
     
     # Si estamos en el directorio pre_Cursor, usar directorio padre
-    if current_dir.endswith('pre_Cursor') or current_dir.endswith('pre-cursor'):
-        parent_dir = os.path.dirname(current_dir)
+    if current_dir.name.endswith(('pre_Cursor', 'pre-cursor')):
+        parent_dir = current_dir.parent
         if os.access(parent_dir, os.W_OK):
-            return os.path.join(parent_dir, project_name)
-    
-    # Intentar directorios comunes de proyectos
-    possible_paths = [
-        os.path.join(home, "Desktop"),
-        os.path.join(home, "Documents", "Projects"),
-        os.path.join(home, "Projects"),
-        os.path.join(home, "Developer"),
-        os.path.join(home, "Documents")
-    ]
-    
+            return parent_dir / project_name
+    
+    # Intentar directorios comunes de proyectos (el home solo hace falta aquí)
+    home = Path.home()
+    possible_paths = (
+        home / "Desktop",
+        home / "Documents" / "Projects",
+        home / "Projects",
+        home / "Developer",
+        home / "Documents",
+    )
+    
+    # os.access devuelve False para rutas inexistentes: basta una llamada
     for path in possible_paths:
-        if os.path.exists(path) and os.access(path, os.W_OK):
-            return os.path.join(path, project_name)
+        if os.access(path, os.W_OK):
+            return path / project_name
     
     # Fallback al directorio actual
-    return os.path.join(current_dir, project_name)
+    return current_dir / project_name
+
+@lru_cache(maxsize=None)
+def _which(command: str) -> Optional[str]:
+    """
+    Localizar un ejecutable en el PATH una sola vez por proceso.
+    
+    Args:
+        command: Nombre del ejecutable
+        
+    Returns:
+        Ruta completa del ejecutable o None si no está instalado
+    """
+    import shutil
+    return shutil.which(command)
 
-def _open_in_cursor(project_path):
+def _open_in_cursor(project_path: Path):
     """Abrir proyecto en Cursor con verificación robusta."""
     import subprocess
-    import os
-    import shutil
     
-    if not os.path.exists(project_path):
-        console.print(f"❌ Error: Directorio {project_path} no existe", style="red")
+    if not project_path.exists():
+        _console().print(f"❌ Error: Directorio {project_path} no existe", style="red")
         return
     
-    console.print(f"\n🖥️ Abriendo proyecto en Cursor...")
+    _console().print(f"\n🖥️ Abriendo proyecto en Cursor...")
+    
+    # Localizar los editores una sola vez, sin lanzar procesos que fallen
+    editors = [
+        (command, label, _which(command))
+        for command, label in (("cursor", "Cursor"), ("code", "VS Code"))
+    ]
     
-    # Verificar si cursor está disponible
-    if shutil.which("cursor"):
+    for command, label, executable in editors:
+        if executable is None:
+            continue
         try:
-            subprocess.run(["cursor", project_path], check=True)
-            console.print("✅ Proyecto abierto en Cursor", style="green")
+            subprocess.run(
+                [executable, project_path], check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            _console().print(f"✅ Proyecto abierto en {label}", style="green")
             return
-        except subprocess.CalledProcessError as e:
-            console.print(f"⚠️ Error al abrir con Cursor: {e}", style="yellow")
-    
-    # Fallback a VS Code
-    if shutil.which("code"):
+        except (subprocess.CalledProcessError, OSError) as e:
+            _console().print(f"⚠️ Error al abrir con {label}: {e}", style="yellow")
+    
+    # Fallback a abrir directorio en explorador (solo si el comando existe)
+    if os.name == 'nt':  # Windows
+        opener = _which("explorer")
+    elif sys.platform == 'darwin':  # macOS
+        opener = _which("open")
+    else:  # Linux y otros POSIX
+        opener = _which("xdg-open")
+    
+    if opener is not None:
         try:
-            subprocess.run(["code", project_path], check=True)
-            console.print("✅ Proyecto abierto en VS Code", style="green")
+            subprocess.run(
+                [opener, project_path], check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            _console().print("✅ Directorio abierto en el explorador", style="green")
             return
-        except subprocess.CalledProcessError as e:
-            console.print(f"⚠️ Error al abrir con VS Code: {e}", style="yellow")
-    
-    # Fallback a abrir directorio en explorador
-    try:
-        if os.name == 'nt':  # Windows
-            subprocess.run(["explorer", project_path], check=True)
-        elif os.name == 'posix':  # macOS/Linux
-            subprocess.run(["open", project_path], check=True)
-        console.print("✅ Directorio abierto en el explorador", style="green")
-        return
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        console.print(f"⚠️ Error al abrir explorador: {e}", style="yellow")
+        except (subprocess.CalledProcessError, OSError) as e:
+            _console().print(f"⚠️ Error al abrir explorador: {e}", style="yellow")
     
     # Si todo falla, mostrar instrucciones manuales
-    console.print("⚠️ No se pudo abrir automáticamente. Abre manualmente:", style="yellow")
-    console.print(f"   cd {project_path}")
-    if shutil.which("cursor"):
-        console.print("   cursor .")
-    elif shutil.which("code"):
-        console.print("   code .")
+    _console().print("⚠️ No se pudo abrir automáticamente. Abre manualmente:", style="yellow")
+    _console().print(f"   cd {project_path}")
+    available = next((command for command, _, executable in editors if executable), None)
+    if available:
+        _console().print(f"   {available} .")
     else:
-        console.print("   # Instala Cursor o VS Code para abrir automáticamente")
+        _console().print("   # Instala Cursor o VS Code para abrir automáticamente")
+
+def _batch_prompt(fields: List[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    Pedir varios campos seguidos a partir de una única tabla de valores por defecto.
+    
+    La tabla se dibuja una sola vez con Rich; cada respuesta se lee con
+    ``sys.stdin.readline`` tras un prompt en texto plano, sin pasar por el
+    renderizado de ``Prompt.ask`` en cada campo.
+    
+    Args:
+        fields: Pares (campo, valor por defecto) en el orden en que se piden
+        
+    Returns:
+        Dict campo -> respuesta (el valor por defecto si se deja vacía)
+    """
+    from rich.table import Table
+    
+    table = Table(show_header=True, header_style="bold blue")
+    table.add_column("Campo", style="cyan")
+    table.add_column("Por defecto", style="white")
+    for label, default in fields:
+        table.add_row(label, default)
+    _console().print(table)
+    _console().print("Pulsa Enter para aceptar el valor por defecto", style="dim")
+    
+    answers = {}
+    for label, default in fields:
+        sys.stdout.write(f"{label}: ")
+        sys.stdout.flush()
+        answers[label] = sys.stdin.readline().strip() or default
+    return answers
 
 def _interactive_create(project_name, path, force=False):
     """Modo interactivo mejorado con Rich."""
-    import os
-    console.print("\n🎯 Modo interactivo - Configuración del proyecto")
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+    _console().print("\n🎯 Modo interactivo - Configuración del proyecto")
     
     # Seleccionar tipo de proyecto
-    project_types = [
-        "Python Library", "Python CLI Tool", "Python Web App (Flask)",
-        "Python Web App (Django)", "Python Web App (FastAPI)",
-        "Python Data Science", "Python ML/AI", "C++ Project",
-        "Node.js Project", "TD_MCP Project", "Otro"
-    ]
+    project_types = PROJECT_TYPES
     
-    console.print("\n📋 Selecciona el tipo de proyecto:")
+    _console().print("\n📋 Selecciona el tipo de proyecto:")
     for i, ptype in enumerate(project_types, 1):
-        console.print(f"  {i}. {ptype}")
-    
-    choice = Prompt.ask("Tipo de proyecto", default="1")
+        _console().print(f"  {i}. {ptype}")
+    
+    # Tipo e información adicional en un solo formulario
+    answers = _batch_prompt([
+        ("Tipo de proyecto", "1"),
+        ("Descripción del proyecto", "Proyecto generado con Pre-Cursor"),
+        ("Autor", "Tu Nombre"),
+        ("Email", "tu@email.com"),
+    ])
     try:
-        project_type = project_types[int(choice) - 1]
+        project_type = project_types[int(answers["Tipo de proyecto"]) - 1]
     except (ValueError, IndexError):
         project_type = project_types[0]
     
-    # Obtener información adicional
-    description = Prompt.ask("Descripción del proyecto", default="Proyecto generado con Pre-Cursor")
-    author = Prompt.ask("Autor", default="Tu Nombre")
-    email = Prompt.ask("Email", default="tu@email.com")
+    description = answers["Descripción del proyecto"]
+    author = answers["Autor"]
+    email = answers["Email"]
     
     # Determinar ruta del proyecto
     if not path:
-        # Mostrar opciones de ruta con directorio actual como primera opción
-        current_dir = os.getcwd()
-        project_path_current = os.path.join(current_dir, project_name)
+        # Mostrar opciones de ruta con directorio actual como primera opción.
+        # El home y el directorio actual se resuelven una vez por menú
+        home = Path.home()
+        project_path_current = Path.cwd() / project_name
+        location_paths = {
+            "1": project_path_current,
+            "2": home / 'Desktop' / project_name,
+            "3": home / 'Documents' / 'Projects' / project_name,
+            "4": home / 'Developer' / project_name,
+        }
         
-        console.print(f"\n📍 Selecciona la ubicación del proyecto:")
-        console.print(f"  1. [bold green]Directorio actual[/bold green] - {project_path_current}")
-        console.print(f"  2. [bold blue]Desktop[/bold blue] - {os.path.join(os.path.expanduser('~'), 'Desktop', project_name)}")
-        console.print(f"  3. [bold blue]Documents/Projects[/bold blue] - {os.path.join(os.path.expanduser('~'), 'Documents', 'Projects', project_name)}")
-        console.print(f"  4. [bold blue]Developer[/bold blue] - {os.path.join(os.path.expanduser('~'), 'Developer', project_name)}")
-        console.print(f"  5. [bold yellow]Personalizada[/bold yellow] - Especificar ruta manualmente")
+        _console().print(
+            f"\n📍 Selecciona la ubicación del proyecto:\n"
+            f"  1. [bold green]Directorio actual[/bold green] - {location_paths['1']}\n"
+            f"  2. [bold blue]Desktop[/bold blue] - {location_paths['2']}\n"
+            f"  3. [bold blue]Documents/Projects[/bold blue] - {location_paths['3']}\n"
+            f"  4. [bold blue]Developer[/bold blue] - {location_paths['4']}\n"
+            f"  5. [bold yellow]Personalizada[/bold yellow] - Especificar ruta manualmente"
+        )
         
         choice = Prompt.ask("Selecciona una opción", default="1")
         
-        if choice == "1":
-            path = project_path_current
-        elif choice == "2":
-            path = os.path.join(os.path.expanduser('~'), 'Desktop', project_name)
-        elif choice == "3":
-            path = os.path.join(os.path.expanduser('~'), 'Documents', 'Projects', project_name)
-        elif choice == "4":
-            path = os.path.join(os.path.expanduser('~'), 'Developer', project_name)
-        elif choice == "5":
-            path = Prompt.ask("Ingresa la ruta completa del proyecto", default=project_path_current)
+        if choice == "5":
+            path = Path(Prompt.ask(
+                "Ingresa la ruta completa del proyecto", default=str(project_path_current)
+            )).expanduser()
         else:
-            path = project_path_current
+            path = location_paths.get(choice, project_path_current)
     
-    # Verificar si el directorio ya existe
-    if os.path.exists(path) and not force:
-        console.print(f"⚠️ El directorio [bold yellow]{path}[/bold yellow] ya existe.", style="yellow")
+    # Verificar si el directorio ya existe (un solo stat)
+    path_exists = path.exists()
+    if path_exists and not force:
+        _console().print(f"⚠️ El directorio [bold yellow]{path}[/bold yellow] ya existe.", style="yellow")
         if not Confirm.ask("¿Continuar y sobrescribir el contenido existente?"):
-            console.print("❌ Operación cancelada", style="red")
+            _console().print("❌ Operación cancelada", style="red")
             return None
-    elif os.path.exists(path) and force:
-        console.print(f"🔄 Forzando creación en directorio existente: [bold yellow]{path}[/bold yellow]", style="yellow")
+    elif path_exists and force:
+        _console().print(f"🔄 Forzando creación en directorio existente: [bold yellow]{path}[/bold yellow]", style="yellow")
     
     # Confirmar creación
-    console.print(f"\n📋 Resumen del proyecto:")
-    console.print(f"   📝 Nombre: [bold blue]{project_name}[/bold blue]")
-    console.print(f"   🔧 Tipo: [bold green]{project_type}[/bold green]")
-    console.print(f"   📖 Descripción: [bold white]{description}[/bold white]")
-    console.print(f"   📍 Ruta: [bold green]{path}[/bold green]")
+    _console().print(f"\n📋 Resumen del proyecto:")
+    _console().print(f"   📝 Nombre: [bold blue]{project_name}[/bold blue]")
+    _console().print(f"   🔧 Tipo: [bold green]{project_type}[/bold green]")
+    _console().print(f"   📖 Descripción: [bold white]{description}[/bold white]")
+    _console().print(f"   📍 Ruta: [bold green]{path}[/bold green]")
     
-    if not force and not Confirm.ask(f"\n¿Crear proyecto '{project_name}'?"):
-        console.print("❌ Operación cancelada", style="red")
-        return None
-    elif force or Confirm.ask(f"\n¿Crear proyecto '{project_name}'?"):
+    if force or Confirm.ask(f"\n¿Crear proyecto '{project_name}'?"):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             task = progress.add_task("Generando proyecto...", total=None)
             
-            generator = ProjectGenerator()
+            generator = _get_generator()
             # Crear configuración temporal
             config_data = {
                 "project_name": project_name,
@@ -1559,49 +1918,33 @@ def _interactive_create(project_name, path, force=False):
             }
             
             # Generar proyecto
-            import tempfile
-            import json
-            from pathlib import Path
-            
-            # Crear archivo temporal de configuración
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(config_data, f, indent=2)
-                temp_config_path = f.name
-            
             try:
-                generator.generate_project_from_config(Path(temp_config_path), Path(path))
+                generator.generate_project_from_dict(config_data, path)
                 progress.update(task, description="✅ Proyecto generado!")
             except Exception as e:
                 progress.update(task, description="❌ Error en generación")
-                console.print(f"\n❌ Error al generar el proyecto: {e}", style="red")
-                console.print("🔧 Verifica los permisos y la configuración", style="yellow")
+                _console().print(f"\n❌ Error al generar el proyecto: {e}", style="red")
+                _console().print("🔧 Verifica los permisos y la configuración", style="yellow")
                 return None
-            finally:
-                # Limpiar archivo temporal
-                import os
-                try:
-                    os.unlink(temp_config_path)
-                except OSError:
-                    pass  # Ignorar errores al limpiar archivo temporal
         
-        console.print(f"\n🎉 ¡Proyecto '{project_name}' creado exitosamente!", style="green")
+        _console().print(f"\n🎉 ¡Proyecto '{project_name}' creado exitosamente!", style="green")
         
         # Mostrar información del proyecto
         info_table = Table(show_header=False, box=None, padding=(0, 1))
         info_table.add_column(style="bold cyan", width=12)
         info_table.add_column(style="white")
         
-        info_table.add_row("📁 Ubicación:", path)
+        info_table.add_row("📁 Ubicación:", str(path))
         info_table.add_row("📝 Descripción:", description)
         info_table.add_row("🔧 Tipo:", project_type)
         info_table.add_row("👤 Autor:", author)
         info_table.add_row("📧 Email:", email)
         info_table.add_row("📅 Creado:", "Hoy")
         
-        console.print(info_table)
+        _console().print(info_table)
         
         # Mostrar próximos pasos detallados
-        console.print(f"\n🚀 Próximos pasos:")
+        _console().print(f"\n🚀 Próximos pasos:")
         steps_table = Table(show_header=False, box=None, padding=(0, 1))
         steps_table.add_column(style="bold yellow", width=3)
         steps_table.add_column(style="white")
@@ -1612,34 +1955,36 @@ def _interactive_create(project_name, path, force=False):
         steps_table.add_row("4️⃣", "cursor .  # o code .")
         steps_table.add_row("5️⃣", "¡Empieza a desarrollar!")
         
-        console.print(steps_table)
+        _console().print(steps_table)
         
         return path
     else:
-        console.print("❌ Operación cancelada", style="red")
+        _console().print("❌ Operación cancelada", style="red")
         return None
 
 def _direct_create(project_name, description, path, project_type, force=False):
     """Modo directo mejorado."""
-    import os
-    generator = ProjectGenerator()
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+    generator = _get_generator()
     
     # Determinar ruta del proyecto
     if not path:
         path = _get_default_project_path(project_name)
     
-    # Verificar si el directorio ya existe
-    if os.path.exists(path) and not force:
-        console.print(f"⚠️ El directorio [bold yellow]{path}[/bold yellow] ya existe.", style="yellow")
+    # Verificar si el directorio ya existe (un solo stat)
+    path_exists = path.exists()
+    if path_exists and not force:
+        _console().print(f"⚠️ El directorio [bold yellow]{path}[/bold yellow] ya existe.", style="yellow")
         if not Confirm.ask("¿Continuar y sobrescribir el contenido existente?"):
-            console.print("❌ Operación cancelada", style="red")
+            _console().print("❌ Operación cancelada", style="red")
             return None
-    elif os.path.exists(path) and force:
-        console.print(f"🔄 Forzando creación en directorio existente: [bold yellow]{path}[/bold yellow]", style="yellow")
+    elif path_exists and force:
+        _console().print(f"🔄 Forzando creación en directorio existente: [bold yellow]{path}[/bold yellow]", style="yellow")
     
     # Solicitar descripción si no se proporciona
     if not description:
-        console.print(f"\n📝 Descripción para el proyecto '{project_name}':")
+        _console().print(f"\n📝 Descripción para el proyecto '{project_name}':")
         description = Prompt.ask("Descripción", default=f"Proyecto {project_name} generado con Pre-Cursor")
     
     # Usar tipo por defecto si no se proporciona
@@ -1647,76 +1992,57 @@ def _direct_create(project_name, description, path, project_type, force=False):
         project_type = "Python Library"
     
     # Mostrar resumen y confirmar
-    console.print(f"\n📋 Resumen del proyecto:")
-    console.print(f"   📝 Nombre: [bold blue]{project_name}[/bold blue]")
-    console.print(f"   📖 Descripción: [bold white]{description}[/bold white]")
-    console.print(f"   🔧 Tipo: [bold green]{project_type}[/bold green]")
-    console.print(f"   📍 Ubicación: [bold green]{path}[/bold green]")
+    _console().print(f"\n📋 Resumen del proyecto:")
+    _console().print(f"   📝 Nombre: [bold blue]{project_name}[/bold blue]")
+    _console().print(f"   📖 Descripción: [bold white]{description}[/bold white]")
+    _console().print(f"   🔧 Tipo: [bold green]{project_type}[/bold green]")
+    _console().print(f"   📍 Ubicación: [bold green]{path}[/bold green]")
     
     if not force and not Confirm.ask(f"\n¿Crear proyecto '{project_name}'?"):
-        console.print("❌ Operación cancelada", style="red")
+        _console().print("❌ Operación cancelada", style="red")
         return None
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Generando proyecto...", total=None)
-        
-        # Crear configuración temporal
-        config_data = {
-            "project_name": project_name,
-            "description": description,
-            "project_type": project_type,
-            "author": "Tu Nombre",
-            "email": "tu@email.com",
-            "python_version_min": "3.8",
-            "license": "MIT"
-        }
-        
-        # Generar proyecto
-        import tempfile
-        import json
-        from pathlib import Path
-        
-        # Crear archivo temporal de configuración
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f, indent=2)
-            temp_config_path = f.name
-        
-        try:
-            generator.generate_project_from_config(Path(temp_config_path), Path(path))
-            progress.update(task, description="✅ Proyecto generado!")
-        except Exception as e:
-            progress.update(task, description="❌ Error en generación")
-            console.print(f"\n❌ Error al generar el proyecto: {e}", style="red")
-            console.print("🔧 Verifica los permisos y la configuración", style="yellow")
-            return None
-        finally:
-            # Limpiar archivo temporal
-            import os
-            try:
-                os.unlink(temp_config_path)
-            except OSError:
-                pass  # Ignorar errores al limpiar archivo temporal
+    # Modo directo (scripts, CI): líneas de estado simples, sin el spinner de
+    # Progress, que arranca un hilo y un renderizador Live en cada ejecución
+    _console().print("⏳ Generando proyecto...")
+    
+    # Crear configuración temporal
+    config_data = {
+        "project_name": project_name,
+        "description": description,
+        "project_type": project_type,
+        "author": "Tu Nombre",
+        "email": "tu@email.com",
+        "python_version_min": "3.8",
+        "license": "MIT"
+    }
     
-    console.print(f"\n🎉 ¡Proyecto '{project_name}' creado exitosamente!", style="green")
+    # Generar proyecto
+    try:
+        generator.generate_project_from_dict(config_data, path)
+        _console().print("✅ Proyecto generado!")
+    except Exception as e:
+        _console().print("❌ Error en generación")
+        _console().print(f"\n❌ Error al generar el proyecto: {e}", style="red")
+        _console().print("🔧 Verifica los permisos y la configuración", style="yellow")
+        return None
+    
+    _console().print(f"\n🎉 ¡Proyecto '{project_name}' creado exitosamente!", style="green")
     
     # Mostrar información del proyecto
     info_table = Table(show_header=False, box=None, padding=(0, 1))
     info_table.add_column(style="bold cyan", width=12)
     info_table.add_column(style="white")
     
-    info_table.add_row("📁 Ubicación:", path)
+    info_table.add_row("📁 Ubicación:", str(path))
     info_table.add_row("📝 Descripción:", description)
     info_table.add_row("🔧 Tipo:", project_type)
     info_table.add_row("📅 Creado:", "Hoy")
     
-    console.print(info_table)
+    _console().print(info_table)
     
     # Mostrar próximos pasos detallados
-    console.print(f"\n🚀 Próximos pasos:")
+    _console().print(f"\n🚀 Próximos pasos:")
     steps_table = Table(show_header=False, box=None, padding=(0, 1))
     steps_table.add_column(style="bold yellow", width=3)
     steps_table.add_column(style="white")
@@ -1727,10 +2053,10 @@ def _direct_create(project_name, description, path, project_type, force=False):
     steps_table.add_row("4️⃣", "cursor .  # o code .")
     steps_table.add_row("5️⃣", "¡Empieza a desarrollar!")
     
-    console.print(steps_table)
+    _console().print(steps_table)
     
     # Mostrar archivos importantes
-    console.print(f"\n📚 Archivos importantes:")
+    _console().print(f"\n📚 Archivos importantes:")
     files_table = Table(show_header=False, box=None, padding=(0, 1))
     files_table.add_column(style="bold blue", width=20)
     files_table.add_column(style="white")
@@ -1741,13 +2067,159 @@ def _direct_create(project_name, description, path, project_type, force=False):
     files_table.add_row("🔧 requirements.txt", "Dependencias Python")
     files_table.add_row("⚙️ .gitignore", "Archivos ignorados por Git")
     
-    console.print(files_table)
+    _console().print(files_table)
     
     return path
 
+def _short_repr(value: Any, limit: int) -> str:
+    """
+    Representación de listas y dicts que deja de recorrerlos al pasar ``limit`` caracteres.
+    
+    Hasta ese punto coincide con ``str(value)``; quien la use debe truncarla.
+    Evita convertir a texto estructuras enteras solo para mostrar su inicio.
+    """
+    if isinstance(value, dict):
+        opening, closing = '{', '}'
+        parts = (f"{key!r}: {_short_repr(item, limit)}" for key, item in value.items())
+    elif isinstance(value, list):
+        opening, closing = '[', ']'
+        parts = (_short_repr(item, limit) for item in value)
+    else:
+        return repr(value)
+    
+    pieces = [opening]
+    size = 1
+    for i, part in enumerate(parts):
+        if i:
+            pieces.append(', ')
+            size += 2
+        pieces.append(part)
+        size += len(part)
+        if size > limit:
+            return ''.join(pieces)
+    pieces.append(closing)
+    return ''.join(pieces)
+
+def _preview_config_file(path: str, limit: int = 50) -> Any:
+    """
+    Leer un archivo de configuración solo lo necesario para el preview.
+    
+    Para YAML recorre los eventos del parser (libyaml) y construye únicamente
+    los valores escalares de primer nivel; de listas y dicts anidados solo
+    genera el texto del preview, sin crear los objetos Python. JSON, o un YAML
+    que no sea un mapping simple (anclas, merge keys), se carga completo.
+    
+    Args:
+        path: Ruta del archivo de configuración
+        limit: Caracteres de cada valor anidado que se muestran
+        
+    Returns:
+        Dict de primer nivel para ``_show_config_preview``
+    """
+    if path.endswith('.py'):
+        return _load_config_module(path)
+    data = Path(path).read_bytes()
+    if not _looks_like_json(data):
+        preview = _yaml_preview_items(data, limit)
+        if preview is not None:
+            return preview
+    return _parse_config_bytes(data)
+
+
+def _yaml_preview_items(data: bytes, limit: int) -> Optional[Dict[Any, Any]]:
+    """
+    Pares de primer nivel de un mapping YAML a partir de sus eventos.
+    
+    Los escalares se resuelven y construyen igual que con ``SafeLoader``;
+    listas y dicts se sustituyen por el texto de ``str(valor)`` truncado a
+    ``limit`` caracteres (más "..."), dejando de acumularlo al llegar al límite.
+    
+    Returns:
+        Dict con el preview, o None si el documento no es un mapping simple
+    """
+    import yaml
+    
+    resolver = yaml.resolver.Resolver()
+    constructor = yaml.constructor.SafeConstructor()
+    
+    def scalar(event: Any) -> Any:
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag == 'tag:yaml.org,2002:merge':
+            raise ValueError("merge key")
+        return constructor.construct_object(yaml.ScalarNode(tag, event.value))
+    
+    def collection_text(events: Iterator[Any], first: Any) -> str:
+        pieces: List[str] = []
+        size = 0
+        stack: List[List[Any]] = []  # [es_mapping, nodos emitidos]
+        event = first
+        while True:
+            # Anclas y alias se rechazan también pasado el límite: un alias no
+            # abre ni cierra colecciones y descuadraría la profundidad
+            if isinstance(event, yaml.AliasEvent) or getattr(event, 'anchor', None):
+                raise ValueError("ancla")
+            # Pasado el límite solo se sigue la profundidad hasta cerrar el valor
+            visible = size <= limit
+            text = ''
+            if visible and stack and not isinstance(event, yaml.CollectionEndEvent):
+                is_mapping, count = stack[-1]
+                if count:
+                    text = ': ' if is_mapping and count % 2 else ', '
+            if isinstance(event, yaml.ScalarEvent):
+                if visible:
+                    text += repr(scalar(event))
+            elif isinstance(event, yaml.CollectionStartEvent):
+                text += '{' if isinstance(event, yaml.MappingStartEvent) else '['
+                stack.append([isinstance(event, yaml.MappingStartEvent), 0])
+            elif isinstance(event, yaml.CollectionEndEvent):
+                text = '}' if stack.pop()[0] else ']'
+            else:
+                raise ValueError(f"evento inesperado: {event!r}")
+            if visible:
+                pieces.append(text)
+                size += len(text)
+            if not stack:
+                result = ''.join(pieces)
+                return result[:limit] + "..." if len(result) > limit else result
+            if not isinstance(event, yaml.CollectionStartEvent):
+                stack[-1][1] += 1
+            event = next(events)
+    
+    events = yaml.parse(data, Loader=_yaml_loader())
+    try:
+        for event in events:
+            if isinstance(event, yaml.MappingStartEvent) and not event.anchor:
+                break
+            if not isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+                return None
+        else:
+            return None
+        
+        preview: Dict[Any, Any] = {}
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                return preview
+            if not isinstance(key_event, yaml.ScalarEvent) or key_event.anchor:
+                return None
+            key = scalar(key_event)
+            value_event = next(events)
+            if isinstance(value_event, yaml.ScalarEvent) and not value_event.anchor:
+                preview[key] = scalar(value_event)
+            elif isinstance(value_event, yaml.CollectionStartEvent):
+                preview[key] = collection_text(events, value_event)
+            else:
+                return None
+    except ValueError:
+        return None
+    return None
+
 def _show_config_preview(config_data):
     """Mostrar preview de la configuración."""
-    console.print("\n📋 Preview de configuración:")
+    from rich.table import Table
+    
+    _console().print("\n📋 Preview de configuración:")
     
     table = Table(show_header=True, header_style="bold blue")
     table.add_column("Campo", style="cyan")
@@ -1755,27 +2227,31 @@ def _show_config_preview(config_data):
     
     for key, value in config_data.items():
         if isinstance(value, (dict, list)):
-            value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-        table.add_row(key, str(value))
+            text = _short_repr(value, 50)
+            if len(text) > 50:
+                text = text[:50] + "..."
+        else:
+            text = str(value)
+        table.add_row(key, text)
     
-    console.print(table)
+    _console().print(table)
 
 def _display_supervision_report(report):
     """Mostrar reporte de supervisión."""
     from datetime import datetime
     
-    console.print(f"\n📊 Reporte de Supervisión - {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-    console.print("─" * 60)
+    _console().print(f"\n📊 Reporte de Supervisión - {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+    _console().print("─" * 60)
     
     # Resumen
-    console.print(f"📈 Problemas encontrados: [bold yellow]{len(report.issues_found)}[/bold yellow]")
-    console.print(f"📁 Archivos creados: [bold green]{len(report.files_created)}[/bold green]")
-    console.print(f"✏️ Archivos modificados: [bold blue]{len(report.files_modified)}[/bold blue]")
-    console.print(f"🏗️ Cambios de estructura: [bold cyan]{len(report.structure_changes)}[/bold cyan]")
+    _console().print(f"📈 Problemas encontrados: [bold yellow]{len(report.issues_found)}[/bold yellow]")
+    _console().print(f"📁 Archivos creados: [bold green]{len(report.files_created)}[/bold green]")
+    _console().print(f"✏️ Archivos modificados: [bold blue]{len(report.files_modified)}[/bold blue]")
+    _console().print(f"🏗️ Cambios de estructura: [bold cyan]{len(report.structure_changes)}[/bold cyan]")
     
     # Problemas por severidad
     if report.issues_found:
-        console.print("\n🚨 Problemas detectados:")
+        _console().print("\n🚨 Problemas detectados:")
         
         severity_counts = {}
         for issue in report.issues_found:
@@ -1788,28 +2264,28 @@ def _display_supervision_report(report):
                 'high': 'red',
                 'critical': 'bold red'
             }.get(severity, 'white')
-            console.print(f"  • [{color}]{severity.upper()}[/{color}]: {count} problemas")
+            _console().print(f"  • [{color}]{severity.upper()}[/{color}]: {count} problemas")
         
         # Mostrar problemas críticos y altos
         critical_issues = [i for i in report.issues_found if i.severity in ['critical', 'high']]
         if critical_issues:
-            console.print("\n⚠️ Problemas críticos/altos:")
+            _console().print("\n⚠️ Problemas críticos/altos:")
             for issue in critical_issues[:5]:  # Mostrar solo los primeros 5
-                console.print(f"  • {issue.description}")
+                _console().print(f"  • {issue.description}")
                 if issue.suggestion:
-                    console.print(f"    💡 {issue.suggestion}")
+                    _console().print(f"    💡 {issue.suggestion}")
     
     # Recomendaciones
     if report.recommendations:
-        console.print("\n💡 Recomendaciones:")
+        _console().print("\n💡 Recomendaciones:")
         for rec in report.recommendations[:3]:  # Mostrar solo las primeras 3
-            console.print(f"  • {rec}")
+            _console().print(f"  • {rec}")
 
 def _display_instructions_summary(instructions):
     """Mostrar resumen de instrucciones generadas."""
     from rich.table import Table
     
-    console.print("\n📋 Resumen de Instrucciones Generadas:")
+    _console().print("\n📋 Resumen de Instrucciones Generadas:")
     
     table = Table()
     table.add_column("Acción", style="cyan")
@@ -1832,7 +2308,7 @@ def _display_instructions_summary(instructions):
             instruction.methodology_reference
         )
     
-    console.print(table)
+    _console().print(table)
 
 def _check_active_supervision(project_path):
     """Verificar si hay supervisión activa."""
@@ -1851,27 +2327,29 @@ def _check_active_supervision(project_path):
                 continue
         
         if supervisor_processes:
-            console.print(f"\n🔄 Supervisión activa: [bold green]SÍ[/bold green]")
+            _console().print(f"\n🔄 Supervisión activa: [bold green]SÍ[/bold green]")
             for proc in supervisor_processes:
-                console.print(f"  • PID {proc.pid} - {proc.info['name']}")
+                _console().print(f"  • PID {proc.pid} - {proc.info['name']}")
         else:
-            console.print(f"\n🔄 Supervisión activa: [bold red]NO[/bold red]")
-            console.print("💡 Usa 'pre-cursor supervisor start' para iniciar supervisión")
+            _console().print(f"\n🔄 Supervisión activa: [bold red]NO[/bold red]")
+            _console().print("💡 Usa 'pre-cursor supervisor start' para iniciar supervisión")
         
         # Verificar archivos de configuración
         config_path = Path(project_path) / 'config' / 'cursor_supervisor.yaml'
         if config_path.exists():
-            console.print(f"⚙️ Configuración: [bold green]Encontrada[/bold green] ({config_path})")
+            _console().print(f"⚙️ Configuración: [bold green]Encontrada[/bold green] ({config_path})")
         else:
-            console.print(f"⚙️ Configuración: [bold yellow]No encontrada[/bold yellow]")
-            console.print("💡 Usa 'pre-cursor supervisor config' para crear configuración")
+            _console().print(f"⚙️ Configuración: [bold yellow]No encontrada[/bold yellow]")
+            _console().print("💡 Usa 'pre-cursor supervisor config' para crear configuración")
         
     except Exception as e:
-        console.print(f"⚠️ Error verificando supervisión activa: {e}", style="yellow")
+        _console().print(f"⚠️ Error verificando supervisión activa: {e}", style="yellow")
 
 def _display_supervisor_config(config_data):
     """Mostrar configuración del supervisor."""
-    console.print("\n⚙️ Configuración actual del supervisor:")
+    from rich.table import Table
+    
+    _console().print("\n⚙️ Configuración actual del supervisor:")
     
     table = Table(show_header=True, header_style="bold blue")
     table.add_column("Parámetro", style="cyan")
@@ -1895,7 +2373,7 @@ def _display_supervisor_config(config_data):
     table.add_row("Notificaciones en consola", str(notifications_config.get('console', True)))
     table.add_row("Logging a archivo", str(notifications_config.get('file_logging', True)))
     
-    console.print(table)
+    _console().print(table)
 
 if __name__ == '__main__':
     cli()
@@ -307,7 +307,7 @@ Proyecto: {self.project_path}
             
             # Guardar log actualizado
             with open(self.agent_execution_log, 'w', encoding='utf-8') as f:
-                json.dump(existing_log, f, indent=2, ensure_ascii=False)
+                json.dump(existing_log, f, ensure_ascii=False, separators=(',', ':'))
             
             logger.info(f"Log de ejecuciones con Cursor Agent guardado en: {self.agent_execution_log}")
             
@@ -158,10 +158,24 @@ class CursorIntegrationManager:
             if 'tests' in issue.description and 'raíz' in issue.description:
                 # Mover archivos de test a tests/
                 test_files = list(self.project_path.glob('*_test.py'))
+                if not test_files:
+                    return
+                
+                tests_dir = self.project_path / 'tests'
+                tests_dir.mkdir(exist_ok=True)
+                
+                # Nombres ya presentes en tests/, listados una sola vez: las
+                # colisiones se resuelven en memoria sin sobrescribir tests
+                existing = set(os.listdir(tests_dir))
                 for test_file in test_files:
-                    target = self.project_path / 'tests' / test_file.name
-                    test_file.rename(target)
-                    logger.info(f"Archivo {test_file.name} movido a tests/")
+                    name = test_file.name
+                    counter = 1
+                    while name in existing:
+                        name = f"{test_file.stem}_{counter}{test_file.suffix}"
+                        counter += 1
+                    existing.add(name)
+                    test_file.rename(tests_dir / name)
+                    logger.info(f"Archivo {test_file.name} movido a tests/{name}")
         except Exception as e:
             logger.error(f"Error al corregir archivos fuera de lugar: {e}")
     
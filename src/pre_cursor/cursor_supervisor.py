@@ -18,7 +18,7 @@ import subprocess
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -73,26 +73,50 @@ class ProjectStructureMonitor:
         issues = []
         
         # Archivos de test en raíz
-        test_files = list(self.project_path.glob('*_test.py')) + list(self.project_path.glob('test*.py'))
+        test_files = self._file_names(
+            self.project_path,
+            lambda name: name.endswith('.py') and (name.startswith('test') or name.endswith('_test.py'))
+        )
         if test_files:
             issues.append(ProjectIssue(
                 type='misplaced_files',
                 severity='high',
-                description=f"Archivos de test en raíz: {[f.name for f in test_files]}",
+                description=f"Archivos de test en raíz: {test_files}",
                 suggestion="Mover archivos de test al directorio tests/"
             ))
         
         # Scripts de configuración en src/
-        config_files = list((self.project_path / 'src').glob('*config*.py'))
+        config_files = self._file_names(
+            self.project_path / 'src',
+            lambda name: name.endswith('.py') and 'config' in name[:-3]
+        )
         if config_files:
             issues.append(ProjectIssue(
                 type='misplaced_files',
                 severity='medium',
-                description=f"Archivos de configuración en src/: {[f.name for f in config_files]}",
+                description=f"Archivos de configuración en src/: {config_files}",
                 suggestion="Mover archivos de configuración al directorio raíz"
             ))
         
         return issues
+    
+    @staticmethod
+    def _file_names(directory: Path, predicate: Callable[[str], bool]) -> List[str]:
+        """
+        Nombres de los archivos regulares de un directorio que cumplen un predicado.
+        
+        Un único ``os.scandir`` sustituye a varios ``glob``: el tipo de cada
+        entrada sale del ``DirEntry`` sin un ``stat()`` por archivo y solo se
+        devuelven nombres, sin construir objetos ``Path``.
+        """
+        try:
+            with os.scandir(directory) as it:
+                return [
+                    entry.name for entry in it
+                    if predicate(entry.name) and entry.is_file(follow_symlinks=False)
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
 
 class DuplicateDetector:
     """Detector de archivos y código duplicado"""
@@ -49,6 +49,12 @@ class SupervisionReport:
 class CursorInstruction:
     """Instrucción específica para Cursor CLI"""
     
+    # Atributos fijos: sin __dict__ por instancia (se crean muchas por lote)
+    __slots__ = (
+        "action", "target", "context", "methodology_reference",
+        "priority", "timestamp", "status", "result"
+    )
+    
     def __init__(self, action: str, target: str, context: str, 
                  methodology_reference: str = "", priority: str = "medium"):
         self.action = action
@@ -14,6 +14,7 @@ Fecha: 2024-12-19
 import os
 import re
 import ast
+import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
@@ -302,6 +303,7 @@ class TestSupervisor:
             "failed": 0,
             "changes_made": []
         }
+        auto_executor = None
         
         try:
             from .auto_executor import AutoExecutor
@@ -344,6 +346,9 @@ class TestSupervisor:
         except Exception as e:
             logger.error(f"Error aplicando correcciones automáticas: {e}")
             corrections_applied["error"] = str(e)
+        finally:
+            if auto_executor is not None:
+                auto_executor.close()
         
         return corrections_applied
     
@@ -407,13 +412,10 @@ class TestSupervisor:
             
             # Guardar log actualizado
             with open(self.test_log_path, 'w', encoding='utf-8') as f:
-                json.dump(existing_log, f, indent=2, ensure_ascii=False)
+                json.dump(existing_log, f, ensure_ascii=False, separators=(',', ':'))
             
             logger.info(f"Log de supervisión de tests guardado en: {self.test_log_path}")
             
         except Exception as e:
             logger.error(f"Error guardando log de supervisión de tests: {e}")
 
-# Importar json al final para evitar problemas de importación circular
-import json
-
@@ -366,7 +366,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
             
             # Guardar log actualizado
             with open(self.validator_log_path, 'w', encoding='utf-8') as f:
-                json.dump(existing_log, f, indent=2, ensure_ascii=False)
+                json.dump(existing_log, f, ensure_ascii=False, separators=(',', ':'))
             
             logger.info(f"Log de validación guardado en: {self.validator_log_path}")
             
@@ -7,6 +7,7 @@ Supervisor unificado que integra todas las funcionalidades de supervisión
 y prioriza el uso de Cursor Agent CLI para todas las operaciones.
 """
 
+import json
 import os
 import sys
 import time
@@ -328,7 +329,6 @@ class UnifiedSupervisor:
             # Guardar reporte
             report_file = self.project_path / '.cursor' / 'logs' / 'unified_report.json'
             with open(report_file, 'w', encoding='utf-8') as f:
-                import json
                 json.dump(report_data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Reporte unificado guardado: {report_file}")
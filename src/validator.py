@@ -29,8 +29,9 @@ class ProjectValidator:
     VALID_GITHUB_USER_PATTERN = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}$')
     VALID_PYTHON_VERSION_PATTERN = re.compile(r'^3\.([8-9]|[1-9][0-9])$')
     
-    # Tipos de proyecto válidos
-    VALID_PROJECT_TYPES = [
+    # Tipos de proyecto válidos: tupla para mensajes (orden estable) y
+    # frozenset para comprobaciones de pertenencia en O(1)
+    VALID_PROJECT_TYPES = (
         "Python Library",
         "Python CLI Tool", 
         "Python Web App (Flask)",
@@ -42,13 +43,15 @@ class ProjectValidator:
         "Node.js Project",
         "TD_MCP Project",
         "Otro"
-    ]
+    )
+    _VALID_PROJECT_TYPES_SET = frozenset(VALID_PROJECT_TYPES)
     
     # Licencias válidas
-    VALID_LICENSES = [
+    VALID_LICENSES = (
         "MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause", 
         "ISC", "LGPL-3.0", "MPL-2.0", "Unlicense"
-    ]
+    )
+    _VALID_LICENSES_SET = frozenset(VALID_LICENSES)
     
     def __init__(self):
         self.errors: List[str] = []
@@ -218,7 +221,7 @@ class ProjectValidator:
             self.errors.append("El tipo de proyecto es requerido")
             return False
         
-        if project_type not in self.VALID_PROJECT_TYPES:
+        if project_type not in self._VALID_PROJECT_TYPES_SET:
             self.errors.append(
                 f"Tipo de proyecto inválido. Opciones válidas: {', '.join(self.VALID_PROJECT_TYPES)}"
             )
@@ -241,7 +244,7 @@ class ProjectValidator:
             self.warnings.append("Licencia no especificada, usando MIT por defecto")
             return True
         
-        if license_name not in self.VALID_LICENSES:
+        if license_name not in self._VALID_LICENSES_SET:
             self.errors.append(
                 f"Licencia inválida. Opciones válidas: {', '.join(self.VALID_LICENSES)}"
             )
@@ -0,0 +1,22 @@
+"""
+Configuración compartida de pytest.
+
+Redirige la caché en disco de configuraciones a un directorio temporal para
+que los tests no escriban en ``~/.cache/pre_cursor``.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Añadir src al path para importar módulos
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import config_loader
+
+
+@pytest.fixture(autouse=True)
+def _config_cache_dir(tmp_path, monkeypatch):
+    """Caché de configuraciones aislada en el directorio temporal del test."""
+    monkeypatch.setattr(config_loader, "_CONFIG_CACHE_DIR", tmp_path / "config_cache")
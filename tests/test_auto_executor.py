@@ -0,0 +1,270 @@
+"""
+Tests unitarios para el ejecutor automático.
+
+Este módulo contiene tests para auto_executor.py, que aplica en el
+proyecto las correcciones detectadas por el supervisor.
+"""
+
+import gc
+import json
+import pytest
+import shutil
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+import sys
+
+# Añadir src al path para importar módulos
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pre_cursor.auto_executor import AutoExecutor, _batch_runs
+from pre_cursor.models import CursorInstruction
+
+
+class TestAutoExecutorDirectories:
+    """Tests para la creación de directorios de destino."""
+
+    def setup_method(self):
+        """Configurar antes de cada test."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project_path = Path(self.tmp.name)
+        self.executor = AutoExecutor(str(self.project_path))
+
+    def teardown_method(self):
+        """Limpiar después de cada test."""
+        self.executor.close()
+        self.tmp.cleanup()
+
+    def _run(self, action, target="."):
+        return self.executor.execute_instruction(CursorInstruction(action, target, "test"))
+
+    def test_create_tests_dir_after_deletion(self):
+        """tests/ se recrea aunque ya se hubiera creado antes en esta instancia."""
+        assert self._run("create_tests_dir")["success"]
+        shutil.rmtree(self.project_path / "tests")
+
+        result = self._run("create_tests_dir")
+
+        assert result["success"]
+        assert "Creado directorio tests/" in result["changes_made"]
+        assert (self.project_path / "tests" / "__init__.py").exists()
+
+    def test_move_test_files_after_deletion(self):
+        """move_test_files recrea tests/ si se borró tras cachearse."""
+        (self.project_path / "test_a.py").write_text("def test_a():\n    pass\n")
+        assert self._run("move_test_files")["success"]
+        shutil.rmtree(self.project_path / "tests")
+        (self.project_path / "test_b.py").write_text("def test_b():\n    pass\n")
+
+        result = self._run("move_test_files")
+
+        assert result["success"]
+        assert (self.project_path / "tests" / "test_b.py").exists()
+
+    def test_move_file_after_deletion(self):
+        """move_file recrea el directorio de destino si se borró tras cachearse."""
+        (self.project_path / "a.md").write_text("# A\n")
+        assert self._run("move_file", str(self.project_path / "a.md"))["success"]
+        shutil.rmtree(self.project_path / "docs")
+        (self.project_path / "b.md").write_text("# B\n")
+
+        result = self._run("move_file", str(self.project_path / "b.md"))
+
+        assert result["success"]
+        assert (self.project_path / "docs" / "b.md").exists()
+
+
+class TestAutoExecutorLogWriter:
+    """Tests para el hilo escritor del log compartido entre ejecutores."""
+
+    def test_executors_share_one_writer_thread(self):
+        """Varios ejecutores usan un solo hilo y no quedan retenidos por él."""
+        with tempfile.TemporaryDirectory() as tmp:
+            executors = []
+            for _ in range(5):
+                executor = AutoExecutor(tmp)
+                executor.execute_instructions_batch([CursorInstruction("create_tests_dir", ".", "test")])
+                executors.append(executor)
+
+            writers = [t for t in threading.enumerate() if t.name == "AutoExecutorLog"]
+            assert len(writers) <= 1
+            assert len(list(executors[0].read_executions())) == 5
+
+            executors[-1].close()
+            ref = weakref.ref(executors[-1])
+            del executor, executors
+            gc.collect()
+            assert ref() is None
+
+
+class TestAutoExecutorExecutionLog:
+    """Tests para el log de ejecuciones en formato JSON Lines."""
+
+    def setup_method(self):
+        """Configurar antes de cada test."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project_path = Path(self.tmp.name)
+        self.logs_dir = self.project_path / ".cursor" / "logs"
+
+    def teardown_method(self):
+        """Limpiar después de cada test."""
+        self.tmp.cleanup()
+
+    def _batch(self, executor, count=1):
+        instructions = [CursorInstruction("create_tests_dir", ".", "test") for _ in range(count)]
+        return executor.execute_instructions_batch(instructions)
+
+    def test_batches_append_one_line_each(self):
+        """Cada lote añade una línea JSON; close() deja todo escrito en disco."""
+        executor = AutoExecutor(str(self.project_path))
+        self._batch(executor, 2)
+        self._batch(executor)
+        executor.close()
+
+        lines = (self.logs_dir / "auto_executions.jsonl").read_text(encoding="utf-8").splitlines()
+        entries = [json.loads(line) for line in lines]
+
+        assert [entry["total_instructions"] for entry in entries] == [2, 1]
+        assert entries[0]["summary"]["successful"] == 2
+        assert entries[0]["instructions"][0]["action"] == "create_tests_dir"
+        assert isinstance(entries[0]["timestamp"], str)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_instruction_entries(self, monkeypatch, use_orjson):
+        """Las instrucciones se registran con los mismos campos con y sin orjson."""
+        import pre_cursor.auto_executor as auto_executor
+        if not use_orjson:
+            monkeypatch.setattr(auto_executor, "orjson", None)
+        executor = AutoExecutor(str(self.project_path))
+        instruction = CursorInstruction("create_tests_dir", ".", "test", priority="high")
+        executor.execute_instructions_batch([instruction])
+        executor.close()
+
+        entry = json.loads((self.logs_dir / "auto_executions.jsonl").read_text(encoding="utf-8"))
+
+        assert entry["instructions"] == [{
+            "action": "create_tests_dir",
+            "target": ".",
+            "priority": "high",
+            "timestamp": instruction.timestamp.isoformat()
+        }]
+        assert entry["summary"] == {"successful": 1, "failed": 0, "total_changes": 2}
+
+    def test_flush_makes_entries_visible(self):
+        """flush() espera a que el hilo escritor vacíe la cola."""
+        executor = AutoExecutor(str(self.project_path))
+        self._batch(executor)
+        executor.flush()
+
+        assert (self.logs_dir / "auto_executions.jsonl").read_bytes().count(b"\n") == 1
+        executor.close()
+
+    def test_read_executions(self):
+        """read_executions devuelve las entradas en orden e ignora líneas inválidas."""
+        executor = AutoExecutor(str(self.project_path))
+        self._batch(executor, 1)
+        executor.flush()
+        with open(self.logs_dir / "auto_executions.jsonl", "a", encoding="utf-8") as f:
+            f.write("{no es json\n\n")
+        self._batch(executor, 3)
+
+        entries = list(executor.read_executions())
+
+        assert [entry["total_instructions"] for entry in entries] == [1, 3]
+        executor.close()
+
+    def test_read_executions_without_log(self):
+        """Sin log todavía, read_executions no devuelve nada."""
+        executor = AutoExecutor(str(self.project_path))
+        assert list(executor.read_executions()) == []
+
+    def test_legacy_log_migration(self):
+        """El log antiguo auto_executions.json se convierte a JSON Lines una sola vez."""
+        self.logs_dir.mkdir(parents=True)
+        legacy = self.logs_dir / "auto_executions.json"
+        legacy.write_text(json.dumps({"executions": [{"n": 1}, {"n": 2}]}), encoding="utf-8")
+        (self.logs_dir / "auto_executions.jsonl").write_text('{"n":3}\n', encoding="utf-8")
+
+        executor = AutoExecutor(str(self.project_path))
+
+        assert not legacy.exists()
+        assert [entry["n"] for entry in executor.read_executions()] == [1, 2, 3]
+
+        # Una segunda instancia no vuelve a migrar ni duplica entradas
+        assert [entry["n"] for entry in AutoExecutor(str(self.project_path)).read_executions()] == [1, 2, 3]
+
+    def test_legacy_log_invalid_is_kept(self):
+        """Un log antiguo ilegible se deja en su sitio."""
+        self.logs_dir.mkdir(parents=True)
+        legacy = self.logs_dir / "auto_executions.json"
+        legacy.write_text("{roto", encoding="utf-8")
+
+        executor = AutoExecutor(str(self.project_path))
+
+        assert legacy.exists()
+        assert list(executor.read_executions()) == []
+
+
+class TestBatchRuns:
+    """Tests para la agrupación de un lote en tramos paralelizables."""
+
+    def _instruction(self, action, target="."):
+        return CursorInstruction(action, target, "test")
+
+    def test_consecutive_moves_share_a_run(self):
+        """Movimientos consecutivos de archivos distintos forman un tramo; el resto va solo."""
+        batch = [
+            self._instruction("move_file", "/p/a.md"),
+            self._instruction("move_file", "/p/b.yaml"),
+            self._instruction("create_tests_dir"),
+            self._instruction("move_file", "/p/c.py"),
+        ]
+
+        runs = list(_batch_runs(batch))
+
+        assert [[i.target for i in run] for run in runs] == [
+            ["/p/a.md", "/p/b.yaml"], ["."], ["/p/c.py"]
+        ]
+        assert [i for run in runs for i in run] == batch
+
+    def test_repeated_file_name_splits_run(self):
+        """Dos movimientos con el mismo nombre de archivo no comparten tramo."""
+        batch = [
+            self._instruction("move_file", "/p/x/a.md"),
+            self._instruction("move_file", "/p/y/a.md"),
+            self._instruction("move_file", "/p/b.md"),
+        ]
+
+        runs = list(_batch_runs(batch))
+
+        assert [[i.target for i in run] for run in runs] == [
+            ["/p/x/a.md"], ["/p/y/a.md", "/p/b.md"]
+        ]
+
+    def test_empty_batch(self):
+        """Un lote vacío no produce tramos."""
+        assert list(_batch_runs([])) == []
+
+    def test_batch_results_keep_order(self):
+        """Los resultados del lote siguen el orden de las instrucciones."""
+        with tempfile.TemporaryDirectory() as tmp:
+            project_path = Path(tmp)
+            names = [f"doc_{i}.md" for i in range(8)]
+            for name in names:
+                (project_path / name).write_text(name)
+            executor = AutoExecutor(tmp)
+
+            batch = [self._instruction("move_file", str(project_path / name)) for name in names]
+            batch.insert(4, self._instruction("move_file", str(project_path / "missing.md")))
+            result = executor.execute_instructions_batch(batch)
+            executor.close()
+
+            assert result["successful"] == 8
+            assert result["failed"] == 1
+            assert result["results"][4]["error"].startswith("Archivo no encontrado")
+            assert [c.split()[1] for c in result["changes_made"]] == names
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,185 @@
+"""
+Tests unitarios para las utilidades del CLI.
+
+Este módulo contiene tests para la lectura de archivos de configuración y
+el preview de ``generate --dry-run`` en cli.py.
+"""
+
+import json
+import pytest
+import tempfile
+import yaml
+from pathlib import Path
+import sys
+
+# Añadir src al path para importar módulos
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pre_cursor.cli import _preview_config_file, _read_config_file, _yaml_preview_items
+
+
+def _legacy_preview(config_data):
+    """Texto que mostraba el preview cargando la configuración completa."""
+    preview = {}
+    for key, value in config_data.items():
+        if isinstance(value, (dict, list)):
+            value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
+        preview[key] = str(value)
+    return preview
+
+
+class TestReadConfigFile:
+    """Tests para la detección de formato por contenido."""
+
+    def setup_method(self):
+        """Configurar antes de cada test."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def teardown_method(self):
+        """Limpiar después de cada test."""
+        self.tmp.cleanup()
+
+    def _write(self, name, content):
+        path = self.dir / name
+        path.write_bytes(content)
+        return str(path)
+
+    def test_json_without_extension(self):
+        """Un archivo que empieza por '{' se lee como JSON aunque no tenga extensión."""
+        assert _read_config_file(self._write("config", b'\n  {"a": 1}')) == {"a": 1}
+
+    def test_yaml_with_other_extension(self):
+        """Un archivo YAML con extensión .cfg se lee como YAML."""
+        assert _read_config_file(self._write("config.cfg", b"a: 1\n")) == {"a": 1}
+
+    def test_yaml_flow_mapping(self):
+        """Un mapping YAML en estilo flujo no es JSON válido y se lee como YAML."""
+        assert _read_config_file(self._write("config.yaml", b"{a: 1}")) == {"a": 1}
+
+    def test_python_module(self):
+        """Un .py de template --format py se carga importando su CONFIG."""
+        path = self._write("config.py", b"CONFIG = {'a': [1, None], 'b': 'c'}\n")
+
+        assert _read_config_file(path) == {"a": [1, None], "b": "c"}
+        assert _preview_config_file(path) == {"a": [1, None], "b": "c"}
+
+    def test_python_module_without_config(self):
+        """Un .py sin dict CONFIG es un error."""
+        with pytest.raises(ValueError):
+            _read_config_file(self._write("config.py", b"OTHER = 1\n"))
+
+    def test_template_py_round_trip(self):
+        """template --format py genera un módulo equivalente a la plantilla."""
+        from click.testing import CliRunner
+        from pre_cursor.cli import _template_for, cli
+
+        output = str(self.dir / "config.py")
+        result = CliRunner().invoke(
+            cli, ["template", "--type", "Python Library", "--format", "py", "--output", output]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert _read_config_file(output) == _template_for("Python Library")
+
+    def test_template_json_same_without_orjson(self, monkeypatch):
+        """template escribe los mismos bytes JSON con orjson y con json."""
+        from click.testing import CliRunner
+        import pre_cursor.cli as cli_module
+
+        outputs = []
+        for use_orjson in (True, False):
+            if not use_orjson:
+                monkeypatch.setattr(cli_module, "orjson", None)
+            output = self.dir / f"config_{use_orjson}.json"
+            result = CliRunner().invoke(
+                cli_module.cli, ["template", "--type", "TD_MCP Project", "--output", str(output)]
+            )
+            assert result.exit_code == 0, result.output
+            outputs.append(output.read_bytes())
+
+        assert outputs[0] == outputs[1]
+
+
+class TestConfigPreview:
+    """Tests para el preview superficial de YAML en --dry-run."""
+
+    @pytest.mark.parametrize("document", [
+        'a: 1\nb: [x, {c: 2}]\nd: "s"\ne: 3.8\nf: true\ng: null\nh: 2024-01-01\n',
+        "deps:\n  main: [requests>=2.28.0, click]\n  dev: []\nfeatures:\n- uno\n- dos: 2\n"
+        "  tres: [1, 2]\nempty: {}\nnested: [[], [[1]], {}]\n",
+        "'quoted': '3'\n1: one\nlong: " + "x" * 80 + "\n",
+        "big: [" + ", ".join(str(i) for i in range(1000)) + "]\n",
+    ])
+    def test_matches_full_load(self, document):
+        """El preview por eventos muestra lo mismo que cargando todo el documento."""
+        preview = _yaml_preview_items(document.encode("utf-8"), 50)
+
+        assert preview is not None
+        assert {k: str(v) for k, v in preview.items()} == _legacy_preview(yaml.safe_load(document))
+
+    @pytest.mark.parametrize("document", [
+        "x: &a 1\ny: *a\n",
+        "<<: {a: 1}\nb: 2\n",
+        "- 1\n- 2\n",
+        "items: {a: " + "x" * 60 + ", b: &x 1, c: *x, k: v}\nrest: 1\n",
+    ])
+    def test_unsupported_documents(self, document):
+        """Anclas, merge keys o un documento que no es mapping no usan el atajo."""
+        assert _yaml_preview_items(document.encode("utf-8"), 50) is None
+
+    def test_preview_falls_back_to_full_load(self):
+        """Con anclas, _preview_config_file carga el documento completo."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            path.write_text("x: &a 1\ny: *a\n", encoding="utf-8")
+
+            assert _preview_config_file(str(path)) == {"x": 1, "y": 1}
+
+
+class TestBatch:
+    """Tests para la generación de varios proyectos en un proceso."""
+
+    def _config(self, name):
+        return {
+            "project_name": name,
+            "description": "Proyecto generado en lote",
+            "project_type": "Python Library",
+            "author": "Batch Author",
+            "email": "batch@example.com"
+        }
+
+    def test_batch_continues_after_invalid_config(self, tmp_path, monkeypatch):
+        """Una configuración inválida no impide generar las demás del directorio."""
+        from click.testing import CliRunner
+        from pre_cursor.cli import cli
+
+        configs = tmp_path / "configs"
+        configs.mkdir()
+        (configs / "a.json").write_text(json.dumps(self._config("batch-a")), encoding="utf-8")
+        (configs / "b.yaml").write_text(yaml.safe_dump(self._config("batch-b")), encoding="utf-8")
+        (configs / "c.json").write_text('{"project_name": "sin-descripcion"}', encoding="utf-8")
+        (configs / "notas.txt").write_text("no es una configuración", encoding="utf-8")
+        # Un script en el directorio no se ejecuta: solo un glob explícito carga .py
+        (configs / "script.py").write_text("raise SystemExit('ejecutado')\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ["batch", str(configs)])
+
+        assert result.exit_code == 1
+        assert "2/3" in result.output
+        assert (tmp_path / "batch-a" / "README.md").exists()
+        assert (tmp_path / "batch-b" / "README.md").exists()
+
+    def test_batch_without_matches(self, tmp_path):
+        """Un patrón sin coincidencias termina con error."""
+        from click.testing import CliRunner
+        from pre_cursor.cli import cli
+
+        result = CliRunner().invoke(cli, ["batch", str(tmp_path / "*.json")])
+
+        assert result.exit_code == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
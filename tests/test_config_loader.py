@@ -9,6 +9,8 @@ import pytest
 import json
 import yaml
 import tempfile
+import os
+import pickle
 from pathlib import Path
 from unittest.mock import patch, mock_open
 import sys
@@ -19,7 +21,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from config_loader import (
     ConfigLoader,
     load_project_config,
-    create_config_template
+    create_config_template,
+    get_config_template,
+    ensure_json_cache,
+    peek_config_header
 )
 
 
@@ -175,6 +180,33 @@ class TestConfigLoader:
         assert merged_config['author'] == "Desarrollador"
         assert merged_config['git_init'] is True
     
+    def test_merge_with_defaults_complete_template(self):
+        """Una plantilla completa se devuelve sin combinar con los defaults."""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "config.json"
+            self.loader.save_config_template(config_path, "Python CLI Tool")
+            with open(config_path, 'r') as f:
+                config_data = json.load(f)
+            
+            with patch('config_loader._deep_merge') as deep_merge:
+                merged_config = self.loader._merge_with_defaults(config_data)
+                deep_merge.assert_not_called()
+            
+            assert merged_config is config_data
+            assert merged_config['project_type'] == "Python CLI Tool"
+    
+    def test_merge_with_defaults_edited_template_is_validated(self):
+        """Una plantilla editada a mano pasa por la validación completa."""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "config.json"
+            self.loader.save_config_template(config_path, "Python Library")
+            with open(config_path, 'r') as f:
+                config_data = json.load(f)
+            config_data["python_version_min"] = "2.7"
+            
+            with pytest.raises(ValueError, match="Versión de Python inválida"):
+                self.loader._merge_with_defaults(config_data)
+    
     def test_validate_config_valid(self):
         """Test de validación de configuración válida."""
         valid_config = {
@@ -375,6 +407,80 @@ class TestConfigFunctions:
         finally:
             Path(config_path).unlink()
     
+    def _write_config(self, tmp):
+        config_path = Path(tmp) / "config.json"
+        config_path.write_text(json.dumps({
+            "project_name": "cached-project",
+            "description": "Proyecto cacheado",
+            "project_type": "Python Library"
+        }))
+        return config_path
+    
+    def test_load_project_config_cache_miss_then_hit(self):
+        """La primera carga escribe la caché y la segunda la reutiliza."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch('config_loader._CONFIG_CACHE_DIR', Path(tmp) / "cache"):
+            config_path = self._write_config(tmp)
+            
+            first = load_project_config(config_path)
+            assert len(list((Path(tmp) / "cache").glob("*.pkl"))) == 1
+            
+            with patch.object(ConfigLoader, 'load_config') as load_config:
+                second = load_project_config(config_path)
+                load_config.assert_not_called()
+            
+            assert second == first
+            assert second['NOMBRE_PROYECTO'] == "cached-project"
+    
+    def test_load_project_config_cache_version(self):
+        """Una caché escrita por otra versión del código no se reutiliza."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch('config_loader._CONFIG_CACHE_DIR', Path(tmp) / "cache"):
+            config_path = self._write_config(tmp)
+            load_project_config(config_path)
+            
+            with patch('config_loader._CONFIG_CACHE_VERSION', "otra-version"):
+                load_project_config(config_path)
+            
+            assert len(list((Path(tmp) / "cache").glob("*.pkl"))) == 2
+    
+    def test_load_project_config_corrupt_cache(self):
+        """Una caché que falla al deserializar se ignora y se regenera."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch('config_loader._CONFIG_CACHE_DIR', Path(tmp) / "cache"):
+            config_path = self._write_config(tmp)
+            load_project_config(config_path)
+            cache_file = next((Path(tmp) / "cache").glob("*.pkl"))
+            
+            # Referencia a un módulo inexistente: pickle lanza ModuleNotFoundError
+            cache_file.write_bytes(b"cmodulo_inexistente\nClase\n.")
+            assert load_project_config(config_path)['NOMBRE_PROYECTO'] == "cached-project"
+            
+            # Contenido que no es un dict
+            cache_file.write_bytes(pickle.dumps(["no", "es", "dict"]))
+            assert load_project_config(config_path)['NOMBRE_PROYECTO'] == "cached-project"
+    
+    def test_get_config_template_function(self):
+        """Test de la función get_config_template."""
+        first = get_config_template("Python CLI Tool")
+        second = get_config_template("Python CLI Tool")
+        
+        assert first['project_type'] == "Python CLI Tool"
+        assert first['project_name'] == "mi-proyecto-ejemplo"
+        assert first == second
+        
+        # Cada llamada devuelve una copia independiente
+        first['dependencies']['main'].append("otra>=1.0")
+        assert "otra>=1.0" not in second['dependencies']['main']
+    
+    def test_yaml_loader_on_pypy(self, monkeypatch):
+        """En PyPy se usan el loader y el dumper en Python puro."""
+        import config_loader
+        monkeypatch.setattr(config_loader, "_PYPY", True)
+        
+        assert config_loader._yaml_loader() is yaml.SafeLoader
+        assert config_loader._yaml_dumper() is yaml.SafeDumper
+    
     def test_create_config_template_function(self):
         """Test de la función create_config_template."""
         with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
@@ -486,5 +592,139 @@ class TestConfigLoaderEdgeCases:
         assert "Añadir según necesidades" in project_data['DEPENDENCIAS_OPCIONALES']
 
 
+class TestPeekHeader:
+    """Tests para la lectura parcial de la cabecera de configuración."""
+    
+    def setup_method(self):
+        """Configurar antes de cada test."""
+        self.loader = ConfigLoader()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+    
+    def teardown_method(self):
+        """Limpiar después de cada test."""
+        self.tmp.cleanup()
+    
+    def test_peek_header_yaml_stops_at_nested_block(self):
+        """La cabecera YAML termina en la primera clave que abre un bloque."""
+        config_path = self.dir / "config.yaml"
+        config_path.write_text(
+            "project_name: cabecera\n"
+            "project_type: Python Library\n"
+            "dependencies:\n"
+            "  main:\n"
+            "    - requests\n"
+            "description: despues del bloque\n"
+        )
+        
+        header = self.loader.peek_header(config_path)
+        
+        assert header == {"project_name": "cabecera", "project_type": "Python Library"}
+    
+    def test_peek_header_yaml_max_lines(self):
+        """Solo se leen las primeras max_lines líneas."""
+        config_path = self.dir / "config.yaml"
+        config_path.write_text("".join(f"clave_{i}: {i}\n" for i in range(30)))
+        
+        header = self.loader.peek_header(config_path, max_lines=5)
+        
+        assert list(header) == [f"clave_{i}" for i in range(5)]
+    
+    def test_peek_header_json(self):
+        """JSON se lee completo, sin combinar con los valores por defecto."""
+        config_path = self.dir / "config.json"
+        config_path.write_text(json.dumps({"project_name": "json-header"}))
+        
+        assert self.loader.peek_header(config_path) == {"project_name": "json-header"}
+    
+    def test_peek_header_fallback_to_load_config(self):
+        """Sin cabecera legible se recurre a la carga completa."""
+        config_path = self.dir / "config.yaml"
+        yaml_text = yaml.dump({
+            "dependencies": {"main": ["requests"]},
+            "description": "Proyecto sin cabecera",
+            "project_name": "fallback",
+            "project_type": "Python Library"
+        })
+        assert yaml_text.startswith("dependencies:")
+        config_path.write_text(yaml_text)
+        
+        header = self.loader.peek_header(config_path)
+        
+        assert header['project_name'] == "fallback"
+        assert header['author'] == "Desarrollador"  # valor por defecto del merge
+    
+    def test_peek_header_without_fallback(self):
+        """Con fallback=False una cabecera ilegible devuelve un dict vacío."""
+        config_path = self.dir / "config.yaml"
+        config_path.write_text("project_name: [sin cerrar\n")
+        
+        with patch.object(ConfigLoader, 'load_config') as load_config:
+            assert peek_config_header(config_path, fallback=False) == {}
+            load_config.assert_not_called()
+        
+        with pytest.raises(ValueError):
+            peek_config_header(config_path)
+
+
+class TestJsonCache:
+    """Tests para la caché JSON de archivos YAML."""
+    
+    def _write_yaml(self, path, project_name):
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.dump({
+                "project_name": project_name,
+                "description": "Proyecto con caché",
+                "project_type": "Python Library"
+            }, f)
+    
+    def test_load_config_yaml_no_sibling_cache_by_default(self):
+        """Por defecto load_config no escribe junto al YAML del usuario."""
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = Path(tmp) / "config.yaml"
+            self._write_yaml(yaml_path, "sin-cache")
+            
+            config = ConfigLoader().load_config(yaml_path)
+            
+            assert config['project_name'] == "sin-cache"
+            assert not (Path(tmp) / "config.yaml.json").exists()
+    
+    def test_ensure_json_cache_hit(self):
+        """La segunda lectura sale de la caché JSON."""
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = Path(tmp) / "config.yaml"
+            self._write_yaml(yaml_path, "con-cache")
+            
+            assert ensure_json_cache(yaml_path)['project_name'] == "con-cache"
+            assert (Path(tmp) / "config.yaml.json").exists()
+            
+            with patch('config_loader._load_yaml') as load_yaml:
+                assert ensure_json_cache(yaml_path)['project_name'] == "con-cache"
+                load_yaml.assert_not_called()
+    
+    def test_ensure_json_cache_older_replacement(self):
+        """Un YAML reemplazado por otro con mtime más antiguo invalida la caché."""
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = Path(tmp) / "config.yaml"
+            self._write_yaml(yaml_path, "original")
+            ensure_json_cache(yaml_path)
+            
+            # Simular cp -p / git stash: contenido nuevo con mtime anterior
+            old_mtime = yaml_path.stat().st_mtime_ns - 10**9
+            self._write_yaml(yaml_path, "reemplazado-largo")
+            os.utime(yaml_path, ns=(old_mtime, old_mtime))
+            
+            assert ensure_json_cache(yaml_path)['project_name'] == "reemplazado-largo"
+    
+    def test_ensure_json_cache_corrupt(self):
+        """Una caché corrupta se regenera desde el YAML."""
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = Path(tmp) / "config.yaml"
+            self._write_yaml(yaml_path, "regenerado")
+            (Path(tmp) / "config.yaml.json").write_text("{no es json")
+            
+            assert ensure_json_cache(yaml_path)['project_name'] == "regenerado"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
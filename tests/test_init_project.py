@@ -7,6 +7,7 @@ incluyendo tests de integración y funcionalidad completa.
 
 import pytest
 import tempfile
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -19,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 # Importar el módulo principal
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from init_project import ProjectGenerator
+from init_project import ProjectGenerator, _parse_args
 
 
 class TestProjectGenerator:
@@ -269,6 +270,73 @@ class TestProjectGenerator:
             assert len(commit_calls) > 0
 
 
+class TestParseArgs:
+    """Tests para el parser de argumentos de línea de comandos."""
+    
+    def test_positionals(self):
+        """Nombre y ruta del proyecto como posicionales."""
+        args = _parse_args(["MiProyecto", "/ruta"])
+        assert args.project_name == "MiProyecto"
+        assert args.project_path == "/ruta"
+        assert args.verbose is False
+        assert args.config is None
+    
+    def test_no_args(self):
+        """Sin argumentos todo queda en su valor por defecto."""
+        args = _parse_args([])
+        assert args.project_name is None
+        assert args.project_path is None
+    
+    @pytest.mark.parametrize("argv", [
+        ["--config", "c.json"],
+        ["--config=c.json"],
+        ["--conf", "c.json"],
+        ["-c", "c.json"],
+        ["-cc.json"],
+        ["-c=c.json"],
+    ])
+    def test_value_option_forms(self, argv):
+        """Formas equivalentes de pasar un valor a una opción."""
+        assert _parse_args(argv).config == "c.json"
+    
+    def test_combined_short_options(self):
+        """Opciones cortas combinadas, con valor separado o pegado."""
+        args = _parse_args(["-vc", "c.yaml"])
+        assert args.verbose is True
+        assert args.config == "c.yaml"
+        
+        args = _parse_args(["-vtPython Library"])
+        assert args.verbose is True
+        assert args.create_template == "Python Library"
+    
+    def test_double_dash_ends_options(self):
+        """Tras -- todo es posicional."""
+        args = _parse_args(["-v", "--", "-proyecto"])
+        assert args.verbose is True
+        assert args.project_name == "-proyecto"
+    
+    @pytest.mark.parametrize("argv", [
+        ["--c", "x"],          # prefijo ambiguo (--config / --create-template)
+        ["-x"],                # opción desconocida
+        ["-c"],                # falta el valor
+        ["--verbose=1"],       # valor en una opción sin valor
+        ["a", "b", "c"],       # demasiados posicionales
+    ])
+    def test_errors(self, argv, capsys):
+        """Los errores terminan con código 2 y muestran el uso."""
+        with pytest.raises(SystemExit) as exc:
+            _parse_args(argv)
+        assert exc.value.code == 2
+        assert "uso: init_project.py" in capsys.readouterr().err
+    
+    def test_help(self, capsys):
+        """-h muestra la ayuda completa y sale con código 0."""
+        with pytest.raises(SystemExit) as exc:
+            _parse_args(["-h"])
+        assert exc.value.code == 0
+        assert "Ejemplos de uso" in capsys.readouterr().out
+
+
 class TestProjectGeneratorIntegration:
     """Tests de integración para ProjectGenerator."""
     
@@ -357,6 +425,51 @@ class TestProjectGeneratorIntegration:
             assert "config-test" in readme_content
             assert "Proyecto desde configuración" in readme_content
             assert "Config Test Author" in readme_content
+    
+    def test_generate_project_from_dict(self):
+        """Test de generación de proyecto desde una configuración en memoria."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_data = {
+                "project_name": "dict-test",
+                "description": "Proyecto desde un diccionario",
+                "project_type": "Python CLI Tool",
+                "author": "Dict Test Author",
+                "email": "dict@example.com"
+            }
+            project_path = Path(temp_dir) / "generated_project"
+            
+            self.generator.generate_project_from_dict(config_data, project_path)
+            
+            assert (project_path / "README.md").exists()
+            assert self.generator.project_data['NOMBRE_PROYECTO'] == "dict-test"
+            assert self.generator.project_data['TIPO_PROYECTO'] == "Python CLI Tool"
+            assert not list(Path(temp_dir).glob("*.json"))
+    
+    def test_generate_project_from_dict_invalid(self):
+        """Una configuración en memoria inválida termina con código 1."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(SystemExit) as exc:
+                self.generator.generate_project_from_dict(
+                    {"project_name": "sin-descripcion"}, Path(temp_dir) / "p"
+                )
+            assert exc.value.code == 1
+    
+    def test_generate_project_from_config_accepts_dict(self):
+        """generate_project_from_config acepta también la configuración ya cargada."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_data = {
+                "project_name": "config-dict-test",
+                "description": "Proyecto desde un diccionario",
+                "project_type": "Python Library",
+                "author": "Dict Test Author",
+                "email": "dict@example.com"
+            }
+            project_path = Path(temp_dir) / "generated_project"
+            
+            self.generator.generate_project_from_config(config_data, project_path)
+            
+            assert (project_path / "README.md").exists()
+            assert self.generator.project_data['NOMBRE_PROYECTO'] == "config-dict-test"
 
 
 class TestProjectGeneratorErrorHandling:
@@ -412,10 +525,13 @@ class TestProjectGeneratorErrorHandling:
             mock_run.side_effect = subprocess.CalledProcessError(1, "git")
             
             # No debería lanzar excepción, solo mostrar advertencia
+            cwd = os.getcwd()
             self.generator.initialize_git(project_path)
             
-            # Verificar que se intentó ejecutar git
+            # Verificar que se intentó ejecutar git, sin cambiar el directorio actual
             assert mock_run.called
+            assert mock_run.call_args.kwargs["cwd"] == project_path
+            assert os.getcwd() == cwd
 
 
 class TestProjectGeneratorTemplateProcessing: